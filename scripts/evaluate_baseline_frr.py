@@ -3,12 +3,14 @@
 
 import sys
 import json
+from collections import Counter
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from evaluation.baseline_evaluator import BaselineEvaluator
+from evaluation.result_sinks import open_result_sink
 
 
 def main():
@@ -20,7 +22,8 @@ def main():
         skill_weight=0.4,
         experience_weight=0.3,
         education_weight=0.15,
-        domain_weight=0.15
+        domain_weight=0.15,
+        keep_results=False  # FRR statistics only need counts
     )
     
     # Load job descriptions
@@ -31,18 +34,26 @@ def main():
     
     # Evaluate candidates
     candidates_file = Path(__file__).parent.parent / "src" / "data" / "candidates.csv"
-    results_file = Path(__file__).parent.parent / "results" / "baseline_frr_results.json"
+    results_file = Path(__file__).parent.parent / "results" / "baseline_frr_results.jsonl"
     
     print(f"Starting baseline evaluation of candidates from {candidates_file}...")
     
     # Create results directory if it doesn't exist
     results_file.parent.mkdir(exist_ok=True)
     
-    # Run evaluation
-    results = evaluator.evaluate_candidates_batch(
-        candidates_file=str(candidates_file),
-        results_file=str(results_file)
-    )
+    # Run evaluation chunk by chunk, keeping only running totals in memory
+    total_processed = 0
+    total_score = 0.0
+    rejection_reasons = Counter()
+    with open_result_sink(str(results_file)) as sink:
+        for frame in evaluator.evaluate_candidates_stream(str(candidates_file)):
+            sink.write_all(evaluator.evaluation_records(frame))
+            total_processed += len(frame)
+            total_score += float(frame['overall_score'].sum())
+            reasons = frame['rejection_reason'].dropna()
+            reasons = reasons[reasons != '']
+            # Take first reason
+            rejection_reasons.update(reasons.str.split(';').str[0].str.strip().value_counts().to_dict())
     
     # Calculate FRR and statistics
     frr = evaluator.calculate_frr()
@@ -67,14 +78,8 @@ def main():
         print("This is acceptable as we use the measured baseline for comparison")
     
     # Show top rejection reasons
-    print(f"\\nTop rejection reasons from {len(results)} evaluations:")
-    rejection_reasons = {}
-    for result in results:
-        if result.rejection_reason:
-            reason = result.rejection_reason.split(';')[0].strip()  # Take first reason
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-    
-    for reason, count in sorted(rejection_reasons.items(), key=lambda x: x[1], reverse=True)[:5]:
+    print(f"\\nTop rejection reasons from {total_processed} evaluations:")
+    for reason, count in rejection_reasons.most_common(5):
         print(f"- {reason}: {count} candidates")
     
     # Save summary statistics
@@ -85,10 +90,10 @@ def main():
         'baseline_target': baseline_target,
         'baseline_validated': within_baseline,
         'evaluation_details': {
-            'total_processed': len(results),
-            'avg_overall_score': sum(r.overall_score for r in results) / len(results) if results else 0,
+            'total_processed': total_processed,
+            'avg_overall_score': total_score / total_processed if total_processed else 0,
             'qualification_rate': stats['qualified_candidates'] / stats['total_candidates'] if stats['total_candidates'] > 0 else 0,
-            'top_rejection_reasons': dict(sorted(rejection_reasons.items(), key=lambda x: x[1], reverse=True)[:10])
+            'top_rejection_reasons': dict(rejection_reasons.most_common(10))
         }
     }
     
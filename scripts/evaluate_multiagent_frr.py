@@ -4,6 +4,7 @@
 import asyncio
 import sys
 import json
+from dataclasses import asdict
 from pathlib import Path
 
 # Add src to path
@@ -11,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from evaluation.multiagent_evaluator import MultiAgentEvaluator
 from evaluation.frr_comparison import FRRComparator
+from evaluation.result_sinks import open_result_sink
 
 
 async def main():
@@ -20,7 +22,8 @@ async def main():
     print("Initializing multi-agent evaluation system...")
     evaluator = MultiAgentEvaluator(
         qualification_threshold=0.4,  # Match baseline for fair comparison
-        acceptance_threshold=0.5
+        acceptance_threshold=0.5,
+        keep_results=False  # FRR statistics only need counts
     )
     
     # Load job descriptions
@@ -31,7 +34,7 @@ async def main():
     
     # Evaluate candidates
     candidates_file = Path(__file__).parent.parent / "src" / "data" / "candidates.csv"
-    results_file = Path(__file__).parent.parent / "results" / "multiagent_frr_results.json"
+    results_file = Path(__file__).parent.parent / "results" / "multiagent_frr_results.jsonl"
     
     print(f"Starting multi-agent evaluation of candidates from {candidates_file}...")
     print("This will take several minutes due to LLM API calls...")
@@ -39,12 +42,23 @@ async def main():
     # Create results directory if it doesn't exist
     results_file.parent.mkdir(exist_ok=True)
     
-    # Run evaluation with smaller batch size to avoid API rate limits
-    results = await evaluator.evaluate_candidates_batch(
-        candidates_file=str(candidates_file),
-        results_file=str(results_file),
-        batch_size=5  # Small batch to avoid rate limits
-    )
+    # Run evaluation with smaller batch size to avoid API rate limits,
+    # keeping only running totals in memory
+    total_processed = 0
+    hidden_gems = 0
+    total_screening_score = 0.0
+    total_confidence_score = 0.0
+    with open_result_sink(str(results_file)) as sink:
+        async for batch in evaluator.evaluate_candidates_stream(
+            str(candidates_file),
+            batch_size=5  # Small batch to avoid rate limits
+        ):
+            sink.write_all(asdict(result) for result in batch)
+            total_processed += len(batch)
+            hidden_gems += sum(1 for r in batch if r.hidden_gem_detected)
+            total_screening_score += sum(r.screening_score for r in batch)
+            total_confidence_score += sum(r.confidence_score for r in batch)
+    print(f"Multi-agent evaluation completed: {total_processed} candidates processed")
     
     # Calculate FRR and statistics
     frr = evaluator.calculate_frr()
@@ -58,7 +72,7 @@ async def main():
     print(f"False rejections: {stats['false_rejections']:,}")
     print(f"Multi-Agent System FRR: {frr:.1%}")
     print(f"System accuracy: {stats['accuracy']:.1%}")
-    print(f"Hidden gems detected: {sum(1 for r in results if r.hidden_gem_detected)}")
+    print(f"Hidden gems detected: {hidden_gems}")
     
     # Validate against target
     target_frr = 0.06  # 6% target (50% improvement from 12% baseline)
@@ -73,10 +87,10 @@ async def main():
         'target_frr': target_frr,
         'target_achieved': within_target,
         'evaluation_details': {
-            'total_processed': len(results),
-            'hidden_gems_detected': sum(1 for r in results if r.hidden_gem_detected),
-            'avg_screening_score': sum(r.screening_score for r in results) / len(results) if results else 0,
-            'avg_confidence_score': sum(r.confidence_score for r in results) / len(results) if results else 0
+            'total_processed': total_processed,
+            'hidden_gems_detected': hidden_gems,
+            'avg_screening_score': total_screening_score / total_processed if total_processed else 0,
+            'avg_confidence_score': total_confidence_score / total_processed if total_processed else 0
         }
     }
     
@@ -87,7 +101,7 @@ async def main():
     print(f"Summary statistics saved to: {summary_file}")
     
     # Check for baseline comparison
-    baseline_results_file = Path(__file__).parent.parent / "results" / "baseline_frr_results.json"
+    baseline_results_file = Path(__file__).parent.parent / "results" / "baseline_frr_results.jsonl"
     if baseline_results_file.exists():
         print(f"\\nBaseline results found. Running FRR comparison...")
         
@@ -1,7 +1,16 @@
 """Recruitment agents for the system."""
-from .unified_agent import UnifiedRecruitmentAgent, EvaluationResult
+from .unified_agent import UnifiedRecruitmentAgent, EvaluationResult, BatchItemResult
+from .stage_graph import PipelineStage, StageGraph, StageEvent
+from .triage import CriticTriagePolicy, CLEAR_ACCEPT, CLEAR_REJECT
 
 __all__ = [
     "UnifiedRecruitmentAgent",
-    "EvaluationResult"
-]
\ No newline at end of file
+    "EvaluationResult",
+    "BatchItemResult",
+    "PipelineStage",
+    "StageGraph",
+    "StageEvent",
+    "CriticTriagePolicy",
+    "CLEAR_ACCEPT",
+    "CLEAR_REJECT"
+]
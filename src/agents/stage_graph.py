@@ -0,0 +1,203 @@
+"""Dependency-graph executor for agent pipeline stages."""
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+STAGE_STARTED = "started"
+STAGE_FINISHED = "finished"
+STAGE_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """A named unit of work and the stages whose results it consumes.
+
+    The stage function is called with one keyword argument per dependency,
+    named after the dependency stage and bound to its result.
+    """
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageEvent:
+    """Progress of one pipeline stage.
+
+    ``result`` holds the stage output on ``finished`` events and ``error`` the
+    failure message on ``failed`` events. ``duration`` is in seconds.
+    ``restored`` marks a stage whose result came from a checkpoint.
+    """
+    stage: str
+    status: str
+    timestamp: float
+    duration: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    restored: bool = False
+
+
+StageEventCallback = Callable[[StageEvent], Any]
+
+
+async def emit_stage_event(callback: Optional[StageEventCallback], event: StageEvent) -> None:
+    """Deliver an event to a sync or async callback.
+
+    Callback errors are logged and swallowed so a failing progress consumer
+    never fails the pipeline it is observing.
+    """
+    if callback is None:
+        return
+    try:
+        outcome = callback(event)
+        if inspect.isawaitable(outcome):
+            await outcome
+    except Exception as e:
+        logger.warning(f"Stage event callback failed for {event.stage}: {e}")
+
+
+class StageGraph:
+    """Run pipeline stages concurrently while respecting their dependencies."""
+
+    def __init__(self, stages: List[PipelineStage]):
+        """Build the graph and validate that it is acyclic."""
+        self.stages: Dict[str, PipelineStage] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate pipeline stage: {stage.name}")
+            self.stages[stage.name] = stage
+
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """Order stages so every stage comes after its dependencies."""
+        for stage in self.stages.values():
+            unknown = [dep for dep in stage.depends_on if dep not in self.stages]
+            if unknown:
+                raise ValueError(
+                    f"Stage '{stage.name}' depends on unknown stages: {', '.join(unknown)}"
+                )
+
+        remaining = {name: set(stage.depends_on) for name, stage in self.stages.items()}
+        order = []
+
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(
+                    f"Pipeline stages contain a cycle: {', '.join(sorted(remaining))}"
+                )
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return order
+
+    async def run(
+        self,
+        on_event: Optional[StageEventCallback] = None,
+        completed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute all stages and return their results keyed by stage name.
+
+        Independent stages run concurrently. If any stage fails, the stages
+        still pending are cancelled and the original exception is raised.
+
+        Args:
+            on_event: Optional callback receiving a ``StageEvent`` when each
+                stage starts and when it finishes or fails
+            completed: Results of stages that already ran (e.g. restored from
+                checkpoints). These are not re-run, and stages needed only by
+                them are skipped and left out of the returned results.
+        """
+        completed = {
+            name: result for name, result in (completed or {}).items()
+            if name in self.stages
+        }
+        needed = self._stages_to_run(completed)
+
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in self.order:
+            if name in completed:
+                tasks[name] = asyncio.ensure_future(
+                    self._restore_stage(name, completed[name], on_event)
+                )
+            elif name in needed:
+                tasks[name] = asyncio.ensure_future(
+                    self._run_stage(self.stages[name], tasks, on_event)
+                )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    def _stages_to_run(self, completed: Dict[str, Any]) -> Set[str]:
+        """Stages that must run: final stages, and dependencies of stages that run."""
+        dependents: Dict[str, List[str]] = {name: [] for name in self.stages}
+        for stage in self.stages.values():
+            for dep in stage.depends_on:
+                dependents[dep].append(stage.name)
+
+        needed: Set[str] = set()
+        for name in reversed(self.order):
+            if name in completed:
+                continue
+            if not dependents[name] or any(d in needed for d in dependents[name]):
+                needed.add(name)
+        return needed
+
+    async def _restore_stage(
+        self,
+        name: str,
+        result: Any,
+        on_event: Optional[StageEventCallback] = None
+    ) -> Any:
+        """Report a previously completed stage and return its result."""
+        logger.debug(f"Restored pipeline stage: {name}")
+        await emit_stage_event(on_event, StageEvent(
+            name, STAGE_FINISHED, time.time(), duration=0.0, result=result, restored=True
+        ))
+        return result
+
+    async def _run_stage(
+        self,
+        stage: PipelineStage,
+        tasks: Dict[str, asyncio.Task],
+        on_event: Optional[StageEventCallback] = None
+    ) -> Any:
+        """Wait for a stage's dependencies, then run it."""
+        inputs = {}
+        for dep in stage.depends_on:
+            inputs[dep] = await tasks[dep]
+
+        logger.debug(f"Running pipeline stage: {stage.name}")
+        started = time.monotonic()
+        await emit_stage_event(on_event, StageEvent(stage.name, STAGE_STARTED, time.time()))
+
+        try:
+            result = await stage.func(**inputs)
+        except Exception as e:
+            await emit_stage_event(on_event, StageEvent(
+                stage.name, STAGE_FAILED, time.time(),
+                duration=time.monotonic() - started, error=str(e)
+            ))
+            raise
+
+        await emit_stage_event(on_event, StageEvent(
+            stage.name, STAGE_FINISHED, time.time(),
+            duration=time.monotonic() - started, result=result
+        ))
+        return result
@@ -0,0 +1,76 @@
+"""Rule-based triage deciding when the Critic LLM review can be skipped."""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+CLEAR_ACCEPT = "clear_accept"
+CLEAR_REJECT = "clear_reject"
+
+# Confidence of matches found directly rather than through the skill ontology
+DIRECT_MATCH_CONFIDENCE = 1.0
+
+
+@dataclass
+class CriticTriagePolicy:
+    """Thresholds for classifying a screening result without the Critic.
+
+    A candidate is a clear accept when the screening score and skill coverage
+    are both high, experience meets the minimum, and every match is direct.
+    A candidate is a clear reject when both are low and the ontology found no
+    related skills, since those are the transferable-skill cases the Critic
+    exists to catch. Everything in between goes to the LLM.
+    """
+    enabled: bool = True
+    accept_score: float = 0.85
+    accept_coverage: float = 0.9
+    reject_score: float = 0.15
+    reject_coverage: float = 0.1
+    bypass_confidence: float = 0.9
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "CriticTriagePolicy":
+        """Create a policy from application config."""
+        return cls(
+            enabled=config.get("critic_triage_enabled", True),
+            accept_score=config.get("critic_bypass_accept_score", 0.85),
+            accept_coverage=config.get("critic_bypass_accept_coverage", 0.9),
+            reject_score=config.get("critic_bypass_reject_score", 0.15),
+            reject_coverage=config.get("critic_bypass_reject_coverage", 0.1),
+            bypass_confidence=config.get("critic_bypass_confidence", 0.9)
+        )
+
+    def decide(self, screening_result: Dict[str, Any]) -> Optional[str]:
+        """Classify a screening result.
+
+        Args:
+            screening_result: Output of semantic screening
+
+        Returns:
+            CLEAR_ACCEPT or CLEAR_REJECT to bypass the Critic, None to run it
+        """
+        if not self.enabled:
+            return None
+
+        score = screening_result["score"]
+        coverage = screening_result.get("skill_coverage", 0.0)
+        matches = screening_result.get("matched_skills", [])
+        ontology_matches = sum(
+            1 for match in matches
+            if match.get("confidence", DIRECT_MATCH_CONFIDENCE) < DIRECT_MATCH_CONFIDENCE
+        )
+
+        if (
+            score >= self.accept_score
+            and coverage >= self.accept_coverage
+            and screening_result.get("experience_match", False)
+            and ontology_matches == 0
+        ):
+            return CLEAR_ACCEPT
+
+        if (
+            score <= self.reject_score
+            and coverage <= self.reject_coverage
+            and ontology_matches == 0
+        ):
+            return CLEAR_REJECT
+
+        return None
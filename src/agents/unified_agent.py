@@ -1,8 +1,10 @@
 """Unified recruitment agent combining all agent functionalities."""
+import asyncio
 import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+import time
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Any, Optional, Set, Tuple, Union
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from uuid import uuid4
 import re
@@ -12,11 +14,56 @@ import numpy as np
 
 from services.vector_store import VectorStoreService, VectorSearchResult
 from services.skill_ontology import SkillOntologyService
+from services.ontology_store import get_ontology_store
+from services.semantic_matcher import SemanticSkillMatcher
 from services.redis_service import RedisService
+from services.content_cache import TTLCache, content_hash
+from services.resume_cache import ResumeCache
+from services.rate_limiter import GovernedOpenAI, LLMGovernor
+from services.embedding_cache import (
+    EmbeddingCache,
+    MemoryEmbeddingBackend,
+    RedisEmbeddingBackend
+)
 from models.database import Job, Resume, Candidate, ScreeningResult, AuditLog
+from .stage_graph import (
+    PipelineStage,
+    StageGraph,
+    StageEvent,
+    StageEventCallback,
+    STAGE_STARTED,
+    STAGE_FINISHED,
+    emit_stage_event
+)
+from .triage import CriticTriagePolicy
 
 logger = logging.getLogger(__name__)
 
+# Screening confidence of a skill matched through a direct ontology relationship
+RELATED_SKILL_CONFIDENCE = 0.7
+
+# Bump when a change to the agent stages invalidates checkpointed stage outputs
+PIPELINE_VERSION = "2"
+
+# Supervisor prompt decomposing a job description into requirements
+JOB_REQUIREMENTS_PROMPT = """
+Analyze this job description and extract structured requirements:
+
+{job_description}
+
+Return a JSON object with:
+- technical_skills: list of required technical skills
+- experience_years: object with minimum and preferred years
+- education: object with level and fields
+- soft_skills: list of soft skills
+- domain: list of domain areas
+- nice_to_have: list of optional skills
+"""
+
+# Bump when the model, defaults or normalization of decomposed requirements
+# change; prompt changes are covered by job_requirements_version on their own
+JOB_REQUIREMENTS_VERSION = "1"
+
 
 @dataclass
 class EvaluationResult:
@@ -33,6 +80,29 @@ class EvaluationResult:
     workflow_id: str
     review_type: str = "none"
     review_priority: str = "normal"
+    critic_bypassed: bool = False
+    triage_decision: Optional[str] = None
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one resume in a batch evaluation."""
+    candidate_id: str
+    result: Optional[EvaluationResult] = None
+    error: Optional[str] = None
+
+
+ResumeStream = Union[Iterable[Tuple[str, str]], AsyncIterable[Tuple[str, str]]]
+
+
+async def _iterate_resumes(resumes: ResumeStream) -> AsyncIterator[Tuple[str, str]]:
+    """Iterate (candidate_id, resume_text) pairs from a sync or async source."""
+    if hasattr(resumes, "__aiter__"):
+        async for item in resumes:
+            yield item
+    else:
+        for item in resumes:
+            yield item
 
 
 class UnifiedRecruitmentAgent:
@@ -41,13 +111,52 @@ class UnifiedRecruitmentAgent:
     def __init__(self, config: Dict[str, Any], llm_client: AsyncOpenAI):
         """Initialize the unified agent."""
         self.config = config
-        self.llm = llm_client
+        
+        # All LLM and embedding calls share one rate/concurrency governor
+        if isinstance(llm_client, GovernedOpenAI):
+            self.llm = llm_client
+        else:
+            self.llm = GovernedOpenAI(llm_client, LLMGovernor.from_config(config))
+        self.governor = self.llm.governor
         self.hitl_threshold = config.get("hitl_confidence_threshold", 0.85)
+        self.batch_concurrency = config.get("batch_concurrency", 8)
+        self.critic_triage = CriticTriagePolicy.from_config(config)
+        self.semantic_matcher = (
+            SemanticSkillMatcher(config.get("semantic_match_threshold", 0.8))
+            if config.get("semantic_matching_enabled", True) else None
+        )
         
         # Initialize services
-        self.vector_store = VectorStoreService(config, llm_client)
-        self.skill_service = SkillOntologyService()
         self.redis_service = RedisService(config)
+        self.resume_cache = ResumeCache(self.redis_service, config)
+        self.embedding_cache = EmbeddingCache(
+            [
+                MemoryEmbeddingBackend(
+                    max_size=config.get("embedding_cache_size", 10000),
+                    dtype=config.get("embedding_cache_dtype", "float32")
+                ),
+                RedisEmbeddingBackend(
+                    self.redis_service,
+                    ttl=config.get("embedding_cache_ttl", 86400)
+                )
+            ],
+            model=config.get("embedding_model", "text-embedding-3-small")
+        )
+        self.vector_store = VectorStoreService(
+            config, self.llm, embedding_cache=self.embedding_cache
+        )
+        # One ontology per process, shared by every agent and reloaded when its file changes
+        self.skill_service = SkillOntologyService(get_ontology_store(
+            config.get("skill_ontology_path"),
+            check_interval=config.get("skill_ontology_reload_interval", 5.0)
+        ))
+        
+        # Structured job requirements keyed by job description content hash
+        self.job_requirements_ttl = config.get("job_requirements_cache_ttl", 86400)
+        self.job_requirements_cache = TTLCache(
+            max_size=config.get("job_requirements_cache_size", 256),
+            ttl=self.job_requirements_ttl
+        )
     
     async def initialize(self) -> None:
         """Initialize all services."""
@@ -60,30 +169,55 @@ class UnifiedRecruitmentAgent:
         job_description: str,
         resume_text: str,
         job_id: str,
-        candidate_id: str
+        candidate_id: str,
+        job_requirements: Optional[Dict[str, Any]] = None,
+        on_event: Optional[StageEventCallback] = None,
+        workflow_id: Optional[str] = None
     ) -> EvaluationResult:
-        """Process a job application through all agent stages."""
-        # Initialize workflow
-        workflow_id = await self._init_workflow_state(job_id, candidate_id)
+        """Process a job application through all agent stages.
+        
+        Pass ``job_requirements`` to reuse an existing decomposition of
+        ``job_description`` instead of running the Supervisor stage. Pass
+        ``on_event`` to receive a ``StageEvent`` as each stage starts and
+        finishes; the last one is the ``evaluation`` stage carrying the
+        ``EvaluationResult``. Pass the ``workflow_id`` of an interrupted run
+        to resume it from its checkpointed stages.
+        """
+        # Resume from checkpoints, or initialize a new workflow
+        checkpoints: Dict[str, Any] = {}
+        if workflow_id is not None:
+            checkpoints = await self.redis_service.get_stage_checkpoints(workflow_id)
+        
+        if checkpoints:
+            logger.info(f"Resuming workflow {workflow_id} after stages: {', '.join(sorted(checkpoints))}")
+            await self.redis_service.set_workflow_state(workflow_id, {
+                "job_id": job_id,
+                "candidate_id": candidate_id,
+                "status": "resumed",
+                "restored_stages": sorted(checkpoints),
+                "resumed_at": datetime.now(timezone.utc).isoformat()
+            }, stage="resumed")
+        else:
+            workflow_id = await self._init_workflow_state(job_id, candidate_id, workflow_id)
+        
+        async def on_stage_event(event: StageEvent) -> None:
+            # Stage boundaries flush any write-behind workflow state
+            if event.status == STAGE_FINISHED:
+                await self.redis_service.flush_workflow_state(workflow_id)
+            await emit_stage_event(on_event, event)
         
         try:
-            # Supervisor: Decompose job requirements
-            job_requirements = await self._decompose_job_requirements(
-                job_description, workflow_id
-            )
+            # Supervisor, Sourcing, Screening and Critic run as a stage graph so
+            # job decomposition, resume parsing and resume embedding overlap
+            stage_results = await self._build_pipeline(
+                job_description, resume_text, workflow_id, job_requirements
+            ).run(on_stage_event, completed=checkpoints)
             
-            # Sourcing: Parse resume
-            parsed_resume = await self._parse_resume(resume_text, workflow_id)
+            screening_result = stage_results["screening"]
+            critic_result = stage_results["critic"]
             
-            # Screening: Semantic matching
-            screening_result = await self._semantic_screening(
-                job_requirements, parsed_resume, workflow_id
-            )
-            
-            # Critic: Review and bias detection
-            critic_result = await self._critical_review(
-                screening_result, parsed_resume, job_requirements, workflow_id
-            )
+            started = time.monotonic()
+            await emit_stage_event(on_event, StageEvent("evaluation", STAGE_STARTED, time.time()))
             
             # Calculate confidence and determine if HITL needed
             confidence_metrics = self._calculate_confidence(
@@ -100,8 +234,11 @@ class UnifiedRecruitmentAgent:
                 workflow_id, job_id, candidate_id,
                 screening_result, critic_result, confidence_metrics
             )
+            await self.redis_service.flush_workflow_state(workflow_id)
+            # Completed runs are never resumed; re-screening starts afresh
+            await self.redis_service.clear_stage_checkpoints(workflow_id)
             
-            return EvaluationResult(
+            result = EvaluationResult(
                 screening_score=screening_result["score"],
                 critic_score=critic_result["score"],
                 confidence=confidence_metrics["confidence"],
@@ -113,16 +250,232 @@ class UnifiedRecruitmentAgent:
                 transferable_skills=critic_result.get("transferable_skills", []),
                 workflow_id=workflow_id,
                 review_type=confidence_metrics.get("review_type", "none"),
-                review_priority=confidence_metrics.get("review_priority", "normal")
+                review_priority=confidence_metrics.get("review_priority", "normal"),
+                critic_bypassed=critic_result.get("critic_bypassed", False),
+                triage_decision=critic_result.get("triage_decision")
             )
             
+            await emit_stage_event(on_event, StageEvent(
+                "evaluation", STAGE_FINISHED, time.time(),
+                duration=time.monotonic() - started, result=result
+            ))
+            return result
         except Exception as e:
             logger.error(f"Error in workflow {workflow_id}: {e}")
+            await self._flush_after_failure(workflow_id)
             raise
     
-    async def _init_workflow_state(self, job_id: str, candidate_id: str) -> str:
+    async def stream_job_application(
+        self,
+        job_description: str,
+        resume_text: str,
+        job_id: str,
+        candidate_id: str
+    ) -> AsyncIterator[StageEvent]:
+        """Process a job application, yielding stage events as they happen.
+        
+        The final event is the finished ``evaluation`` stage whose result is
+        the ``EvaluationResult``. If the pipeline fails, the events emitted so
+        far are yielded and the error is then raised.
+        """
+        events: "asyncio.Queue[Optional[StageEvent]]" = asyncio.Queue()
+        
+        async def run() -> EvaluationResult:
+            try:
+                return await self.process_job_application(
+                    job_description, resume_text, job_id, candidate_id,
+                    on_event=events.put_nowait
+                )
+            finally:
+                events.put_nowait(None)
+        
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            # Surface pipeline failures to the consumer
+            await task
+        finally:
+            task.cancel()
+    
+    async def process_job_applications_batch(
+        self,
+        job_description: str,
+        resumes: ResumeStream,
+        job_id: str,
+        max_concurrency: Optional[int] = None
+    ) -> AsyncIterator[BatchItemResult]:
+        """Evaluate many resumes against one job, yielding results as they finish.
+        
+        The job is decomposed once and shared by every application. At most
+        ``max_concurrency`` applications (default ``batch_concurrency``) run at
+        a time, and resumes are pulled from ``resumes`` only as slots free up.
+        A failing application is reported on its ``BatchItemResult`` instead
+        of stopping the batch. Each application's workflow id is derived from
+        the job and resume, so re-running a batch after a crash resumes every
+        application from its checkpoints instead of repeating finished stages.
+        
+        Args:
+            job_description: Job description shared by all applications
+            resumes: Sync or async iterable of (candidate_id, resume_text) pairs
+            job_id: Job identifier
+            max_concurrency: Maximum number of applications in flight
+            
+        Yields:
+            BatchItemResult for each resume, in completion order
+        """
+        limit = max(1, max_concurrency or self.batch_concurrency)
+        batch_id = f"batch_{uuid4().hex[:8]}"
+        requirements = await self._get_job_requirements(job_description, batch_id)
+        
+        async def evaluate(candidate_id: str, resume_text: str) -> BatchItemResult:
+            try:
+                result = await self.process_job_application(
+                    job_description, resume_text, job_id, candidate_id,
+                    job_requirements=requirements,
+                    workflow_id=self.application_workflow_id(
+                        job_id, candidate_id, job_description, resume_text
+                    )
+                )
+                return BatchItemResult(candidate_id=candidate_id, result=result)
+            except Exception as e:
+                logger.error(f"Batch {batch_id} failed for candidate {candidate_id}: {e}")
+                return BatchItemResult(candidate_id=candidate_id, error=str(e))
+        
+        pending = set()
+        try:
+            async for candidate_id, resume_text in _iterate_resumes(resumes):
+                if len(pending) >= limit:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.ensure_future(evaluate(candidate_id, resume_text)))
+            
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # Consumer stopped early or the resume source failed
+            for task in pending:
+                task.cancel()
+    
+    def pipeline_version(self) -> str:
+        """Version of everything checkpointed stage outputs depend on.
+        
+        Covers the agent stages, the loaded skill ontology and the settings
+        shaping screening and critic outputs, so changing any of them starts
+        applications afresh instead of resuming stale checkpoints.
+        """
+        settings = {
+            "pipeline": PIPELINE_VERSION,
+            "job_requirements": self.job_requirements_version(),
+            "ontology": str(self.skill_service.ontology.version),
+            "semantic_match_threshold": (
+                self.semantic_matcher.threshold if self.semantic_matcher else None
+            ),
+            "critic_triage": asdict(self.critic_triage)
+        }
+        return content_hash(json.dumps(settings, sort_keys=True))[:12]
+    
+    def application_workflow_id(
+        self,
+        job_id: str,
+        candidate_id: str,
+        job_description: str,
+        resume_text: str
+    ) -> str:
+        """Deterministic workflow id for an application, used to resume it after a crash."""
+        key = content_hash(
+            f"{self.pipeline_version()} {job_id} {candidate_id} "
+            f"{content_hash(job_description)} {content_hash(resume_text)}"
+        )
+        return f"wf_{key[:16]}"
+    
+    def _build_pipeline(
+        self,
+        job_description: str,
+        resume_text: str,
+        workflow_id: str,
+        shared_requirements: Optional[Dict[str, Any]] = None
+    ) -> StageGraph:
+        """Build the dependency graph of agent stages for one application."""
+        async def job_requirements() -> Dict[str, Any]:
+            if shared_requirements is not None:
+                return shared_requirements
+            return await self._get_job_requirements(job_description, workflow_id)
+        
+        async def parsed_resume() -> Dict[str, Any]:
+            return await self._parse_resume(resume_text, workflow_id)
+        
+        async def resume_embedding() -> List[float]:
+            return await self.vector_store.create_embedding(resume_text)
+        
+        async def screening(
+            job_requirements: Dict[str, Any],
+            parsed_resume: Dict[str, Any],
+            resume_embedding: List[float]
+        ) -> Dict[str, Any]:
+            return await self._semantic_screening(
+                job_requirements,
+                {**parsed_resume, "resume_embedding": resume_embedding},
+                workflow_id
+            )
+        
+        async def critic(
+            job_requirements: Dict[str, Any],
+            parsed_resume: Dict[str, Any],
+            screening: Dict[str, Any]
+        ) -> Dict[str, Any]:
+            return await self._critical_review(
+                screening, parsed_resume, job_requirements, workflow_id
+            )
+        
+        def checkpointed(name: str, func: Callable[..., Awaitable[Any]]):
+            async def run(**inputs: Any) -> Any:
+                result = await func(**inputs)
+                await self.redis_service.save_stage_checkpoint(workflow_id, name, result)
+                return result
+            return run
+        
+        # Job requirements and resume embeddings are already content-addressed
+        # in the caches, so only the per-application stages are checkpointed
+        return StageGraph([
+            PipelineStage("job_requirements", job_requirements),
+            PipelineStage("parsed_resume", checkpointed("parsed_resume", parsed_resume)),
+            PipelineStage("resume_embedding", resume_embedding),
+            PipelineStage(
+                "screening", checkpointed("screening", screening),
+                depends_on=("job_requirements", "parsed_resume", "resume_embedding")
+            ),
+            PipelineStage(
+                "critic", checkpointed("critic", critic),
+                depends_on=("job_requirements", "parsed_resume", "screening")
+            ),
+        ])
+    
+    async def _flush_after_failure(self, workflow_id: str) -> None:
+        """Persist buffered state of a failed workflow without masking its error."""
+        try:
+            await self.redis_service.flush_workflow_state(workflow_id)
+        except Exception as e:
+            logger.error(f"Failed to flush state for workflow {workflow_id}: {e}")
+    
+    async def _init_workflow_state(
+        self,
+        job_id: str,
+        candidate_id: str,
+        workflow_id: Optional[str] = None
+    ) -> str:
         """Initialize workflow state in Redis."""
-        workflow_id = f"wf_{uuid4().hex[:8]}"
+        workflow_id = workflow_id or f"wf_{uuid4().hex[:8]}"
         
         state = {
             "job_id": job_id,
@@ -131,28 +484,71 @@ class UnifiedRecruitmentAgent:
             "started_at": datetime.now(timezone.utc).isoformat()
         }
         
-        await self.redis_service.set_workflow_state(workflow_id, state)
+        await self.redis_service.set_workflow_state(workflow_id, state, stage="started")
         return workflow_id
     
-    async def _decompose_job_requirements(
+    async def _get_job_requirements(
         self,
         job_description: str,
         workflow_id: str
     ) -> Dict[str, Any]:
-        """Supervisor: Decompose job into structured requirements."""
-        prompt = f"""
-        Analyze this job description and extract structured requirements:
-        
-        {job_description}
+        """Supervisor: Load job requirements from cache, decomposing on a miss."""
+        job_hash = self.job_requirements_key(job_description)
+        
+        requirements = self.job_requirements_cache.get(job_hash)
+        if requirements is None:
+            requirements = await self.redis_service.get_cached_job_requirements(job_hash)
+            if requirements is not None:
+                self.job_requirements_cache.set(job_hash, requirements)
+        
+        if requirements is not None:
+            await self.redis_service.set_workflow_state(workflow_id, {
+                "status": "requirements_decomposed",
+                "requirements_hash": job_hash,
+                "cache_hit": True
+            }, stage="job_requirements")
+            return requirements
+        
+        requirements = await self._decompose_job_requirements(job_description, workflow_id)
+        
+        self.job_requirements_cache.set(job_hash, requirements)
+        await self.redis_service.cache_job_requirements(
+            job_hash, requirements, ttl=self.job_requirements_ttl
+        )
+        return requirements
+    
+    def job_requirements_version(self) -> str:
+        """Version of everything cached job requirements depend on.
         
-        Return a JSON object with:
-        - technical_skills: list of required technical skills
-        - experience_years: object with minimum and preferred years
-        - education: object with level and fields
-        - soft_skills: list of soft skills
-        - domain: list of domain areas
-        - nice_to_have: list of optional skills
+        Covers the Supervisor prompt and output handling, the ontology that
+        normalizes skills and the model embedding them, so changing any of
+        them decomposes jobs afresh instead of serving stale cached entries.
         """
+        settings = {
+            "requirements": JOB_REQUIREMENTS_VERSION,
+            "prompt": JOB_REQUIREMENTS_PROMPT,
+            "ontology": str(self.skill_service.ontology.version),
+            "embedding_model": self.config.get("embedding_model", "text-embedding-3-small")
+        }
+        return content_hash(json.dumps(settings, sort_keys=True))[:12]
+    
+    def job_requirements_key(self, job_description: str) -> str:
+        """Cache key of a job description's requirements under the current version."""
+        return f"{self.job_requirements_version()}:{content_hash(job_description)}"
+    
+    async def invalidate_job_requirements(self, job_description: str) -> None:
+        """Drop cached requirements so the next screening re-runs the Supervisor."""
+        job_hash = self.job_requirements_key(job_description)
+        self.job_requirements_cache.delete(job_hash)
+        await self.redis_service.invalidate_job_requirements(job_hash)
+    
+    async def _decompose_job_requirements(
+        self,
+        job_description: str,
+        workflow_id: str
+    ) -> Dict[str, Any]:
+        """Supervisor: Decompose job into structured requirements."""
+        prompt = JOB_REQUIREMENTS_PROMPT.format(job_description=job_description)
         
         response = await self.llm.chat.completions.create(
             model="gpt-4o-mini",
@@ -180,17 +576,16 @@ class UnifiedRecruitmentAgent:
             skill.lower() for skill in requirements.get("soft_skills", [])
         ]
         
-        # Generate embeddings for skills
-        requirements["skill_embeddings"] = {}
-        for skill in requirements["technical_skills"]:
-            embedding = await self.vector_store.create_embedding(skill)
-            requirements["skill_embeddings"][skill] = embedding
+        # Generate embeddings for all skills in one batched request
+        skills = requirements["technical_skills"]
+        embeddings = await self.vector_store.create_embeddings(skills)
+        requirements["skill_embeddings"] = dict(zip(skills, embeddings))
         
         # Update workflow state
         await self.redis_service.set_workflow_state(workflow_id, {
             "status": "requirements_decomposed",
             "requirements": requirements
-        })
+        }, stage="job_requirements")
         
         return requirements
     
@@ -200,6 +595,15 @@ class UnifiedRecruitmentAgent:
         workflow_id: str
     ) -> Dict[str, Any]:
         """Sourcing: Parse resume into structured format."""
+        cached = await self.resume_cache.get_parsed(resume_text)
+        if cached is not None:
+            await self.redis_service.set_workflow_state(workflow_id, {
+                "status": "resume_parsed",
+                "resume_key": self.resume_cache.parsed_key(resume_text),
+                "cache_hit": True
+            }, stage="parsed_resume")
+            return cached
+        
         prompt = f"""
         Extract structured information from this resume:
         
@@ -236,15 +640,13 @@ class UnifiedRecruitmentAgent:
         
         parsed["total_experience_years"] = total_years
         
-        # Generate resume embedding
-        resume_embedding = await self.vector_store.create_embedding(resume_text)
-        parsed["resume_embedding"] = resume_embedding
+        await self.resume_cache.set_parsed(resume_text, parsed)
         
         # Update workflow state
         await self.redis_service.set_workflow_state(workflow_id, {
             "status": "resume_parsed",
             "parsed_resume": parsed
-        })
+        }, stage="parsed_resume")
         
         return parsed
     
@@ -270,18 +672,32 @@ class UnifiedRecruitmentAgent:
                 "confidence": 1.0
             })
         
-        # Check for related skills using ontology
+        # Check for related skills through the ontology's skill graph
+        closest = self.skill_service.closest_related_skills(missing_skills, candidate_skills)
         for missing in missing_skills[:]:
-            related = self.skill_service.get_related_skills(missing)
-            for related_skill in related:
-                if related_skill.lower() in candidate_skills:
-                    matched_skills.append({
-                        "required": missing,
-                        "found": related_skill.lower(),
-                        "confidence": 0.7
-                    })
-                    missing_skills.remove(missing)
-                    break
+            if missing in closest:
+                found, proximity = closest[missing]
+                matched_skills.append({
+                    "required": missing,
+                    "found": found,
+                    "confidence": RELATED_SKILL_CONFIDENCE * proximity
+                })
+                missing_skills.remove(missing)
+        
+        # Match what is still missing by skill embedding similarity
+        semantic_credit = 0.0
+        semantic_matches = await self._semantic_skill_matches(
+            job_requirements, missing_skills, candidate_skills
+        ) if missing_skills else []
+        for required, found, similarity in semantic_matches:
+            confidence = RELATED_SKILL_CONFIDENCE * similarity
+            matched_skills.append({
+                "required": required,
+                "found": found,
+                "confidence": confidence
+            })
+            missing_skills.remove(required)
+            semantic_credit += confidence
         
         # Experience matching
         min_exp = job_requirements.get("experience_years", {}).get("minimum", 0)
@@ -293,6 +709,8 @@ class UnifiedRecruitmentAgent:
             list(required_skills),
             list(candidate_skills)
         )
+        # Embedding matches are unknown to the ontology's similarity
+        skill_score = min(1.0, skill_score + semantic_credit / max(len(required_skills), 1))
         
         exp_score = min(1.0, candidate_exp / max(min_exp, 1))
         overall_score = (skill_score * 0.7 + exp_score * 0.3)
@@ -309,10 +727,31 @@ class UnifiedRecruitmentAgent:
         await self.redis_service.set_workflow_state(workflow_id, {
             "status": "screening_completed",
             "screening_result": result
-        })
+        }, stage="screening")
         
         return result
     
+    async def _semantic_skill_matches(
+        self,
+        job_requirements: Dict[str, Any],
+        missing_skills: List[str],
+        candidate_skills: Set[str]
+    ) -> List[Tuple[str, str, float]]:
+        """Pair missing job skills with the candidate's other skills by embedding similarity."""
+        if self.semantic_matcher is None:
+            return []
+        
+        skill_embeddings = job_requirements.get("skill_embeddings", {})
+        required = {
+            skill: skill_embeddings[skill] for skill in missing_skills if skill in skill_embeddings
+        }
+        others = sorted(candidate_skills - set(job_requirements.get("technical_skills", [])))
+        if not required or not others:
+            return []
+        
+        embeddings = await self.vector_store.create_embeddings(others)
+        return self.semantic_matcher.match(required, dict(zip(others, embeddings)))
+    
     async def _critical_review(
         self,
         screening_result: Dict[str, Any],
@@ -321,6 +760,13 @@ class UnifiedRecruitmentAgent:
         workflow_id: str
     ) -> Dict[str, Any]:
         """Critic: Review screening with bias detection."""
+        # Clear-cut candidates skip the LLM review
+        triage_decision = self.critic_triage.decide(screening_result)
+        if triage_decision is not None:
+            return await self._bypass_critical_review(
+                screening_result, triage_decision, workflow_id
+            )
+        
         prompt = f"""
         Review this candidate evaluation for potential biases and hidden qualities:
         
@@ -369,7 +815,34 @@ class UnifiedRecruitmentAgent:
         await self.redis_service.set_workflow_state(workflow_id, {
             "status": "critic_review_completed",
             "critic_result": critic_result
-        })
+        }, stage="critic")
+        
+        return critic_result
+    
+    async def _bypass_critical_review(
+        self,
+        screening_result: Dict[str, Any],
+        triage_decision: str,
+        workflow_id: str
+    ) -> Dict[str, Any]:
+        """Critic: Accept the screening score for a candidate triaged as clear-cut."""
+        critic_result = {
+            "score": screening_result["score"],
+            "confidence_in_assessment": self.critic_triage.bypass_confidence,
+            "bias_flags": [],
+            "hidden_gem_indicators": [],
+            "transferable_skills": [],
+            "reasoning": f"Critic review skipped by triage ({triage_decision})",
+            "hidden_gem": False,
+            "critic_bypassed": True,
+            "triage_decision": triage_decision
+        }
+        
+        # Update workflow state
+        await self.redis_service.set_workflow_state(workflow_id, {
+            "status": "critic_review_bypassed",
+            "critic_result": critic_result
+        }, stage="critic")
         
         return critic_result
     
@@ -466,6 +939,8 @@ class UnifiedRecruitmentAgent:
         """Data-Steward: Log evaluation for audit."""
         # Log to Redis metrics
         await self.redis_service.increment_metric("evaluations_completed")
+        if critic_result.get("critic_bypassed", False):
+            await self.redis_service.increment_metric("critic_reviews_bypassed")
         
         if confidence_metrics["needs_review"]:
             await self.redis_service.increment_metric("evaluations_needing_review")
@@ -495,8 +970,10 @@ class UnifiedRecruitmentAgent:
                 "confidence": confidence_metrics["confidence"]
             },
             "needs_review": confidence_metrics["needs_review"],
+            "critic_bypassed": critic_result.get("critic_bypassed", False),
+            "triage_decision": critic_result.get("triage_decision"),
             "completed_at": datetime.now(timezone.utc).isoformat()
-        })
+        }, stage="completed")
     
     def _parse_duration(self, duration_str: str) -> float:
         """Parse duration string to years."""
@@ -21,6 +21,13 @@ def get_config() -> Dict[str, Any]:
         "redis_host": os.getenv("REDIS_HOST", "localhost"),
         "redis_port": int(os.getenv("REDIS_PORT", "6379")),
         "redis_db": int(os.getenv("REDIS_DB", "0")),
+        "workflow_write_behind": os.getenv("WORKFLOW_WRITE_BEHIND", "false").lower() == "true",
+        "workflow_checkpoint_ttl": int(os.getenv("WORKFLOW_CHECKPOINT_TTL", "86400")),
+        "evaluation_queue_visibility_timeout": int(os.getenv("EVALUATION_QUEUE_VISIBILITY_TIMEOUT", "300")),
+        "evaluation_queue_max_attempts": int(os.getenv("EVALUATION_QUEUE_MAX_ATTEMPTS", "3")),
+        "worker_processes": int(os.getenv("WORKER_PROCESSES", "0")),  # 0 = one per CPU core
+        "worker_batch_size": int(os.getenv("WORKER_BATCH_SIZE", "8")),
+        "worker_poll_interval": float(os.getenv("WORKER_POLL_INTERVAL", "1.0")),
         
         # Milvus
         "milvus_lite_file": os.getenv("MILVUS_LITE_FILE", "./milvus_lite.db"),
@@ -28,8 +35,30 @@ def get_config() -> Dict[str, Any]:
         
         # Agent Configuration
         "hitl_confidence_threshold": float(os.getenv("HITL_CONFIDENCE_THRESHOLD", "0.85")),
+        "batch_concurrency": int(os.getenv("BATCH_CONCURRENCY", "8")),
+        "llm_requests_per_minute": int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500")),
+        "llm_tokens_per_minute": int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000")),
+        "llm_initial_concurrency": int(os.getenv("LLM_INITIAL_CONCURRENCY", "8")),
+        "llm_max_concurrency": int(os.getenv("LLM_MAX_CONCURRENCY", "64")),
+        "llm_max_retries": int(os.getenv("LLM_MAX_RETRIES", "5")),
+        "semantic_matching_enabled": os.getenv("SEMANTIC_MATCHING_ENABLED", "true").lower() == "true",
+        "semantic_match_threshold": float(os.getenv("SEMANTIC_MATCH_THRESHOLD", "0.8")),
+        "critic_triage_enabled": os.getenv("CRITIC_TRIAGE_ENABLED", "true").lower() == "true",
+        "critic_bypass_accept_score": float(os.getenv("CRITIC_BYPASS_ACCEPT_SCORE", "0.85")),
+        "critic_bypass_accept_coverage": float(os.getenv("CRITIC_BYPASS_ACCEPT_COVERAGE", "0.9")),
+        "critic_bypass_reject_score": float(os.getenv("CRITIC_BYPASS_REJECT_SCORE", "0.15")),
+        "critic_bypass_reject_coverage": float(os.getenv("CRITIC_BYPASS_REJECT_COVERAGE", "0.1")),
+        "skill_ontology_path": os.getenv("SKILL_ONTOLOGY_PATH") or None,  # None = built-in taxonomy
+        "skill_ontology_reload_interval": float(os.getenv("SKILL_ONTOLOGY_RELOAD_INTERVAL", "5")),
         "embedding_dimension": int(os.getenv("EMBEDDING_DIMENSION", "1536")),
         "embedding_model": os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"),
+        "embedding_batch_size": int(os.getenv("EMBEDDING_BATCH_SIZE", "2048")),
+        "embedding_batch_tokens": int(os.getenv("EMBEDDING_BATCH_TOKENS", "250000")),
+        "embedding_cache_size": int(os.getenv("EMBEDDING_CACHE_SIZE", "10000")),
+        "embedding_cache_ttl": int(os.getenv("EMBEDDING_CACHE_TTL", "86400")),
+        "embedding_cache_dtype": os.getenv("EMBEDDING_CACHE_DTYPE", "float32"),
+        "job_requirements_cache_ttl": int(os.getenv("JOB_REQUIREMENTS_CACHE_TTL", "86400")),
+        "resume_cache_ttl": int(os.getenv("RESUME_CACHE_TTL", "604800")),
         
         # Feature Flags
         "enable_bias_detection": os.getenv("ENABLE_BIAS_DETECTION", "true").lower() == "true",
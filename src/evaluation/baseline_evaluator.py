@@ -1,13 +1,21 @@
 """Baseline FRR evaluation system using keyword-based matching."""
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from dataclasses import dataclass, fields
+import copy
+import os
 import pandas as pd
-import json
 from pathlib import Path
 import numpy as np
 
+from .candidate_stream import DEFAULT_CHUNK_SIZE, iter_candidate_chunks
 from .frr_calculator import FRRCalculator
+from .jd_index import load_job_description_index
 from .keyword_extractor import KeywordExtractor
+from .result_sinks import open_result_sink
+from .skill_matrix import RequiredSkillMatcher, SkillIncidence, map_unique
+from .threshold_sweep import ThresholdSweep
 
 
 @dataclass
@@ -25,14 +33,45 @@ class CandidateEvaluation:
     rejection_reason: Optional[str] = None
 
 
+# Evaluator of a shard worker process, set by _init_shard_worker
+_shard_evaluator: Optional["BaselineEvaluator"] = None
+
+
+def _init_shard_worker(evaluator: "BaselineEvaluator") -> None:
+    """Receive the evaluator once per worker process rather than once per shard."""
+    global _shard_evaluator
+    _shard_evaluator = evaluator
+
+
+def _evaluate_shard(index: int, candidates: pd.DataFrame, details: bool) -> Tuple[int, pd.DataFrame, FRRCalculator]:
+    """Evaluate one shard of candidates in a worker process."""
+    frame = _shard_evaluator.evaluate_candidates_frame(candidates, details)
+    calculator = FRRCalculator(keep_results=_shard_evaluator.frr_calculator.keep_results)
+    calculator.add_evaluation_results(frame['candidate_id'], frame['is_qualified'], frame['system_decision'])
+    return index, frame, calculator
+
+
 class BaselineEvaluator:
     """Baseline FRR evaluation system using traditional keyword-based matching."""
     
+    # Education level hierarchy
+    EDUCATION_RANKS = {
+        'High School': 1,
+        'Associate': 2,
+        'Bachelor\'s': 3,
+        'Master\'s': 4,
+        'PhD': 5
+    }
+    
+    # Position keywords earning partial domain relevance
+    RELATED_POSITION_TERMS = ['developer', 'engineer', 'analyst']
+    
     def __init__(self, 
                  skill_weight: float = 0.5,
                  experience_weight: float = 0.25,
                  education_weight: float = 0.15,
-                 domain_weight: float = 0.1):
+                 domain_weight: float = 0.1,
+                 keep_results: bool = True):
         """Initialize baseline evaluator with scoring weights.
         
         Args:
@@ -40,8 +79,10 @@ class BaselineEvaluator:
             experience_weight: Weight for experience evaluation (default 30%)
             education_weight: Weight for education matching (default 15%)
             domain_weight: Weight for domain relevance (default 15%)
+            keep_results: Retain every result in the FRR calculator; FRR
+                statistics only need counts
         """
-        self.frr_calculator = FRRCalculator()
+        self.frr_calculator = FRRCalculator(keep_results=keep_results)
         self.keyword_extractor = KeywordExtractor()
         
         # Scoring weights
@@ -88,32 +129,49 @@ class BaselineEvaluator:
             'Health and fitness': 'Health and fitness'
         }
         
-    def load_job_descriptions(self, job_descriptions_dir: str) -> None:
+    def load_job_descriptions(self, job_descriptions_dir: str, index_path: Optional[str] = None) -> None:
         """Load job descriptions from directory.
         
+        Parsed requirements are persisted in an index next to the files, so
+        only new or modified job descriptions are parsed again on later runs.
+        
         Args:
             job_descriptions_dir: Path to directory containing job description files
+            index_path: Optional path of the parsed job description index
         """
-        job_dir = Path(job_descriptions_dir)
-        
-        for job_file in job_dir.glob("*.md"):
-            # Extract job category from filename
-            # e.g., "JD_Python_Developer_job_description.md" -> "Python Developer"
-            filename = job_file.stem
-            if filename.startswith("JD_"):
-                category = filename.replace("JD_", "").replace("_job_description", "").replace("_", " ")
-            else:
-                category = filename.replace("_job_description", "").replace("_", " ")
-            
-            # Read and parse job description
-            with open(job_file, 'r', encoding='utf-8') as f:
-                jd_text = f.read()
-            
-            parsed_jd = self.keyword_extractor.parse_job_description(jd_text)
-            parsed_jd['category'] = category
-            parsed_jd['raw_text'] = jd_text
-            
-            self.job_descriptions[category] = parsed_jd
+        self.job_descriptions.update(load_job_description_index(
+            Path(job_descriptions_dir),
+            self.keyword_extractor.parse_job_description,
+            self.keyword_extractor.parser_version,
+            Path(index_path) if index_path else None
+        ))
+    
+    def build_category_lookup(self) -> Dict[str, str]:
+        """Resolve every known category name to a loaded job description category.
+        
+        Names in the category mapping resolve to their mapped job description
+        when it is loaded; loaded categories otherwise resolve to themselves.
+        """
+        lookup = {category: category for category in self.job_descriptions}
+        for name, mapped in self.category_mapping.items():
+            if mapped in self.job_descriptions:
+                lookup[name] = mapped
+        return lookup
+    
+    def resolve_job_categories(self, df: pd.DataFrame) -> pd.Series:
+        """Job description category of each candidate, NaN where none applies.
+        
+        Uses actual_category when present, falling back to predicted_position.
+        """
+        lookup = self.build_category_lookup()
+        missing = pd.Series(np.nan, index=df.index, dtype=object)
+        
+        predicted = df.get('predicted_position', missing).astype(str).str.strip()
+        actual = df.get('actual_category', missing)
+        actual_text = actual.astype(str).str.strip()
+        primary = actual_text.where(actual.notna() & (actual_text != ''), predicted)
+        
+        return primary.map(lookup).fillna(predicted.map(lookup))
     
     def evaluate_candidate(self, candidate: Dict[str, Any], job_category: str) -> CandidateEvaluation:
         """Evaluate a single candidate against a job category.
@@ -196,74 +254,291 @@ class BaselineEvaluator:
     def evaluate_candidates_batch(self, 
                                 candidates_file: str, 
                                 results_file: Optional[str] = None) -> List[CandidateEvaluation]:
-        """Evaluate all candidates from CSV file.
+        """Evaluate all candidates from CSV or Parquet file.
+        
+        Every result is kept in the returned list, so memory grows with the
+        file; use evaluate_candidates_stream for large exports.
         
         Args:
-            candidates_file: Path to candidates CSV file
-            results_file: Optional path to save detailed results
+            candidates_file: Path to candidates CSV or Parquet file
+            results_file: Optional path to save detailed results, written
+                as each chunk is evaluated; the suffix picks the format
+                (see open_result_sink)
             
         Returns:
             List of CandidateEvaluation results
         """
-        # Load candidates
-        df = pd.read_csv(candidates_file)
-        
         results = []
         
-        for _, candidate in df.iterrows():
-            # Use actual_category if available, otherwise predicted_position
-            job_category = candidate.get('actual_category')
-            if pd.isna(job_category) or not job_category or str(job_category).strip() == '':
-                job_category = candidate.get('predicted_position', 'Unknown')
-            
-            # Clean up job category name
-            if job_category != 'Unknown':
-                job_category = str(job_category).strip()
+        with (open_result_sink(results_file) if results_file else nullcontext()) as sink:
+            for frame in self.evaluate_candidates_stream(candidates_file):
+                records = self.evaluation_records(frame)
+                if sink:
+                    sink.write_all(records)
+                results.extend(CandidateEvaluation(**record) for record in records)
+        
+        return results
+    
+    @staticmethod
+    def evaluation_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """CandidateEvaluation fields of evaluated rows as dictionaries, e.g. for a result sink."""
+        return frame[[field.name for field in fields(CandidateEvaluation)]].to_dict('records')
+    
+    def evaluate_candidates_stream(self,
+                                   candidates_file: str,
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                   details: bool = True) -> Iterator[pd.DataFrame]:
+        """Evaluate a CSV or Parquet candidates file chunk by chunk.
+        
+        Each chunk's results are added to the FRR calculator and yielded,
+        so memory does not grow with the file unless the caller keeps the
+        chunks or the calculator keeps results.
+        
+        Args:
+            candidates_file: Path to candidates CSV or Parquet file
+            chunk_size: Candidates read and evaluated at a time
+            details: Passed to evaluate_candidates_frame
             
-            # Map to available job description if needed
-            if job_category in self.category_mapping:
-                mapped_category = self.category_mapping[job_category]
-                if mapped_category in self.job_descriptions:
-                    job_category = mapped_category
+        Yields:
+            Results of each chunk, indexed by row of the candidates file
+        """
+        for chunk in iter_candidate_chunks(candidates_file, chunk_size):
+            frame = self.evaluate_candidates_frame(chunk, details)
+            self.frr_calculator.add_evaluation_results(
+                frame['candidate_id'], frame['is_qualified'], frame['system_decision']
+            )
+            yield frame
+    
+    def evaluate_candidates_frame(self, candidates: pd.DataFrame, details: bool = True) -> pd.DataFrame:
+        """Evaluate many candidates at once with column-wise scoring.
+        
+        Scores match evaluate_candidate. Skills texts are tokenized once per
+        distinct value into a sparse candidate x skill matrix, experience and
+        education are extracted once per distinct value, and all scoring is
+        done with array operations.
+        
+        Args:
+            candidates: Candidate rows, as in the candidates CSV
+            details: Include matched/missing skill lists and rejection reasons,
+                which are built per candidate
             
-            # Skip if no valid category or category not in job descriptions
-            if job_category == 'Unknown' or job_category not in self.job_descriptions:
-                # Try fallback to predicted_position if actual_category fails
-                if job_category != candidate.get('predicted_position', ''):
-                    fallback_category = str(candidate.get('predicted_position', '')).strip()
-                    if fallback_category in self.category_mapping:
-                        fallback_mapped = self.category_mapping[fallback_category]
-                        if fallback_mapped in self.job_descriptions:
-                            job_category = fallback_mapped
-                        else:
-                            continue
-                    elif fallback_category in self.job_descriptions:
-                        job_category = fallback_category
-                    else:
-                        continue
-                else:
-                    continue
+        Returns:
+            One row per evaluated candidate, indexed like ``candidates``;
+            candidates without a matching job description are left out
+        """
+        job_categories = self.resolve_job_categories(candidates)
+        evaluated = job_categories.notna().to_numpy()
+        df = candidates[evaluated]
+        categories = job_categories[evaluated].to_numpy()
+        
+        names = sorted(set(categories))
+        jobs = pd.Series(categories).map({name: index for index, name in enumerate(names)}).to_numpy(dtype=np.int64)
+        job_reqs = [self.job_descriptions[name] for name in names]
+        
+        def column(name: str) -> pd.Series:
+            return df[name] if name in df else pd.Series('', index=df.index, dtype=object)
+        
+        # Skills
+        extractor = self.keyword_extractor
+        incidence = SkillIncidence.from_texts(
+            column('skills'),
+            lambda text: extractor.tokenize_skills(text) if isinstance(text, str) else []
+        )
+        matcher = RequiredSkillMatcher([reqs['required_skills'] for reqs in job_reqs], extractor.normalize_skill)
+        skills_score = matcher.skill_scores(incidence, jobs)
+        
+        # Experience: years are NaN where the candidate gave no experience
+        candidate_years = map_unique(
+            column('experience'),
+            lambda text: extractor.extract_experience_years(text) if text else np.nan,
+            np.nan
+        )[0].astype(float)
+        required_years = np.array([reqs['experience_years'] for reqs in job_reqs], dtype=float)[jobs]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            experience_score = np.where(
+                required_years == 0, 1.0,
+                np.where(np.isnan(candidate_years), 0.0, np.minimum(1.0, candidate_years / required_years))
+            )
+        
+        # Education: rank -2 where the candidate gave no education, -1 where
+        # its level cannot be determined
+        candidate_rank = map_unique(
+            column('education'),
+            lambda text: self._education_rank(text) if text else -2,
+            -2
+        )[0].astype(float)
+        required_levels = [reqs['education_level'] for reqs in job_reqs]
+        has_requirement = np.array([bool(level) for level in required_levels], dtype=bool)[jobs]
+        required_rank = np.array([self.EDUCATION_RANKS.get(level, 0) for level in required_levels], dtype=float)[jobs]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            education_score = np.select(
+                [~has_requirement, candidate_rank == -2, candidate_rank == -1,
+                 candidate_rank >= required_rank, candidate_rank > 0],
+                [1.0, 0.0, 0.5, 1.0, candidate_rank / required_rank],
+                default=0.0
+            )
+        
+        # Domain relevance
+        domain_score, valid = self._domain_scores(column('predicted_position'), column('actual_category'), names, jobs)
+        
+        # Non-text skills cannot be parsed; evaluate_candidate fails on them too
+        valid &= map_unique(column('skills'), lambda text: isinstance(text, str) or not text, True)[0].astype(bool)
+        if not valid.all():
+            print(f"Skipped {int((~valid).sum())} candidates with invalid fields")
+        
+        overall_score = (
+            skills_score * self.weights['skills'] +
+            experience_score * self.weights['experience'] +
+            education_score * self.weights['education'] +
+            domain_score * self.weights['domain']
+        )
+        
+        ids = column('id') if 'id' in df else pd.Series('unknown', index=df.index, dtype=object)
+        frame = pd.DataFrame({
+            'candidate_id': map_unique(ids, str, 'nan')[0],
+            'job_category': categories,
+            'is_qualified': overall_score >= self.qualification_threshold,
+            'system_decision': np.where(overall_score >= self.acceptance_threshold, 'accept', 'reject'),
+            'skills_score': skills_score,
+            'experience_score': experience_score,
+            'education_score': education_score,
+            'domain_score': domain_score,
+            'overall_score': overall_score
+        }, index=df.index)
+        
+        if details:
+            frame['skills_matched'], frame['skills_missing'] = matcher.skill_lists(
+                incidence, jobs, extractor.fuzzy_match_ids
+            )
+            frame['rejection_reason'] = pd.Series([
+                self._generate_rejection_reason(
+                    row.skills_score, row.experience_score, row.education_score,
+                    row.domain_score, row.skills_missing
+                ) if row.system_decision == 'reject' else None
+                for row in frame.itertuples()
+            ], index=frame.index, dtype=object)
+        
+        return frame[valid]
+    
+    def evaluate_candidates_sharded(self,
+                                    candidates_file: str,
+                                    shard_size: int = 50000,
+                                    max_workers: Optional[int] = None,
+                                    details: bool = True) -> pd.DataFrame:
+        """Evaluate a CSV or Parquet candidates file in row-range shards across processes.
+        
+        Shards are read one after another and evaluated in a process pool;
+        each returns its results and an FRRCalculator, which are merged in
+        row order whatever order the shards finish in. Candidates are
+        evaluated independently, so the results equal a serial run.
+        
+        Args:
+            candidates_file: Path to candidates CSV or Parquet file
+            shard_size: Candidates per shard
+            max_workers: Worker processes (defaults to the CPU count)
+            details: Passed to evaluate_candidates_frame
             
-            try:
-                evaluation = self.evaluate_candidate(candidate.to_dict(), job_category)
-                results.append(evaluation)
-                
-                # Add to FRR calculator
-                self.frr_calculator.add_evaluation_result(
-                    candidate_id=evaluation.candidate_id,
-                    is_qualified=evaluation.is_qualified,
-                    system_decision=evaluation.system_decision
-                )
-                
-            except Exception as e:
-                print(f"Error evaluating candidate {candidate.get('id')}: {e}")
-                continue
-        
-        # Save detailed results if requested
-        if results_file:
-            self._save_results(results, results_file)
+        Returns:
+            Results of all shards, indexed by row of the candidates file
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        # Workers do not need the results accumulated so far
+        worker_evaluator = copy.copy(self)
+        worker_evaluator.frr_calculator = FRRCalculator(keep_results=self.frr_calculator.keep_results)
+        
+        shards: Dict[int, Tuple[pd.DataFrame, FRRCalculator]] = {}
+        
+        def collect(futures) -> None:
+            for future in futures:
+                index, frame, calculator = future.result()
+                shards[index] = (frame, calculator)
+        
+        with ProcessPoolExecutor(max_workers, initializer=_init_shard_worker, initargs=(worker_evaluator,)) as executor:
+            pending = set()
+            for index, shard in enumerate(iter_candidate_chunks(candidates_file, shard_size)):
+                pending.add(executor.submit(_evaluate_shard, index, shard, details))
+                # Bound the number of shards held in memory
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(wait(pending).done)
+        
+        if not shards:
+            return self.evaluate_candidates_frame(pd.DataFrame(), details)
+        
+        frames = []
+        for index in sorted(shards):
+            frame, calculator = shards[index]
+            frames.append(frame)
+            self.frr_calculator.merge(calculator)
+        return pd.concat(frames)
+
+    def build_threshold_sweep(self,
+                              candidates_file: str,
+                              chunk_size: int = DEFAULT_CHUNK_SIZE) -> ThresholdSweep:
+        """Score a CSV or Parquet candidates file once for tuning thresholds.
+
+        Overall scores do not depend on the qualification and acceptance
+        thresholds, so the returned sweep gives the statistics of any
+        threshold pair without re-evaluating. The FRR calculator is not
+        updated.
+
+        Args:
+            candidates_file: Path to candidates CSV or Parquet file
+            chunk_size: Candidates read and evaluated at a time
+
+        Returns:
+            ThresholdSweep over the overall score of every valid candidate
+        """
+        scores = [
+            self.evaluate_candidates_frame(chunk, details=False)['overall_score'].to_numpy()
+            for chunk in iter_candidate_chunks(candidates_file, chunk_size)
+        ]
+        return ThresholdSweep(np.concatenate(scores) if scores else [])
+    
+    def _domain_scores(self,
+                       predicted: pd.Series,
+                       actual: pd.Series,
+                       categories: List[str],
+                       jobs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Domain relevance of each candidate, and whether it could be evaluated.
+        
+        Mirrors _evaluate_domain_relevance, which fails on non-text positions.
+        """
+        predicted_match, predicted_is_text = self._contains_category(predicted, categories, jobs)
+        actual_match, actual_is_text = self._contains_category(actual, categories, jobs)
+        related = map_unique(
+            predicted,
+            lambda value: isinstance(value, str) and any(term in value.lower() for term in self.RELATED_POSITION_TERMS),
+            False
+        )[0].astype(bool)
+        scores = np.where(predicted_match | actual_match, 1.0, np.where(related, 0.5, 0.3))
+        
+        # The actual category is only inspected when the predicted position does not match
+        valid = predicted_is_text & (predicted_match | actual_is_text)
+        return scores, valid
+    
+    @staticmethod
+    def _contains_category(values: pd.Series,
+                           categories: List[str],
+                           jobs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Whether each value contains its job category, ignoring case, and whether it is text.
         
-        return results
+        Each distinct (value, job) pair is checked once.
+        """
+        codes, uniques = pd.factorize(values)
+        # Missing values have code -1, which picks the trailing entry
+        lowered = [value.lower() if isinstance(value, str) else '' for value in uniques] + ['']
+        is_text = np.array([isinstance(value, str) for value in uniques] + [False])
+        
+        category_names = [category.lower() for category in categories]
+        pairs, inverse = np.unique(codes * len(categories) + jobs, return_inverse=True)
+        contains = np.array([
+            category_names[job] in lowered[code]
+            for code, job in zip(pairs // len(categories), pairs % len(categories))
+        ], dtype=bool)
+        return contains[inverse], is_text[codes]
     
     def calculate_frr(self) -> float:
         """Calculate False Rejection Rate from all evaluations."""
@@ -330,22 +605,12 @@ class BaselineEvaluator:
         if not candidate_education:
             return 0.0  # No education info means zero score
         
-        candidate_level = self.keyword_extractor.extract_education_requirements(candidate_education)
+        candidate_rank = self._education_rank(candidate_education)
         
-        if not candidate_level:
+        if candidate_rank == -1:
             return 0.5  # Some education but can't determine level
         
-        # Education level hierarchy
-        education_levels = {
-            'High School': 1,
-            'Associate': 2,
-            'Bachelor\'s': 3,
-            'Master\'s': 4,
-            'PhD': 5
-        }
-        
-        candidate_rank = education_levels.get(candidate_level, 0)
-        required_rank = education_levels.get(required_education, 0)
+        required_rank = self.EDUCATION_RANKS.get(required_education, 0)
         
         if candidate_rank >= required_rank:
             return 1.0
@@ -354,6 +619,13 @@ class BaselineEvaluator:
         else:
             return 0.0
     
+    def _education_rank(self, candidate_education: Any) -> int:
+        """Rank of the education level found in text, -1 if none is found."""
+        candidate_level = self.keyword_extractor.extract_education_requirements(candidate_education)
+        if not candidate_level:
+            return -1
+        return self.EDUCATION_RANKS.get(candidate_level, 0)
+    
     def _evaluate_domain_relevance(self, candidate: Dict[str, Any], job_category: str) -> float:
         """Evaluate domain/industry relevance (simplified for baseline)."""
         # Simple check: if predicted_position matches job_category, give full score
@@ -364,7 +636,7 @@ class BaselineEvaluator:
             return 1.0
         
         # Otherwise, give partial score based on related terms
-        related_score = 0.5 if any(word in predicted_position.lower() for word in ['developer', 'engineer', 'analyst']) else 0.3
+        related_score = 0.5 if any(word in predicted_position.lower() for word in self.RELATED_POSITION_TERMS) else 0.3
         return related_score
     
     def _generate_rejection_reason(self, 
@@ -392,26 +664,6 @@ class BaselineEvaluator:
         
         return "; ".join(reasons) if reasons else "Overall score below threshold"
     
-    def _save_results(self, results: List[CandidateEvaluation], filename: str) -> None:
-        """Save detailed evaluation results to JSON file."""
-        results_data = []
-        for result in results:
-            results_data.append({
-                'candidate_id': result.candidate_id,
-                'job_category': result.job_category,
-                'is_qualified': result.is_qualified,
-                'system_decision': result.system_decision,
-                'skills_matched': result.skills_matched,
-                'skills_missing': result.skills_missing,
-                'experience_score': result.experience_score,
-                'education_score': result.education_score,
-                'overall_score': result.overall_score,
-                'rejection_reason': result.rejection_reason
-            })
-        
-        with open(filename, 'w') as f:
-            json.dump(results_data, f, indent=2)
-    
     def reset_evaluations(self) -> None:
         """Reset all evaluation results."""
         self.frr_calculator.reset_results()
\ No newline at end of file
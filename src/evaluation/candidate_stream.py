@@ -0,0 +1,58 @@
+"""Streaming candidate sources."""
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pandas as pd
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+
+DEFAULT_CHUNK_SIZE = 50000
+
+
+def import_pyarrow() -> Any:
+    """Import pyarrow, which Parquet files need but other formats do not.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Reading or writing Parquet files requires pyarrow; "
+            "install it with the 'parquet' extra (pip install 'thesis[parquet]')"
+        ) from e
+    return pyarrow
+
+
+def iter_candidate_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Read a candidates file in chunks of at most ``chunk_size`` rows.
+
+    CSV files are read with pandas' chunked reader and Parquet files one
+    record batch at a time, never crossing a row group, so only one chunk
+    is held in memory. Chunks are indexed by row of the file.
+
+    Args:
+        path: CSV or Parquet (``.parquet``/``.pq``) candidates file
+        chunk_size: Maximum rows per chunk
+    """
+    if Path(path).suffix.lower() not in PARQUET_SUFFIXES:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+
+    parquet_file = import_pyarrow().parquet.ParquetFile(path)
+    start = 0
+    for row_group in range(parquet_file.num_row_groups):
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, row_groups=[row_group]):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+
+
+def iter_candidates(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Candidate rows of a CSV or Parquet file as dictionaries, read in chunks."""
+    for chunk in iter_candidate_chunks(path, chunk_size):
+        for _, candidate in chunk.iterrows():
+            yield candidate.to_dict()
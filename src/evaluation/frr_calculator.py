@@ -1,8 +1,10 @@
 """FRR Calculator - Core False Rejection Rate calculation functionality."""
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 
 @dataclass
 class EvaluationResult:
@@ -16,11 +18,32 @@ class FRRCalculator:
     """Calculate False Rejection Rate (FRR) for recruitment systems.
     
     FRR = (Qualified Applicants Rejected by System) ÷ (Total Qualified Applicants)
+    
+    Statistics are kept as running counts, so per-candidate results only
+    need to be retained when ``keep_results`` is set.
     """
     
-    def __init__(self):
-        """Initialize empty calculator."""
+    def __init__(self, keep_results: bool = True):
+        """Initialize empty calculator.
+        
+        Args:
+            keep_results: Retain every result in ``results``
+        """
+        self.keep_results = keep_results
         self.results: List[EvaluationResult] = []
+        self.counts = {"total": 0, "qualified": 0, "false_rejections": 0, "false_acceptances": 0}
+    
+    def _count(self, results: List[EvaluationResult]) -> None:
+        """Fold results into the running counts and retain them if requested."""
+        for result in results:
+            self.counts["total"] += 1
+            if result.is_qualified:
+                self.counts["qualified"] += 1
+                self.counts["false_rejections"] += result.system_decision == "reject"
+            else:
+                self.counts["false_acceptances"] += result.system_decision == "accept"
+        if self.keep_results:
+            self.results.extend(results)
     
     def add_evaluation_result(
         self, 
@@ -37,7 +60,50 @@ class FRRCalculator:
             is_qualified=is_qualified,
             system_decision=system_decision
         )
-        self.results.append(result)
+        self._count([result])
+    
+    def add_evaluation_results(
+        self,
+        candidate_ids: Iterable[str],
+        is_qualified: Iterable[bool],
+        system_decisions: Iterable[str]
+    ) -> None:
+        """Add many candidate evaluation results, e.g. columns of a batch.
+        
+        Without ``keep_results`` the columns are counted with NumPy instead
+        of building a result per candidate.
+        """
+        if self.keep_results:
+            results = [
+                EvaluationResult(candidate_id=candidate_id, is_qualified=bool(qualified), system_decision=decision)
+                for candidate_id, qualified, decision in zip(candidate_ids, is_qualified, system_decisions)
+            ]
+            if any(result.system_decision not in ["accept", "reject"] for result in results):
+                raise ValueError("system_decision must be 'accept' or 'reject'")
+            self._count(results)
+            return
+        
+        qualified = np.asarray(is_qualified, dtype=bool)
+        decisions = np.asarray(system_decisions, dtype=object)
+        rejected = decisions == "reject"
+        if not (rejected | (decisions == "accept")).all():
+            raise ValueError("system_decision must be 'accept' or 'reject'")
+        
+        self.counts["total"] += len(qualified)
+        self.counts["qualified"] += int(qualified.sum())
+        self.counts["false_rejections"] += int((qualified & rejected).sum())
+        self.counts["false_acceptances"] += int((~qualified & ~rejected).sum())
+    
+    def merge(self, other: "FRRCalculator") -> None:
+        """Add the results of another calculator, e.g. one that evaluated a shard.
+        
+        Statistics only count results, so they do not depend on merge order;
+        merging shards in row order also reproduces the serial results list.
+        """
+        for key, count in other.counts.items():
+            self.counts[key] += count
+        if self.keep_results:
+            self.results.extend(other.results)
     
     def calculate_frr(self) -> float:
         """Calculate False Rejection Rate.
@@ -45,42 +111,25 @@ class FRRCalculator:
         Returns:
             FRR as float between 0.0 and 1.0
         """
-        qualified_candidates = [r for r in self.results if r.is_qualified]
-        
-        if not qualified_candidates:
+        if not self.counts["qualified"]:
             return 0.0  # No qualified candidates means no false rejections possible
         
-        false_rejections = [
-            r for r in qualified_candidates 
-            if r.system_decision == "reject"
-        ]
-        
-        return len(false_rejections) / len(qualified_candidates)
+        return self.counts["false_rejections"] / self.counts["qualified"]
     
     def get_qualification_stats(self) -> Dict[str, int]:
         """Get detailed qualification statistics."""
-        total_candidates = len(self.results)
-        qualified_candidates = len([r for r in self.results if r.is_qualified])
+        total_candidates = self.counts["total"]
+        qualified_candidates = self.counts["qualified"]
         unqualified_candidates = total_candidates - qualified_candidates
         
         # False rejections: qualified candidates rejected
-        false_rejections = len([
-            r for r in self.results 
-            if r.is_qualified and r.system_decision == "reject"
-        ])
+        false_rejections = self.counts["false_rejections"]
         
         # False acceptances: unqualified candidates accepted
-        false_acceptances = len([
-            r for r in self.results 
-            if not r.is_qualified and r.system_decision == "accept"
-        ])
-        
-        # Correct decisions
-        correct_decisions = len([
-            r for r in self.results
-            if (r.is_qualified and r.system_decision == "accept") or
-               (not r.is_qualified and r.system_decision == "reject")
-        ])
+        false_acceptances = self.counts["false_acceptances"]
+        
+        # Correct decisions: every other decision
+        correct_decisions = total_candidates - false_rejections - false_acceptances
         
         return {
             "total_candidates": total_candidates,
@@ -94,6 +143,8 @@ class FRRCalculator:
     def reset_results(self) -> None:
         """Reset all evaluation results."""
         self.results.clear()
+        for key in self.counts:
+            self.counts[key] = 0
     
     def validate_baseline_frr(
         self, 
@@ -171,18 +222,12 @@ class FRRCalculator:
         Returns:
             (lower_bound, upper_bound) tuple
         """
-        qualified_candidates = [r for r in self.results if r.is_qualified]
-        n = len(qualified_candidates)
+        n = self.counts["qualified"]
         
         if n == 0:
             return (0.0, 0.0)
         
-        false_rejections = len([
-            r for r in qualified_candidates 
-            if r.system_decision == "reject"
-        ])
-        
-        frr = false_rejections / n
+        frr = self.counts["false_rejections"] / n
         
         # Wilson score interval for binomial proportion
         alpha = 1 - confidence_level
@@ -7,6 +7,7 @@ from pathlib import Path
 import math
 
 from .frr_calculator import FRRCalculator
+from .result_sinks import read_results
 
 
 @dataclass
@@ -38,30 +39,19 @@ class FRRComparator:
         """Load evaluation results from both systems.
         
         Args:
-            baseline_results_file: JSON file with baseline evaluation results
-            multiagent_results_file: JSON file with multi-agent evaluation results
+            baseline_results_file: Baseline evaluation results, in any
+                format written by a result sink
+            multiagent_results_file: Multi-agent evaluation results, in any
+                format written by a result sink
         """
-        # Load baseline results
-        with open(baseline_results_file, 'r') as f:
-            baseline_data = json.load(f)
-        
-        for result in baseline_data:
-            self.baseline_calculator.add_evaluation_result(
-                candidate_id=result['candidate_id'],
-                is_qualified=result['is_qualified'],
-                system_decision=result['system_decision']
-            )
-        
-        # Load multi-agent results
-        with open(multiagent_results_file, 'r') as f:
-            multiagent_data = json.load(f)
-        
-        for result in multiagent_data:
-            self.multiagent_calculator.add_evaluation_result(
-                candidate_id=result['candidate_id'],
-                is_qualified=result['is_qualified'],
-                system_decision=result['system_decision']
-            )
+        for results_file, calculator in ((baseline_results_file, self.baseline_calculator),
+                                         (multiagent_results_file, self.multiagent_calculator)):
+            for result in read_results(results_file):
+                calculator.add_evaluation_result(
+                    candidate_id=result['candidate_id'],
+                    is_qualified=result['is_qualified'],
+                    system_decision=result['system_decision']
+                )
     
     def load_from_calculators(self, 
                              baseline_calculator: FRRCalculator,
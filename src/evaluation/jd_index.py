@@ -0,0 +1,152 @@
+"""Persisted index of parsed job descriptions, reused across evaluation runs."""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the index file changes
+INDEX_FORMAT_VERSION = 1
+
+DEFAULT_INDEX_FILENAME = ".jd_index.json"
+
+
+def job_category_from_filename(job_file: Path) -> str:
+    """Job category of a description file.
+
+    e.g. "JD_Python_Developer_job_description.md" -> "Python Developer"
+    """
+    filename = job_file.stem
+    if filename.startswith("JD_"):
+        filename = filename.replace("JD_", "")
+    return filename.replace("_job_description", "").replace("_", " ")
+
+
+class JobDescriptionIndex:
+    """Parsed job requirements keyed by description file.
+
+    Entries record the file's mtime, size and SHA-256. A file whose mtime
+    and size are unchanged is served from the index without being read; a
+    touched file with the same content is only re-hashed. The whole index
+    is discarded when its format or the parser version changes.
+    """
+
+    def __init__(self, path: Path, parser_version: str):
+        """Initialize index.
+
+        Args:
+            path: JSON file holding the index
+            parser_version: Version of the parser producing the entries
+        """
+        self.path = Path(path)
+        self.parser_version = parser_version
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._read()
+
+    def _read(self) -> None:
+        """Load entries from disk if the index is compatible."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable job description index {self.path}: {e}")
+            return
+
+        if (data.get("format_version") != INDEX_FORMAT_VERSION
+                or data.get("parser_version") != self.parser_version):
+            logger.info(f"Job description index {self.path} is outdated, rebuilding")
+            return
+        self._entries = data.get("entries", {})
+
+    def get(self, job_file: Path, parse: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """Parsed requirements of a file, parsing it only if it changed.
+
+        Args:
+            job_file: Job description file
+            parse: Parser applied to the file's text on a cache miss
+
+        Returns:
+            Parsed requirements with ``raw_text``
+        """
+        key = job_file.name
+        stat = job_file.stat()
+        entry = self._entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return dict(entry["parsed"])
+
+        text = job_file.read_text(encoding='utf-8')
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        if not entry or entry["sha256"] != digest:
+            entry = {"sha256": digest, "parsed": {**parse(text), "raw_text": text}}
+
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self._entries[key] = entry
+        self._dirty = True
+        return dict(entry["parsed"])
+
+    def retain(self, names: set) -> None:
+        """Drop entries of files that no longer exist."""
+        removed = set(self._entries) - names
+        for name in removed:
+            del self._entries[name]
+        self._dirty = self._dirty or bool(removed)
+
+    def save(self) -> None:
+        """Write the index if it changed, replacing the file atomically."""
+        if not self._dirty:
+            return
+
+        data = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "parser_version": self.parser_version,
+            "entries": self._entries
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # The index is only an optimization; read-only data dirs still work
+            logger.warning(f"Could not write job description index {self.path}: {e}")
+            return
+        self._dirty = False
+
+
+def load_job_description_index(
+    job_dir: Path,
+    parse: Callable[[str], Dict[str, Any]],
+    parser_version: str,
+    index_path: Optional[Path] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Parsed job descriptions of every ``*.md`` file in a directory, by category.
+
+    Args:
+        job_dir: Directory containing job description files
+        parse: Parser for job description text
+        parser_version: Version of ``parse``; a change invalidates the index
+        index_path: Index file (defaults to ``.jd_index.json`` in ``job_dir``)
+
+    Returns:
+        Category to parsed requirements with ``category`` and ``raw_text``
+    """
+    index = JobDescriptionIndex(index_path or job_dir / DEFAULT_INDEX_FILENAME, parser_version)
+
+    job_descriptions = {}
+    job_files = sorted(job_dir.glob("*.md"))
+    for job_file in job_files:
+        category = job_category_from_filename(job_file)
+        parsed_jd = index.get(job_file, parse)
+        parsed_jd['category'] = category
+        job_descriptions[category] = parsed_jd
+
+    index.retain({job_file.name for job_file in job_files})
+    index.save()
+    return job_descriptions
@@ -1,9 +1,15 @@
 """Keyword extraction from job descriptions for baseline FRR evaluation."""
+import hashlib
+import json
 import re
-from typing import List, Dict, Any, Optional, Set, Union
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Set, Union
 from dataclasses import dataclass
 import pandas as pd
 
+# Distinct skill strings whose normalization is memoized per extractor
+NORMALIZE_CACHE_SIZE = 65536
+
 
 @dataclass
 class JobRequirements:
@@ -17,6 +23,68 @@ class JobRequirements:
 class KeywordExtractor:
     """Extract keywords and requirements from job descriptions using rule-based patterns."""
     
+    # Bump when a change to the parsing code changes parse_job_description
+    # output; changes to the pattern and keyword tables below are covered by
+    # parser_version without a bump
+    PARSER_REVISION = "1"
+    
+    # Patterns are compiled once for all extractors
+    SKILL_SECTION_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+            r"required skills?:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
+            r"requirements?:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
+            r"technical skills?:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
+            r"must have:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
+        )
+    ]
+    BULLET_PATTERN = re.compile(r"[•\-\*]\s*([^•\-\*\n]+)")
+    
+    # Order matters for ranges
+    YEAR_PATTERNS = [
+        re.compile(pattern) for pattern in (
+            r"(\d+)-\d+\s*years?",  # Take minimum from range - check this first
+            r"(\d+)\+?\s*years?",
+            r"minimum\s+(\d+)\s*years?",
+            r"at least\s+(\d+)\s*years?",
+            r"(\d+)\s*years?\s+(?:of\s+)?experience",
+            r"(\d+)\s*years?\s+(?:of\s+)?(?:relevant\s+)?experience",
+        )
+    ]
+    
+    EDUCATION_PATTERNS = [
+        (re.compile(pattern), level) for pattern, level in (
+            (r"phd|doctorate", "PhD"),
+            (r"master'?s?|msc|ms\b", "Master's"),
+            (r"bachelor'?s?|bsc|bs\b|undergraduate", "Bachelor's"),
+            (r"associate'?s?", "Associate"),
+            (r"high school|diploma", "High School"),
+        )
+    ]
+    
+    NICE_TO_HAVE_PATTERNS = [
+        re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+            r"nice to have:?\s*\n?(.+?)(?:\n\n|\n[A-Z]|$)",
+            r"preferred:?\s*\n?(.+?)(?:\n\n|\n[A-Z]|$)",
+            r"bonus:?\s*\n?(.+?)(?:\n\n|\n[A-Z]|$)",
+        )
+    ]
+    
+    SKILL_DELIMITERS = re.compile(r'[,;•\-\*\n]')
+    LEADING_LIST_MARKER = re.compile(r'^[\d\.\)\s\-•\*]+')
+    NON_SKILL_CHARS = re.compile(r'[^\w\s\-\+\.\#]')
+    NON_NORMALIZED_CHARS = re.compile(r'[^\w\s\-\+\.]')
+    WHITESPACE = re.compile(r'\s+')
+    
+    NON_SKILL_WORDS = ('experience', 'education', 'degree', 'years', 'bachelor', 'master', 'phd')
+    
+    # Common abbreviations treated as fuzzy matches of the full skill
+    FUZZY_ABBREVIATIONS = (
+        ("javascript", "js"),
+        ("machine learning", "ml"),
+        ("artificial intelligence", "ai"),
+        ("database", "db"),
+    )
+    
     def __init__(self):
         """Initialize with common skill mappings and patterns."""
         # Common skill abbreviations and aliases
@@ -53,6 +121,51 @@ class KeywordExtractor:
             "fastapi", "django", "flask", "spring", "rest api", "graphql",
             "microservices", "cloud", "devops", "agile", "scrum"
         }
+        
+        # Skills searched for inside compound phrases, longest match first
+        self._compound_skills = [
+            skill for skill in sorted(self.known_skills, key=len, reverse=True) if len(skill) > 2
+        ]
+        
+        # Normalization depends only on the skill string, and baseline runs
+        # normalize the same skills for every candidate
+        self.normalize_skill = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self._normalize_skill)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the normalization cache, e.g. for worker processes."""
+        state = self.__dict__.copy()
+        del state['normalize_skill']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore and start a fresh normalization cache."""
+        self.__dict__.update(state)
+        self.normalize_skill = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self._normalize_skill)
+    
+    @property
+    def parser_version(self) -> str:
+        """Version of parse_job_description output.
+        
+        Hashes the parser revision with the pattern and keyword tables, so
+        persisted indexes of parsed job descriptions are rebuilt when any
+        of them changes.
+        """
+        patterns = (
+            self.SKILL_SECTION_PATTERNS + [self.BULLET_PATTERN] + self.YEAR_PATTERNS
+            + [pattern for pattern, _ in self.EDUCATION_PATTERNS] + self.NICE_TO_HAVE_PATTERNS
+            + [self.SKILL_DELIMITERS, self.LEADING_LIST_MARKER, self.NON_SKILL_CHARS,
+               self.NON_NORMALIZED_CHARS, self.WHITESPACE]
+        )
+        tables = {
+            "revision": self.PARSER_REVISION,
+            "patterns": [(pattern.pattern, int(pattern.flags)) for pattern in patterns],
+            "education_levels": [level for _, level in self.EDUCATION_PATTERNS],
+            "non_skill_words": self.NON_SKILL_WORDS,
+            "skill_aliases": self.skill_aliases,
+            "known_skills": sorted(self.known_skills)
+        }
+        encoded = json.dumps(tables, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:12]
     
     def extract_required_skills(self, job_description: str) -> List[str]:
         """Extract required skills from job description text.
@@ -70,20 +183,12 @@ class KeywordExtractor:
         text = job_description.lower()
         
         # Pattern 1: Skills listed after "required skills:", "requirements:", etc.
-        skill_section_patterns = [
-            r"required skills?:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
-            r"requirements?:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
-            r"technical skills?:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
-            r"must have:?\s*\n?(.+?)(?:\n\s*\n|\nexperience|\neducation|$)",
-        ]
-        
-        for pattern in skill_section_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
-            for match in matches:
+        for pattern in self.SKILL_SECTION_PATTERNS:
+            for match in pattern.findall(text):
                 skills.update(self._parse_skill_list(match))
         
         # Pattern 2: Look for skills in bullet points
-        bullet_skills = re.findall(r"[•\-\*]\s*([^•\-\*\n]+)", text)
+        bullet_skills = self.BULLET_PATTERN.findall(text)
         for skill_text in bullet_skills:
             skills.update(self._parse_skill_list(skill_text))
         
@@ -120,18 +225,8 @@ class KeywordExtractor:
         if any(phrase in text for phrase in ["fresh graduate", "no experience", "entry level"]):
             return 0
         
-        # Patterns for extracting years - order matters for ranges
-        year_patterns = [
-            r"(\d+)-\d+\s*years?",  # Take minimum from range - check this first
-            r"(\d+)\+?\s*years?",
-            r"minimum\s+(\d+)\s*years?",
-            r"at least\s+(\d+)\s*years?",
-            r"(\d+)\s*years?\s+(?:of\s+)?experience",
-            r"(\d+)\s*years?\s+(?:of\s+)?(?:relevant\s+)?experience",
-        ]
-        
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self.YEAR_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 try:
                     return int(matches[0])
@@ -154,16 +249,8 @@ class KeywordExtractor:
         
         text = str(text).lower()
         
-        education_patterns = [
-            (r"phd|doctorate", "PhD"),
-            (r"master'?s?|msc|ms\b", "Master's"),
-            (r"bachelor'?s?|bsc|bs\b|undergraduate", "Bachelor's"),
-            (r"associate'?s?", "Associate"),
-            (r"high school|diploma", "High School"),
-        ]
-        
-        for pattern, level in education_patterns:
-            if re.search(pattern, text):
+        for pattern, level in self.EDUCATION_PATTERNS:
+            if pattern.search(text):
                 return level
         
         return None
@@ -192,9 +279,11 @@ class KeywordExtractor:
             "nice_to_have": self._extract_nice_to_have(job_description)
         }
     
-    def normalize_skill(self, skill: str) -> str:
+    def _normalize_skill(self, skill: str) -> str:
         """Normalize skill name to standard format.
         
+        Exposed as ``normalize_skill``, memoized per extractor.
+        
         Args:
             skill: Raw skill name
             
@@ -208,12 +297,13 @@ class KeywordExtractor:
         normalized = skill.lower().strip()
         
         # Remove special characters and extra spaces
-        normalized = re.sub(r'[^\w\s\-\+\.]', '', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
+        normalized = self.NON_NORMALIZED_CHARS.sub('', normalized)
+        normalized = self.WHITESPACE.sub(' ', normalized).strip()
         
-        # Check for skill within the text (for compound phrases) - longest match first
-        for known_skill in sorted(self.known_skills, key=len, reverse=True):
-            if known_skill in normalized and len(known_skill) > 2:  # Avoid short matches
+        # Check for skill within the text (for compound phrases) - longest match first,
+        # skipping short skills to avoid spurious matches
+        for known_skill in self._compound_skills:
+            if known_skill in normalized:
                 normalized = known_skill
                 break
         
@@ -250,6 +340,7 @@ class KeywordExtractor:
         # Extract and normalize candidate skills
         candidate_skills_list = self._parse_skill_list(candidate_skills)
         candidate_skills_normalized = [self.normalize_skill(skill) for skill in candidate_skills_list]
+        candidate_skill_set = set(candidate_skills_normalized)
         
         matches = []
         
@@ -258,7 +349,7 @@ class KeywordExtractor:
                 continue
                 
             # Exact match
-            if job_skill in candidate_skills_normalized:
+            if job_skill in candidate_skill_set:
                 matches.append(job_skills[i])  # Return original case
                 continue
             
@@ -292,28 +383,37 @@ class KeywordExtractor:
         
         return gaps
     
+    def tokenize_skills(self, candidate_skills: str) -> List[str]:
+        """Normalized skills of a candidate's skills text, as used for matching."""
+        return [self.normalize_skill(skill) for skill in self._parse_skill_list(candidate_skills)]
+    
+    def fuzzy_match_ids(self, skill: str, others: Sequence[str]) -> List[int]:
+        """Indices of the skills in ``others`` that fuzzy-match ``skill``."""
+        return [index for index, other in enumerate(others) if self._is_fuzzy_match(skill, other)]
+    
     def _parse_skill_list(self, text: str) -> List[str]:
         """Parse a text block into individual skills."""
         if not text:
             return []
         
         # Split by common delimiters
-        skills = re.split(r'[,;•\-\*\n]', text)
+        skills = self.SKILL_DELIMITERS.split(text)
         
         # Clean each skill
         cleaned_skills = []
         for skill in skills:
             # Remove bullet points, numbers, extra whitespace
-            cleaned = re.sub(r'^[\d\.\)\s\-•\*]+', '', skill).strip()
-            cleaned = re.sub(r'[^\w\s\-\+\.\#]', '', cleaned).strip()
+            cleaned = self.LEADING_LIST_MARKER.sub('', skill).strip()
+            cleaned = self.NON_SKILL_CHARS.sub('', cleaned).strip()
             
             # Filter out non-skill text (experience, education, etc.)
             if cleaned and len(cleaned) > 1:
+                cleaned_lower = cleaned.lower()
                 # Skip if it contains experience/education keywords
-                if not any(word in cleaned.lower() for word in ['experience', 'education', 'degree', 'years', 'bachelor', 'master', 'phd']):
+                if not any(word in cleaned_lower for word in self.NON_SKILL_WORDS):
                     # Only keep if it's in known skills or looks like a skill
-                    if (cleaned.lower() in self.known_skills or 
-                        any(known_skill in cleaned.lower() for known_skill in self.known_skills) or
+                    if (cleaned_lower in self.known_skills or 
+                        any(known_skill in cleaned_lower for known_skill in self.known_skills) or
                         len(cleaned.split()) <= 3):  # Short phrases likely to be skills
                         cleaned_skills.append(cleaned)
         
@@ -328,15 +428,8 @@ class KeywordExtractor:
         nice_to_have = set()
         
         # Look for nice-to-have sections
-        nice_patterns = [
-            r"nice to have:?\s*\n?(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"preferred:?\s*\n?(.+?)(?:\n\n|\n[A-Z]|$)",
-            r"bonus:?\s*\n?(.+?)(?:\n\n|\n[A-Z]|$)",
-        ]
-        
-        for pattern in nice_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
-            for match in matches:
+        for pattern in self.NICE_TO_HAVE_PATTERNS:
+            for match in pattern.findall(text):
                 nice_to_have.update(self._parse_skill_list(match))
         
         return list(nice_to_have)
@@ -355,14 +448,7 @@ class KeywordExtractor:
             return True
         
         # Check for common abbreviations
-        abbreviations = {
-            ("javascript", "js"),
-            ("machine learning", "ml"),
-            ("artificial intelligence", "ai"),
-            ("database", "db"),
-        }
-        
-        for abbrev_pair in abbreviations:
+        for abbrev_pair in self.FUZZY_ABBREVIATIONS:
             if (skill1 in abbrev_pair and skill2 in abbrev_pair):
                 return True
         
@@ -1,13 +1,16 @@
 """Multi-agent FRR evaluation system using unified recruitment agent."""
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from contextlib import nullcontext
+from itertools import islice
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from dataclasses import asdict, dataclass
 import pandas as pd
-import json
 import asyncio
 from pathlib import Path
 
+from .candidate_stream import DEFAULT_CHUNK_SIZE, iter_candidates
 from .frr_calculator import FRRCalculator
 from .baseline_evaluator import CandidateEvaluation
+from .result_sinks import open_result_sink
 
 # Import unified agent with absolute import
 import sys
@@ -36,14 +39,17 @@ class MultiAgentEvaluator:
     
     def __init__(self, 
                  qualification_threshold: float = 0.33,  # Match baseline for fair comparison
-                 acceptance_threshold: float = 0.5):
+                 acceptance_threshold: float = 0.5,
+                 keep_results: bool = True):
         """Initialize multi-agent evaluator.
         
         Args:
             qualification_threshold: Score threshold to be considered qualified (default 40%)
             acceptance_threshold: Score threshold to be accepted (default 50%)
+            keep_results: Retain every result in the FRR calculator; FRR
+                statistics only need counts
         """
-        self.frr_calculator = FRRCalculator()
+        self.frr_calculator = FRRCalculator(keep_results=keep_results)
         
         # Initialize unified agent with required config and LLM client
         try:
@@ -195,31 +201,61 @@ class MultiAgentEvaluator:
                                       candidates_file: str, 
                                       results_file: Optional[str] = None,
                                       batch_size: int = 10) -> List[MultiAgentEvaluation]:
-        """Evaluate all candidates from CSV file using multi-agent system.
+        """Evaluate all candidates from CSV or Parquet file using multi-agent system.
+        
+        Every result is kept in the returned list, so memory grows with the
+        file; use evaluate_candidates_stream for large exports.
         
         Args:
-            candidates_file: Path to candidates CSV file
-            results_file: Optional path to save detailed results
+            candidates_file: Path to candidates CSV or Parquet file
+            results_file: Optional path to save detailed results, written
+                as each batch is evaluated; the suffix picks the format
+                (see open_result_sink)
             batch_size: Number of candidates to process concurrently
             
         Returns:
             List of MultiAgentEvaluation results
         """
-        # Load candidates
-        df = pd.read_csv(candidates_file)
-        
         results = []
-        total_candidates = len(df)
         
-        # Process candidates in batches to avoid overwhelming the system
-        for i in range(0, total_candidates, batch_size):
-            batch_candidates = df.iloc[i:i+batch_size]
+        with (open_result_sink(results_file) if results_file else nullcontext()) as sink:
+            async for batch_results in self.evaluate_candidates_stream(candidates_file, batch_size):
+                if sink:
+                    sink.write_all(asdict(result) for result in batch_results)
+                results.extend(batch_results)
+        
+        print(f"Multi-agent evaluation completed: {len(results)} candidates processed")
+        return results
+    
+    async def evaluate_candidates_stream(self,
+                                         candidates_file: str,
+                                         batch_size: int = 10,
+                                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[List[MultiAgentEvaluation]]:
+        """Evaluate a CSV or Parquet candidates file batch by batch.
+        
+        Candidates are read in chunks and each batch's results are added to
+        the FRR calculator and yielded, so memory does not grow with the file
+        unless the caller keeps the batches or the calculator keeps results.
+        
+        Args:
+            candidates_file: Path to candidates CSV or Parquet file
+            batch_size: Number of candidates to process concurrently
+            chunk_size: Candidates read from the file at a time
             
-            print(f"Processing batch {i//batch_size + 1}/{(total_candidates + batch_size - 1)//batch_size}")
+        Yields:
+            Results of each batch
+        """
+        candidates = iter_candidates(candidates_file, chunk_size)
+        batch_number = 0
+        
+        # Process candidates in batches to avoid overwhelming the system
+        while batch_candidates := list(islice(candidates, batch_size)):
+            batch_number += 1
+            print(f"Processing batch {batch_number}")
             
             # Create evaluation tasks for batch
             tasks = []
-            for _, candidate in batch_candidates.iterrows():
+            for candidate in batch_candidates:
                 # Use actual_category if available, otherwise predicted_position
                 job_category = candidate.get('actual_category')
                 if pd.isna(job_category) or not job_category or str(job_category).strip() == '':
@@ -233,37 +269,30 @@ class MultiAgentEvaluator:
                 if job_category == 'Unknown' or job_category not in self.job_descriptions:
                     continue
                 
-                task = self.evaluate_candidate(candidate.to_dict(), job_category)
+                task = self.evaluate_candidate(candidate, job_category)
                 tasks.append(task)
             
             # Execute batch concurrently
             try:
                 batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        print(f"Error in batch evaluation: {result}")
-                        continue
-                    
-                    results.append(result)
-                    
-                    # Add to FRR calculator
-                    self.frr_calculator.add_evaluation_result(
-                        candidate_id=result.candidate_id,
-                        is_qualified=result.is_qualified,
-                        system_decision=result.system_decision
-                    )
-                    
             except Exception as e:
-                print(f"Error processing batch {i//batch_size + 1}: {e}")
+                print(f"Error processing batch {batch_number}: {e}")
                 continue
-        
-        # Save detailed results if requested
-        if results_file:
-            self._save_results(results, results_file)
-        
-        print(f"Multi-agent evaluation completed: {len(results)} candidates processed")
-        return results
+            
+            evaluations = []
+            for result in batch_results:
+                if isinstance(result, Exception):
+                    print(f"Error in batch evaluation: {result}")
+                    continue
+                evaluations.append(result)
+            
+            # Add to FRR calculator
+            self.frr_calculator.add_evaluation_results(
+                [result.candidate_id for result in evaluations],
+                [result.is_qualified for result in evaluations],
+                [result.system_decision for result in evaluations]
+            )
+            yield evaluations
     
     def calculate_frr(self) -> float:
         """Calculate False Rejection Rate from all evaluations."""
@@ -336,26 +365,6 @@ class MultiAgentEvaluator:
         
         return "Below acceptance threshold"
     
-    def _save_results(self, results: List[MultiAgentEvaluation], filename: str) -> None:
-        """Save detailed evaluation results to JSON file."""
-        results_data = []
-        for result in results:
-            results_data.append({
-                'candidate_id': result.candidate_id,
-                'job_category': result.job_category,
-                'is_qualified': result.is_qualified,
-                'system_decision': result.system_decision,
-                'agent_decision': result.agent_decision,
-                'screening_score': result.screening_score,
-                'confidence_score': result.confidence_score,
-                'hidden_gem_detected': result.hidden_gem_detected,
-                'rejection_reason': result.rejection_reason,
-                'agent_rationale': result.agent_rationale
-            })
-        
-        with open(filename, 'w') as f:
-            json.dump(results_data, f, indent=2)
-    
     async def _mock_agent_evaluation(self, resume_text: str, job_requirements: str) -> Dict[str, Any]:
         """Mock agent evaluation for demonstration when UnifiedAgent is not available."""
         import asyncio
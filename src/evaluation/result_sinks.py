@@ -0,0 +1,308 @@
+"""Append-only sinks for evaluation results, and a lazy reader for them."""
+import json
+import os
+import sqlite3
+import textwrap
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .candidate_stream import import_pyarrow
+
+JSON_LINES_SUFFIXES = {".jsonl", ".ndjson"}
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+# Declared SQLite column types of values that are stored encoded
+SQLITE_JSON_TYPE = "JSON"
+SQLITE_BOOLEAN_TYPE = "BOOLEAN"
+
+
+class ResultSink(ABC):
+    """Destination that results are written to as they complete.
+
+    Records are dictionaries of JSON-compatible values. ``write_all``
+    makes its records durable before returning, so the results of an
+    interrupted run stay readable.
+    """
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one result."""
+        self.write_all([record])
+
+    @abstractmethod
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Write results."""
+
+    def close(self) -> None:
+        """Flush buffered results and release the destination."""
+
+
+class JSONLinesSink(ResultSink):
+    """One JSON object per line, appended to a file."""
+
+    def __init__(self, path: str, append: bool = False):
+        """Initialize sink.
+
+        Args:
+            path: Output file
+            append: Keep results already in the file instead of replacing them;
+                a final line cut off by an interrupted run is dropped first
+        """
+        self.path = path
+        if append:
+            _truncate_partial_line(path)
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        self._file.writelines(json.dumps(record) + '\n' for record in records)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _truncate_partial_line(path: str, block_size: int = 65536) -> None:
+    """Cut a file back to its last newline, dropping an incomplete final line."""
+    try:
+        f = open(path, 'rb+')
+    except FileNotFoundError:
+        return
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b'\n')
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
+
+
+class JSONArraySink(ResultSink):
+    """A single indented JSON array, the format of earlier results files.
+
+    Items are flushed as they are written, but the array is only valid
+    JSON once the sink is closed; prefer JSON lines for long runs.
+    """
+
+    def __init__(self, path: str):
+        """Initialize sink.
+
+        Args:
+            path: Output file, replaced if it exists
+        """
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('[')
+        self._count = 0
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        # Same output as json.dump(records, f, indent=2)
+        for record in records:
+            self._file.write(',\n' if self._count else '\n')
+            self._file.write(textwrap.indent(json.dumps(record, indent=2), '  '))
+            self._count += 1
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.write('\n]' if self._count else ']')
+        self._file.close()
+
+
+class ParquetSink(ResultSink):
+    """A directory of Parquet part files, each holding one row group.
+
+    Every part is a complete Parquet file, so parts written before an
+    interruption stay readable; at most one buffered row group is lost.
+    """
+
+    def __init__(self, path: str, append: bool = False, row_group_size: int = 10000):
+        """Initialize sink.
+
+        Args:
+            path: Output directory
+            append: Keep parts already in the directory instead of removing them
+            row_group_size: Results buffered per part file
+        """
+        # Fail before a run starts rather than at its first flush
+        self._pyarrow = import_pyarrow()
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = row_group_size
+        self._buffer: List[Dict[str, Any]] = []
+
+        parts = sorted(self.path.glob("part-*.parquet"))
+        if not append:
+            for part in parts:
+                part.unlink()
+            parts = []
+        self._next_part = int(parts[-1].stem.split("-")[1]) + 1 if parts else 0
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        self._buffer.extend(records)
+        while len(self._buffer) >= self.row_group_size:
+            self._flush(self._buffer[:self.row_group_size])
+            del self._buffer[:self.row_group_size]
+
+    def _flush(self, records: List[Dict[str, Any]]) -> None:
+        """Write records as the next part file."""
+        pa = self._pyarrow
+        part = self.path / f"part-{self._next_part:05d}.parquet"
+        tmp_part = part.with_suffix(".tmp")
+        pa.parquet.write_table(pa.Table.from_pylist(records), tmp_part)
+        # Readers never see a partially written part
+        tmp_part.rename(part)
+        self._next_part += 1
+
+    def close(self) -> None:
+        if self._buffer:
+            self._flush(self._buffer)
+            self._buffer = []
+
+
+class SQLiteSink(ResultSink):
+    """Rows of a SQLite table, committed with every write.
+
+    The table is created from the first record. Booleans and
+    list/dict values are stored as integers and JSON text, recorded in
+    the declared column types so that ``read_results`` can decode them.
+    """
+
+    def __init__(self, path: str, append: bool = False, table: str = "results"):
+        """Initialize sink.
+
+        Args:
+            path: Database file
+            append: Keep rows already in the table instead of dropping it
+            table: Table holding the results
+        """
+        self.path = path
+        self.table = table
+        self._connection = sqlite3.connect(path)
+        if not append:
+            self._connection.execute(f'DROP TABLE IF EXISTS "{table}"')
+            self._connection.commit()
+        self._columns: Optional[List[str]] = self._table_columns()
+
+    def _table_columns(self) -> Optional[List[str]]:
+        """Columns of the results table, or None if it does not exist yet."""
+        info = self._connection.execute(f'PRAGMA table_info("{self.table}")').fetchall()
+        return [row[1] for row in info] or None
+
+    def _create_table(self, record: Dict[str, Any]) -> None:
+        """Create the results table with the columns of a record."""
+        definitions = []
+        for column, value in record.items():
+            if isinstance(value, bool):
+                column_type = SQLITE_BOOLEAN_TYPE
+            elif isinstance(value, (list, dict)):
+                column_type = SQLITE_JSON_TYPE
+            else:
+                column_type = ""
+            definitions.append(f'"{column}" {column_type}'.rstrip())
+        self._connection.execute(f'CREATE TABLE "{self.table}" ({", ".join(definitions)})')
+        self._columns = list(record)
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        rows = []
+        for record in records:
+            if self._columns is None:
+                self._create_table(record)
+            rows.append(tuple(
+                json.dumps(value) if isinstance(value, (list, dict)) else value
+                for value in (record.get(column) for column in self._columns)
+            ))
+        if not rows:
+            return
+
+        placeholders = ", ".join("?" for _ in self._columns)
+        with self._connection:
+            self._connection.executemany(f'INSERT INTO "{self.table}" VALUES ({placeholders})', rows)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def open_result_sink(path: str, append: bool = False) -> ResultSink:
+    """Sink for a results path, chosen by its suffix.
+
+    ``.jsonl``/``.ndjson`` write JSON lines, ``.parquet``/``.pq`` a
+    directory of Parquet parts, ``.db``/``.sqlite``/``.sqlite3`` a SQLite
+    table, and anything else a single JSON array.
+
+    Args:
+        path: Results file or directory
+        append: Add to existing results instead of replacing them
+            (not supported for JSON arrays)
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in JSON_LINES_SUFFIXES:
+        return JSONLinesSink(path, append=append)
+    if suffix in PARQUET_SUFFIXES:
+        return ParquetSink(path, append=append)
+    if suffix in SQLITE_SUFFIXES:
+        return SQLiteSink(path, append=append)
+    if append:
+        raise ValueError(f"Cannot append to JSON array results file {path}; use JSON lines")
+    return JSONArraySink(path)
+
+
+def read_results(path: str, table: str = "results") -> Iterator[Dict[str, Any]]:
+    """Lazily read results written by any sink, in write order.
+
+    JSON lines are read line by line, Parquet parts one record batch at a
+    time and SQLite rows from a cursor. A final JSON line cut off by an
+    interrupted run is skipped. JSON arrays are loaded whole.
+
+    Args:
+        path: Results file or directory, with the suffix it was written with
+        table: SQLite table holding the results
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in JSON_LINES_SUFFIXES:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.endswith('\n'):
+                    yield json.loads(line)
+    elif suffix in PARQUET_SUFFIXES:
+        pq = import_pyarrow().parquet
+        for part in sorted(Path(path).glob("part-*.parquet")):
+            for batch in pq.ParquetFile(part).iter_batches():
+                yield from batch.to_pylist()
+    elif suffix in SQLITE_SUFFIXES:
+        connection = sqlite3.connect(path)
+        try:
+            info = connection.execute(f'PRAGMA table_info("{table}")').fetchall()
+            columns = [(row[1], row[2].upper()) for row in info]
+            for row in connection.execute(f'SELECT * FROM "{table}" ORDER BY rowid'):
+                yield {
+                    column: _decode_sqlite_value(value, column_type)
+                    for (column, column_type), value in zip(columns, row)
+                }
+        finally:
+            connection.close()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def _decode_sqlite_value(value: Any, column_type: str) -> Any:
+    """Decode a value stored by SQLiteSink."""
+    if value is None:
+        return None
+    if column_type == SQLITE_JSON_TYPE:
+        return json.loads(value)
+    if column_type == SQLITE_BOOLEAN_TYPE:
+        return bool(value)
+    return value
@@ -0,0 +1,178 @@
+"""Columnar skill matching of many candidates against job requirements."""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def map_unique(values: pd.Series, func: Callable[[Any], Any], missing: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Apply ``func`` once per distinct value of a column.
+
+    Args:
+        values: Column to map
+        func: Function of a single non-missing value
+        missing: Result for missing (NaN/None) values
+
+    Returns:
+        Result per row, and the factorized code of each row (-1 if missing)
+    """
+    codes, uniques = pd.factorize(values)
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    mapped[:] = [func(value) for value in uniques] + [missing]
+    # Missing values have code -1, which picks the trailing ``missing`` entry
+    return mapped[codes], codes
+
+
+@dataclass
+class SkillIncidence:
+    """Sparse candidate x skill incidence matrix in CSR form.
+
+    Row ``i`` holds the distinct skill ids of candidate ``i`` in
+    ``indices[indptr[i]:indptr[i + 1]]``; ``vocabulary`` maps ids to skills.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    vocabulary: List[str]
+    # Factorized skills text of each row, for memoizing per-text work
+    codes: np.ndarray
+
+    @classmethod
+    def from_texts(cls, texts: pd.Series, tokenize: Callable[[Any], Sequence[str]]) -> "SkillIncidence":
+        """Tokenize each distinct skills text once and gather the rows.
+
+        Args:
+            texts: Skills text of each candidate
+            tokenize: Normalized skills of a non-missing text
+        """
+        codes, uniques = pd.factorize(texts)
+        vocabulary: Dict[str, int] = {}
+        unique_ids = [
+            sorted({vocabulary.setdefault(token, len(vocabulary)) for token in tokenize(text) if token})
+            for text in uniques
+        ]
+
+        unique_lengths = np.array([len(ids) for ids in unique_ids] + [0], dtype=np.int64)
+        unique_indptr = np.concatenate(([0], np.cumsum(unique_lengths)))
+        unique_indices = np.fromiter(
+            (token_id for ids in unique_ids for token_id in ids), dtype=np.int64, count=unique_indptr[-1]
+        )
+
+        # Rows copy the slice of their distinct text; missing texts (code -1)
+        # pick the trailing empty slice
+        lengths = unique_lengths[codes]
+        indptr = np.concatenate(([0], np.cumsum(lengths)))
+        offsets = np.arange(indptr[-1]) + np.repeat(unique_indptr[codes] - indptr[:-1], lengths)
+
+        return cls(indptr=indptr, indices=unique_indices[offsets], vocabulary=list(vocabulary), codes=codes)
+
+    @property
+    def rows(self) -> int:
+        """Number of candidates."""
+        return len(self.indptr) - 1
+
+    def row_ids(self) -> np.ndarray:
+        """Row of every stored skill."""
+        return np.repeat(np.arange(self.rows), np.diff(self.indptr))
+
+
+class RequiredSkillMatcher:
+    """Required skills of each job, matched column-wise against candidate skills.
+
+    Required skills are normalized into a shared id space; a candidate
+    matches a required skill when it has the same normalized skill.
+    """
+
+    def __init__(self, requirements: Sequence[Sequence[str]], normalize: Callable[[str], str]):
+        """Initialize matcher.
+
+        Args:
+            requirements: Required skills of each job, indexed by job id
+            normalize: Skill normalization shared with candidate tokenization
+        """
+        self.requirements = [list(skills) for skills in requirements]
+        normalized = [[normalize(skill) for skill in skills] for skills in self.requirements]
+
+        self.skills = sorted({skill for skills in normalized for skill in skills if skill})
+        skill_ids = {skill: index for index, skill in enumerate(self.skills)}
+        # Skills that normalize to nothing can never be matched
+        self.skill_ids = [[skill_ids.get(skill, -1) for skill in skills] for skills in normalized]
+
+        self.counts = np.array([len(skills) for skills in self.requirements], dtype=np.int64)
+        # Occurrences of each normalized skill among a job's required skills
+        self.weights = np.zeros((len(self.requirements), len(self.skills)))
+        for job, ids in enumerate(self.skill_ids):
+            for skill_id in ids:
+                if skill_id >= 0:
+                    self.weights[job, skill_id] += 1
+
+    def candidate_skill_ids(self, incidence: SkillIncidence) -> np.ndarray:
+        """Required skill id of each vocabulary skill, -1 for skills no job requires."""
+        skill_ids = {skill: index for index, skill in enumerate(self.skills)}
+        return np.array([skill_ids.get(skill, -1) for skill in incidence.vocabulary], dtype=np.int64)
+
+    def skill_scores(self, incidence: SkillIncidence, jobs: np.ndarray) -> np.ndarray:
+        """Fraction of each candidate's required skills they have.
+
+        Args:
+            incidence: Candidate skills
+            jobs: Job id of each candidate
+
+        Returns:
+            Score per candidate, 0.0 for jobs without required skills
+        """
+        rows = incidence.row_ids()
+        required = self.candidate_skill_ids(incidence)[incidence.indices]
+        hits = required >= 0
+        rows, required = rows[hits], required[hits]
+
+        matched = np.bincount(
+            rows, weights=self.weights[jobs[rows], required], minlength=incidence.rows
+        )
+        counts = self.counts[jobs]
+        return np.divide(matched, counts, out=np.zeros(len(counts)), where=counts > 0)
+
+    def skill_lists(
+        self,
+        incidence: SkillIncidence,
+        jobs: np.ndarray,
+        fuzzy_match_ids: Callable[[str, Sequence[str]], List[int]]
+    ) -> Tuple[List[List[str]], List[List[str]]]:
+        """Required skills each candidate has exactly, and those they lack even approximately.
+
+        Args:
+            incidence: Candidate skills
+            jobs: Job id of each candidate
+            fuzzy_match_ids: Indices of required skills approximately matching a skill
+
+        Returns:
+            Matched and missing required skills per candidate, in requirement order
+        """
+        exact_ids = self.candidate_skill_ids(incidence)
+        fuzzy_ids: Dict[int, List[int]] = {}
+        lists: Dict[Tuple[int, int], Tuple[List[str], List[str]]] = {}
+
+        matched_lists, missing_lists = [], []
+        for row in range(incidence.rows):
+            job = int(jobs[row])
+            # Candidates with the same skills text and job share their lists
+            key = (int(incidence.codes[row]), job)
+            if key not in lists:
+                tokens = incidence.indices[incidence.indptr[row]:incidence.indptr[row + 1]]
+                exact = {int(exact_ids[token]) for token in tokens}
+                fuzzy = set()
+                for token in tokens:
+                    if token not in fuzzy_ids:
+                        fuzzy_ids[token] = fuzzy_match_ids(incidence.vocabulary[token], self.skills)
+                    fuzzy.update(fuzzy_ids[token])
+
+                pairs = list(zip(self.requirements[job], self.skill_ids[job]))
+                lists[key] = (
+                    [skill for skill, skill_id in pairs if skill_id >= 0 and skill_id in exact],
+                    [skill for skill, skill_id in pairs if skill_id < 0 or skill_id not in fuzzy]
+                )
+            matched, missing = lists[key]
+            matched_lists.append(list(matched))
+            missing_lists.append(list(missing))
+
+        return matched_lists, missing_lists
@@ -0,0 +1,105 @@
+"""FRR, false-acceptance rate and accuracy over a grid of score thresholds."""
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .result_sinks import read_results
+
+
+class ThresholdSweep:
+    """Decision statistics of one set of overall scores under any thresholds.
+
+    A candidate is qualified when their score reaches the qualification
+    threshold and accepted when it reaches the acceptance threshold, as in
+    the evaluators. Every statistic is a difference of counts of scores at
+    or above a threshold, which a binary search over the sorted scores
+    answers in O(log n), so thresholds are tuned without re-evaluating.
+    """
+
+    def __init__(self, scores: Iterable[float]):
+        """Initialize sweep.
+
+        Args:
+            scores: Overall score of each evaluated candidate
+        """
+        self.scores = np.sort(np.fromiter(scores, dtype=float))
+
+    @classmethod
+    def from_results(cls, results_file: str) -> "ThresholdSweep":
+        """Sweep over the overall scores of a results file written by a result sink."""
+        return cls(result['overall_score'] for result in read_results(results_file))
+
+    @property
+    def total(self) -> int:
+        """Number of candidates."""
+        return len(self.scores)
+
+    def count_at_or_above(self, thresholds: np.ndarray) -> np.ndarray:
+        """Number of scores at or above each threshold."""
+        return self.total - np.searchsorted(self.scores, thresholds, side='left')
+
+    def sweep(self,
+              qualification_thresholds: Iterable[float],
+              acceptance_thresholds: Iterable[float]) -> pd.DataFrame:
+        """Statistics of every pair of qualification and acceptance thresholds.
+
+        Args:
+            qualification_thresholds: Qualification thresholds to evaluate
+            acceptance_thresholds: Acceptance thresholds to evaluate
+
+        Returns:
+            One row per threshold pair with qualified, false_rejections,
+            false_acceptances, frr, far and accuracy columns
+        """
+        qualification, acceptance = np.meshgrid(
+            np.asarray(list(qualification_thresholds), dtype=float),
+            np.asarray(list(acceptance_thresholds), dtype=float),
+            indexing='ij'
+        )
+        qualification, acceptance = qualification.ravel(), acceptance.ravel()
+
+        qualified = self.count_at_or_above(qualification)
+        accepted = self.count_at_or_above(acceptance)
+        # Qualified and accepted: scores reaching both thresholds
+        both = self.count_at_or_above(np.maximum(qualification, acceptance))
+
+        false_rejections = qualified - both
+        false_acceptances = accepted - both
+        unqualified = self.total - qualified
+
+        return pd.DataFrame({
+            'qualification_threshold': qualification,
+            'acceptance_threshold': acceptance,
+            'qualified': qualified,
+            'false_rejections': false_rejections,
+            'false_acceptances': false_acceptances,
+            # Rates are 0.0 without candidates to reject or accept, as in FRRCalculator
+            'frr': np.divide(false_rejections, qualified, out=np.zeros(len(qualified)), where=qualified > 0),
+            'far': np.divide(false_acceptances, unqualified, out=np.zeros(len(qualified)), where=unqualified > 0),
+            'accuracy': np.divide(
+                self.total - false_rejections - false_acceptances, self.total,
+                out=np.zeros(len(qualified)), where=self.total > 0
+            )
+        })
+
+    def curve(self,
+              qualification_threshold: float,
+              acceptance_thresholds: Optional[Iterable[float]] = None) -> pd.DataFrame:
+        """FRR/FAR trade-off of the acceptance threshold, e.g. for ROC or DET plots.
+
+        Args:
+            qualification_threshold: Threshold defining qualified candidates
+            acceptance_thresholds: Acceptance thresholds to evaluate; defaults
+                to every distinct score plus infinity, which traces the full
+                curve from accepting everyone to rejecting everyone
+
+        Returns:
+            sweep results for the qualification threshold, ordered by
+            acceptance threshold, with a ``tpr`` (1 - FRR) column
+        """
+        if acceptance_thresholds is None:
+            acceptance_thresholds = np.append(np.unique(self.scores), np.inf)
+        curve = self.sweep([qualification_threshold], sorted(acceptance_thresholds))
+        curve['tpr'] = 1.0 - curve['frr']
+        return curve
@@ -1,9 +1,10 @@
 """Main entry point for Chainlit UI."""
 import chainlit as cl
-from typing import Optional
+from typing import Any, Dict, Optional
 from openai import AsyncOpenAI
 
 from agents.unified_agent import UnifiedRecruitmentAgent, EvaluationResult
+from agents.stage_graph import StageEvent, STAGE_FINISHED, STAGE_FAILED
 from config import get_config
 
 # Initialize configuration
@@ -187,10 +188,51 @@ async def handle_text_input(text: str):
             await cl.Message(content="📄 Stored as resume").send()
 
 
+# Pipeline stages shown while an evaluation runs, in display order
+EVALUATION_STAGES = [
+    ("job_requirements", "Analyzing job requirements"),
+    ("parsed_resume", "Parsing candidate resume"),
+    ("resume_embedding", "Embedding resume"),
+    ("screening", "Running AI-powered matching"),
+    ("critic", "Critic review for bias and hidden potential"),
+    ("evaluation", "Generating final report"),
+]
+
+
+def format_stage_progress(stage_status: Dict[str, StageEvent]) -> str:
+    """Format the progress checklist from the latest event of each stage."""
+    lines = ["🚀 **Evaluation in Progress**\n"]
+    for stage, label in EVALUATION_STAGES:
+        event = stage_status.get(stage)
+        if event is None:
+            lines.append(f"⬜ {label}")
+        elif event.status == STAGE_FINISHED:
+            lines.append(f"✅ {label} ({event.duration:.1f}s)")
+        elif event.status == STAGE_FAILED:
+            lines.append(f"❌ {label}")
+        else:
+            lines.append(f"🔄 **{label}...**")
+    return "\n".join(lines)
+
+
+def format_screening_preview(screening_result: Dict[str, Any]) -> str:
+    """Format preliminary screening results shown while the Critic runs."""
+    score_bar = create_score_bar(screening_result["score"])
+    return f"""## 🔍 **Preliminary Screening**
+*Critic review still running; final scores may change.*
+
+🔍 **Screening Score**: {screening_result['score']:.1%} {score_bar}
+
+### ✅ **Matched Skills** ({len(screening_result.get('matched_skills', []))} found)
+{format_matched_skills(screening_result.get('matched_skills', []))}
+
+### ❌ **Missing Skills** ({len(screening_result.get('missing_skills', []))} gaps)
+{format_missing_skills(screening_result.get('missing_skills', []))}
+"""
+
+
 async def evaluate_candidate(job_desc: str, resume: str):
-    """Run the evaluation and display results with enhanced loading indicators."""
-    import asyncio
-    
+    """Run the evaluation, rendering each pipeline stage as it completes."""
     agent = cl.user_session.get("agent")
     
     if not agent:
@@ -199,55 +241,28 @@ async def evaluate_candidate(job_desc: str, resume: str):
         ).send()
         return
     
-    # Show enhanced loading message
-    loading_msg = cl.Message(content="🚀 **Starting Evaluation Process**\n\n🔄 Initializing AI agents...")
+    stage_status: Dict[str, StageEvent] = {}
+    loading_msg = cl.Message(content=format_stage_progress(stage_status))
     await loading_msg.send()
     
     try:
-        # Step 1: Job requirement analysis
-        await loading_msg.update(
-            content="🚀 **Starting Evaluation Process**\n\n"
-            "📋 **Step 1/4**: Analyzing job requirements...\n"
-            "🔄 Breaking down skills, experience, and qualifications"
-        )
-        await asyncio.sleep(0.5)  # Small delay for better UX
-        
-        # Step 2: Resume parsing
-        await loading_msg.update(
-            content="🚀 **Starting Evaluation Process**\n\n"
-            "✅ **Step 1/4**: Job requirements analyzed\n"
-            "👤 **Step 2/4**: Parsing candidate resume...\n"
-            "🔄 Extracting skills, experience, and background"
-        )
-        await asyncio.sleep(0.5)
-        
-        # Step 3: Semantic matching
-        await loading_msg.update(
-            content="🚀 **Starting Evaluation Process**\n\n"
-            "✅ **Step 1/4**: Job requirements analyzed\n"
-            "✅ **Step 2/4**: Resume parsed successfully\n"
-            "🧠 **Step 3/4**: Running AI-powered matching...\n"
-            "🔄 Comparing skills and calculating compatibility"
-        )
-        
-        # Run evaluation
-        result = await agent.process_job_application(
+        result: Optional[EvaluationResult] = None
+        async for event in agent.stream_job_application(
             job_description=job_desc,
             resume_text=resume,
             job_id="JOB_001",
             candidate_id="CAND_001"
-        )
-        
-        # Step 4: Final analysis
-        await loading_msg.update(
-            content="🚀 **Starting Evaluation Process**\n\n"
-            "✅ **Step 1/4**: Job requirements analyzed\n"
-            "✅ **Step 2/4**: Resume parsed successfully\n"
-            "✅ **Step 3/4**: AI matching completed\n"
-            "🎯 **Step 4/4**: Generating final report...\n"
-            "🔄 Preparing comprehensive analysis"
-        )
-        await asyncio.sleep(0.3)
+        ):
+            stage_status[event.stage] = event
+            await loading_msg.update(content=format_stage_progress(stage_status))
+            
+            if event.status != STAGE_FINISHED:
+                continue
+            if event.stage == "screening":
+                # Show screening results without waiting for the Critic
+                await cl.Message(content=format_screening_preview(event.result)).send()
+            elif event.stage == "evaluation":
+                result = event.result
         
         # Format and display results
         await loading_msg.update(content=format_evaluation_results(result))
@@ -7,7 +7,8 @@ from .database import (
     InterviewFeedback,
     AuditLog,
     create_all_tables,
-    get_session
+    get_session,
+    migrate_schema
 )
 
 __all__ = [
@@ -18,5 +19,6 @@ __all__ = [
     "InterviewFeedback",
     "AuditLog",
     "create_all_tables",
-    "get_session"
+    "get_session",
+    "migrate_schema"
 ]
\ No newline at end of file
@@ -2,7 +2,7 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 from sqlmodel import Field, SQLModel, Session, create_engine, Relationship, Column, JSON
-from sqlalchemy import func, event
+from sqlalchemy import event, func, inspect, text
 from sqlalchemy.engine import Engine
 
 
@@ -45,6 +45,7 @@ class Resume(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     candidate_id: str = Field(index=True)
     content: str
+    content_hash: Optional[str] = Field(default=None, index=True)  # Normalized-text hash shared with ResumeCache
     parsed_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
     file_path: Optional[str] = None
     embedding_id: Optional[str] = None  # Reference to vector store
@@ -104,8 +105,28 @@ class AuditLog(SQLModel, table=True):
 
 
 def create_all_tables(engine):
-    """Create all database tables."""
+    """Create all database tables and add columns missing from existing ones."""
     SQLModel.metadata.create_all(engine)
+    migrate_schema(engine)
+
+
+def migrate_schema(engine) -> None:
+    """Add columns introduced after a table was first created.
+    
+    ``create_all`` only creates missing tables, so columns added to models
+    since are added to existing tables here.
+    """
+    inspector = inspect(engine)
+    if "resume" not in inspector.get_table_names():
+        return
+    
+    columns = {column["name"] for column in inspector.get_columns("resume")}
+    if "content_hash" not in columns:
+        with engine.begin() as connection:
+            connection.execute(text("ALTER TABLE resume ADD COLUMN content_hash VARCHAR"))
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_resume_content_hash ON resume (content_hash)"
+            ))
 
 
 def get_session(database_url: str) -> Session:
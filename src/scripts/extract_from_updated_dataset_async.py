@@ -6,26 +6,30 @@ This script processes resumes concurrently while respecting rate limits.
 
 import pandas as pd
 import os
+import sys
 import json
+from pathlib import Path
 from openai import AsyncOpenAI
 import asyncio
 import time
 from typing import Dict, Optional, List, Tuple
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from services.rate_limiter import GovernedOpenAI, LLMGovernor
+
 
 async def extract_and_predict_async(
-    client: AsyncOpenAI, 
+    client: GovernedOpenAI, 
     resume_text: str, 
-    actual_category: str,
-    semaphore: asyncio.Semaphore,
-    retry_count: int = 3
+    actual_category: str
 ) -> Optional[Dict[str, str]]:
-    """Use LLM to extract features and predict job position in one call."""
+    """Use LLM to extract features and predict job position in one call.
     
-    async with semaphore:  # Limit concurrent requests
-        # Build prompt
-        prompt = f"""Extract information from this resume and predict job position.
+    Rate limiting, concurrency and retries are handled by the client's governor.
+    """
+    # Build prompt
+    prompt = f"""Extract information from this resume and predict job position.
 
 Resume Text:
 {resume_text}
@@ -40,80 +44,71 @@ Return ONLY a JSON object with these fields:
 
 Do not include any text before or after the JSON."""
 
-        for attempt in range(retry_count):
-            try:
-                response = await client.chat.completions.create(
-                    model="google/gemini-2.5-flash",
-                    messages=[
-                        {"role": "system", "content": "You are a JSON API that extracts resume information. Output only valid JSON, no explanations or additional text."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0,
-                )
-                
-                result_text = response.choices[0].message.content.strip()
-                
-                # Try to parse JSON response
-                try:
-                    # Remove markdown code blocks if present
-                    if "```json" in result_text:
-                        result_text = result_text.replace("```json", "").replace("```", "").strip()
-                    elif "```" in result_text:
-                        result_text = result_text.replace("```", "").strip()
-                    
-                    # Remove any thinking markers if present
-                    if "◁think▷" in result_text or "◁/think▷" in result_text:
-                        # Extract JSON from the response - find the last occurrence of JSON
-                        # Split by end thinking marker and take the part after it
-                        if "◁/think▷" in result_text:
-                            parts = result_text.split("◁/think▷")
-                            if len(parts) > 1:
-                                result_text = parts[-1].strip()
-                        
-                        # Now extract JSON
-                        json_start = result_text.find("{")
-                        json_end = result_text.rfind("}") + 1
-                        if json_start != -1 and json_end > json_start:
-                            result_text = result_text[json_start:json_end]
-                    
-                    result = json.loads(result_text)
-                    return result
-                except json.JSONDecodeError as e:
-                    print(f"Failed to parse JSON: {e}")
-                    print(f"Raw response: {result_text[:200]}...")
-                    return None
-                    
-            except Exception as e:
-                if "rate" in str(e).lower() and attempt < retry_count - 1:
-                    wait_time = (attempt + 1) * 5  # Exponential backoff
-                    print(f"Rate limited. Waiting {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    print(f"API error: {e}")
-                    return None
+    try:
+        response = await client.chat.completions.create(
+            model="google/gemini-2.5-flash",
+            messages=[
+                {"role": "system", "content": "You are a JSON API that extracts resume information. Output only valid JSON, no explanations or additional text."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0,
+        )
+    except Exception as e:
+        print(f"API error: {e}")
+        return None
+    
+    # Refusals and content filters return no content; record the row as failed
+    content = response.choices[0].message.content if response.choices else None
+    if not content:
+        print("Empty response")
+        return None
+    result_text = content.strip()
+    
+    # Try to parse JSON response
+    try:
+        # Remove markdown code blocks if present
+        if "```json" in result_text:
+            result_text = result_text.replace("```json", "").replace("```", "").strip()
+        elif "```" in result_text:
+            result_text = result_text.replace("```", "").strip()
         
+        # Remove any thinking markers if present
+        if "◁think▷" in result_text or "◁/think▷" in result_text:
+            # Extract JSON from the response - find the last occurrence of JSON
+            # Split by end thinking marker and take the part after it
+            if "◁/think▷" in result_text:
+                parts = result_text.split("◁/think▷")
+                if len(parts) > 1:
+                    result_text = parts[-1].strip()
+            
+            # Now extract JSON
+            json_start = result_text.find("{")
+            json_end = result_text.rfind("}") + 1
+            if json_start != -1 and json_end > json_start:
+                result_text = result_text[json_start:json_end]
+        
+        result = json.loads(result_text)
+        return result
+    except json.JSONDecodeError as e:
+        print(f"Failed to parse JSON: {e}")
+        print(f"Raw response: {result_text[:200]}...")
         return None
 
 
 async def process_batch(
-    client: AsyncOpenAI,
-    batch_data: List[Tuple[int, pd.Series]],
-    semaphore: asyncio.Semaphore
+    client: GovernedOpenAI,
+    batch_data: List[Tuple[int, pd.Series]]
 ) -> List[Tuple[int, Optional[Dict], str]]:
     """Process a batch of resumes concurrently."""
-    tasks = []
-    
-    for idx, row in batch_data:
-        task = extract_and_predict_async(client, row['Resume'], row['Category'], semaphore)
-        tasks.append((idx, task, row['Category']))
+    results = await asyncio.gather(*[
+        extract_and_predict_async(client, row['Resume'], row['Category'])
+        for _, row in batch_data
+    ])
     
-    # Run all tasks concurrently
-    results = []
-    for idx, task, category in tasks:
-        result = await task
-        results.append((idx, result, category))
-    
-    return results
+    return [
+        (idx, result, row['Category'])
+        for (idx, row), result in zip(batch_data, results)
+    ]
 
 
 async def main():
@@ -127,10 +122,19 @@ async def main():
         print("Please add OPENROUTER_API_KEY to your .env file or set it as an environment variable")
         return
     
-    # Initialize Async OpenAI client with OpenRouter base URL
-    client = AsyncOpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key
+    # Initialize Async OpenAI client with OpenRouter base URL; the governor
+    # adapts concurrency to 429s and keeps requests under the per-minute quota
+    governor = LLMGovernor(
+        requests_per_minute=int(os.getenv("LLM_REQUESTS_PER_MINUTE", "20")),
+        tokens_per_minute=int(os.getenv("LLM_TOKENS_PER_MINUTE", "0")),
+        initial_concurrency=5
+    )
+    client = GovernedOpenAI(
+        AsyncOpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=api_key
+        ),
+        governor
     )
     
     # Load dataset
@@ -139,9 +143,7 @@ async def main():
     print(f"Loaded {len(df)} resumes")
     
     # Configuration
-    concurrent_limit = 5  # Number of concurrent requests
-    batch_size = 20  # Resumes per batch (respecting rate limit)
-    semaphore = asyncio.Semaphore(concurrent_limit)
+    batch_size = 20  # Resumes per batch
     
     results = []
     failed_count = 0
@@ -160,7 +162,7 @@ async def main():
         batch_start_time = time.time()
         
         # Process batch concurrently
-        batch_results = await process_batch(client, batch_data, semaphore)
+        batch_results = await process_batch(client, batch_data)
         
         # Process results
         for idx, result, actual_category in batch_results:
@@ -187,12 +189,13 @@ async def main():
             results_df.to_csv(output_file, index=False)
             print(f"Intermediate save complete. Successful: {len(results)}, Failed: {failed_count}")
         
-        # Rate limiting: Wait if batch processed too quickly
-        batch_duration = time.time() - batch_start_time
-        if batch_duration < 60 and batch_num < total_batches - 1:  # 60 seconds = 1 minute
-            wait_time = 60 - batch_duration
-            print(f"Waiting {wait_time:.1f}s to respect rate limit...")
-            await asyncio.sleep(wait_time)
+        # Governor status
+        metrics = governor.snapshot()
+        print(
+            f"Batch took {time.time() - batch_start_time:.1f}s | "
+            f"concurrency {metrics['concurrency_limit']}, "
+            f"throttled {metrics['throttle_events']}, retries {metrics['retries']}"
+        )
     
     # Save final results
     if results:
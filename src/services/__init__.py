@@ -1,11 +1,48 @@
 """Services for the recruitment system."""
 from .vector_store import VectorStoreService, VectorSearchResult
 from .skill_ontology import SkillOntologyService
+from .ontology_store import SkillOntology, OntologyStore, get_ontology_store
 from .redis_service import RedisService
+from .content_cache import TTLCache, content_hash
+from .resume_cache import ResumeCache, RESUME_SCHEMA_VERSION
+from .embedding_cache import (
+    EmbeddingCache,
+    EmbeddingCacheBackend,
+    MemoryEmbeddingBackend,
+    RedisEmbeddingBackend
+)
+from .semantic_matcher import SemanticSkillMatcher
+from .work_queue import ReliableQueue, ClaimedItem
+from .rate_limiter import (
+    GovernedOpenAI,
+    LLMGovernor,
+    GovernorMetrics,
+    TokenBucket,
+    AdaptiveConcurrencyLimiter
+)
 
 __all__ = [
     "VectorStoreService",
     "VectorSearchResult",
     "SkillOntologyService",
-    "RedisService"
+    "SkillOntology",
+    "OntologyStore",
+    "get_ontology_store",
+    "RedisService",
+    "ResumeCache",
+    "EmbeddingCache",
+    "EmbeddingCacheBackend",
+    "MemoryEmbeddingBackend",
+    "RedisEmbeddingBackend",
+    "SemanticSkillMatcher",
+    "ReliableQueue",
+    "ClaimedItem",
+    "GovernedOpenAI",
+    "LLMGovernor",
+    "GovernorMetrics",
+    "TokenBucket",
+    "AdaptiveConcurrencyLimiter",
+    "RESUME_SCHEMA_VERSION",
+    "TTLCache",
+    "content_hash"
 ]
\ No newline at end of file
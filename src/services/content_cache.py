@@ -0,0 +1,59 @@
+"""Content-addressed in-memory caching helpers."""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+def content_hash(text: str) -> str:
+    """Hash text after collapsing whitespace, so reformatted copies share a key."""
+    normalized = " ".join((text or "").split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class TTLCache:
+    """Bounded in-memory LRU cache whose entries expire after a TTL."""
+
+    def __init__(self, max_size: int = 1024, ttl: int = 86400):
+        """Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries before least recently used are evicted
+            ttl: Entry lifetime in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
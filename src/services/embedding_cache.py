@@ -0,0 +1,129 @@
+"""Read-through embedding cache with pluggable storage backends."""
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from .content_cache import TTLCache, content_hash
+
+if TYPE_CHECKING:
+    from .redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DTYPES = ("float32", "float16")
+
+
+def pack_embedding(embedding: Sequence[float], dtype: str = "float32") -> bytes:
+    """Pack an embedding into raw little-endian bytes (6 KB for 1536 float32s)."""
+    return np.asarray(embedding, dtype=np.dtype(dtype).newbyteorder("<")).tobytes()
+
+
+def unpack_embedding(data: bytes, dtype: str = "float32") -> List[float]:
+    """Unpack bytes produced by ``pack_embedding`` back into a list of floats."""
+    return np.frombuffer(data, dtype=np.dtype(dtype).newbyteorder("<")).tolist()
+
+
+def validate_embedding_dtype(dtype: str) -> str:
+    """Ensure the cache storage dtype is supported."""
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(
+            f"Unsupported embedding cache dtype '{dtype}', expected one of {SUPPORTED_DTYPES}"
+        )
+    return dtype
+
+
+class EmbeddingCacheBackend(ABC):
+    """Storage interface for cached embeddings keyed by string."""
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        """Return cached embeddings in key order, None for misses."""
+
+    @abstractmethod
+    async def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings by key."""
+
+
+class MemoryEmbeddingBackend(EmbeddingCacheBackend):
+    """Process-local LRU backend holding packed vectors."""
+
+    def __init__(self, max_size: int = 10000, ttl: int = 86400, dtype: str = "float32"):
+        """Initialize in-memory backend."""
+        self.dtype = validate_embedding_dtype(dtype)
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        results = []
+        for key in keys:
+            data = self.cache.get(key)
+            results.append(unpack_embedding(data, self.dtype) if data is not None else None)
+        return results
+
+    async def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        for key, embedding in embeddings.items():
+            self.cache.set(key, pack_embedding(embedding, self.dtype))
+
+
+class RedisEmbeddingBackend(EmbeddingCacheBackend):
+    """Shared backend storing packed vectors in Redis via ``RedisService``."""
+
+    def __init__(self, redis_service: "RedisService", ttl: int = 86400):
+        """Initialize Redis backend."""
+        self.redis_service = redis_service
+        self.ttl = ttl
+
+    async def get_many(self, keys: List[str]) -> List[Optional[List[float]]]:
+        return await self.redis_service.get_cached_embeddings(keys)
+
+    async def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        await self.redis_service.cache_embeddings(embeddings, ttl=self.ttl)
+
+
+class EmbeddingCache:
+    """Read-through cache consulted before calling the embedding API.
+
+    Backends are checked in order (fastest first); hits found in a later
+    backend are written back to the earlier ones.
+    """
+
+    def __init__(self, backends: List[EmbeddingCacheBackend], model: str = ""):
+        """Initialize cache with ordered backends and the embedding model name."""
+        self.backends = backends
+        self.model = model
+
+    def key(self, text: str) -> str:
+        """Cache key for text embedded with this cache's model."""
+        return content_hash(f"{self.model} {text}")
+
+    async def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Return cached embeddings for texts in order, None for misses."""
+        keys = [self.key(text) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+
+        for tier, backend in enumerate(self.backends):
+            pending = [i for i, result in enumerate(results) if result is None]
+            if not pending:
+                break
+
+            found = await backend.get_many([keys[i] for i in pending])
+            backfill = {}
+            for i, embedding in zip(pending, found):
+                if embedding is not None:
+                    results[i] = embedding
+                    backfill[keys[i]] = embedding
+
+            if backfill:
+                for faster in self.backends[:tier]:
+                    await faster.set_many(backfill)
+
+        return results
+
+    async def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        """Store embeddings for texts in every backend."""
+        if not embeddings:
+            return
+        keyed = {self.key(text): embedding for text, embedding in embeddings.items()}
+        for backend in self.backends:
+            await backend.set_many(keyed)
@@ -0,0 +1,377 @@
+"""Versioned skill ontology shared by every service in the process."""
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from .content_cache import content_hash
+from .skill_graph import SkillGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ONTOLOGY_PATH = Path(__file__).resolve().parent.parent / "data" / "skill_ontology.json"
+
+# Text split into alternating word / non-word runs; every junction is a \b
+_SEGMENT = re.compile(r"\w+|\W+")
+_WORD_CHAR = re.compile(r"\w")
+
+# Skill pairs whose proximity is memoized per ontology version
+PAIR_CACHE_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class SkillOntology:
+    """Immutable skill taxonomy.
+
+    Lookup indexes are built on first use, so loading a large taxonomy only
+    costs parsing the file. Instances are safe to share between services;
+    a reload produces a new instance rather than mutating this one.
+    """
+    version: str
+    aliases: Mapping[str, str]
+    relationships: Mapping[str, Tuple[str, ...]]
+    categories: Mapping[str, Tuple[str, ...]]
+    relationship_weights: Mapping[str, Mapping[str, float]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    hop_decay: float = 0.5
+    max_hops: int = 2
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SkillOntology":
+        """Create an ontology from its JSON representation.
+
+        Relationships map a skill to a list of related skills (weight 1.0)
+        or to an object of related skill and weight in (0, 1]. Without an
+        explicit ``version`` the content hash is used.
+        """
+        version = data.get("version") or content_hash(json.dumps(data, sort_keys=True))[:12]
+
+        relationships: Dict[str, Tuple[str, ...]] = {}
+        weights: Dict[str, Mapping[str, float]] = {}
+        for skill, related in data.get("relationships", {}).items():
+            relationships[skill] = tuple(related)
+            if isinstance(related, dict):
+                for name, weight in related.items():
+                    if not 0 < weight <= 1:
+                        raise ValueError(f"Weight of {skill} -> {name} must be in (0, 1]: {weight}")
+                weights[skill] = MappingProxyType(dict(related))
+
+        graph = data.get("graph", {})
+        return cls(
+            version=str(version),
+            aliases=MappingProxyType({
+                alias.lower(): skill for alias, skill in data.get("aliases", {}).items()
+            }),
+            relationships=MappingProxyType(relationships),
+            categories=MappingProxyType({
+                category: tuple(skills) for category, skills in data.get("categories", {}).items()
+            }),
+            relationship_weights=MappingProxyType(weights),
+            hop_decay=float(graph.get("hop_decay", 0.5)),
+            max_hops=int(graph.get("max_hops", 2))
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SkillOntology":
+        """Load an ontology from a JSON data file."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON representation accepted by ``from_dict``."""
+        return {
+            "version": self.version,
+            "aliases": dict(self.aliases),
+            "relationships": {
+                skill: dict(self.relationship_weights[skill])
+                if skill in self.relationship_weights else list(related)
+                for skill, related in self.relationships.items()
+            },
+            "categories": {category: list(skills) for category, skills in self.categories.items()},
+            "graph": {"hop_decay": self.hop_decay, "max_hops": self.max_hops}
+        }
+
+    @cached_property
+    def skill_to_category(self) -> Mapping[str, str]:
+        """Canonical skill name to category."""
+        return MappingProxyType({
+            skill: category
+            for category, skills in self.categories.items()
+            for skill in skills
+        })
+
+    def normalize(self, skill: str) -> str:
+        """Normalize skill name to canonical form."""
+        if not skill:
+            return ""
+
+        skill_lower = skill.lower().strip()
+        if skill_lower in self.aliases:
+            return self.aliases[skill_lower]
+
+        # Unknown skills with special chars (e.g. some-new-tech) keep their case
+        if "." in skill or "-" in skill:
+            return skill
+
+        return skill.title()
+
+    @cached_property
+    def _matcher(self) -> Tuple[Mapping[str, FrozenSet[str]], FrozenSet[str], int]:
+        """Searchable terms, their leading segments and the longest term length."""
+        # Aliases, canonical names and category skills, each mapped to the
+        # skills it normalizes to
+        term_skills: Dict[str, Set[str]] = defaultdict(set)
+        for alias, skill in self.aliases.items():
+            term_skills[alias].add(skill)
+
+        terms = set(self.aliases.values())
+        for skills in self.categories.values():
+            terms.update(skill.lower() for skill in skills)
+        for term in terms:
+            term_skills[term.lower()].add(self.normalize(term))
+        term_skills.pop("", None)
+
+        first_segments = frozenset(_SEGMENT.match(term).group() for term in term_skills)
+        max_length = max((len(term) for term in term_skills), default=0)
+        return (
+            MappingProxyType({term: frozenset(skills) for term, skills in term_skills.items()}),
+            first_segments,
+            max_length
+        )
+
+    def find_skills(self, text: str) -> Set[str]:
+        """Canonical skills whose terms occur in ``text`` between word boundaries.
+
+        The text is split into word and non-word segments once. Only
+        positions whose segment starts a known term are extended, so the cost
+        grows with the text length, not with the size of the taxonomy.
+        """
+        term_skills, first_segments, max_length = self._matcher
+        segments = _SEGMENT.findall(text.lower())
+        starts = first_segments.intersection(segments)
+        if not starts:
+            return set()
+
+        last = len(segments) - 1
+        skills: Set[str] = set()
+        for i, segment in enumerate(segments):
+            # The text start is only a boundary before a word character
+            if segment not in starts or (i == 0 and not _WORD_CHAR.match(segment)):
+                continue
+
+            candidate = ""
+            for k in range(i, len(segments)):
+                candidate += segments[k]
+                if len(candidate) > max_length:
+                    break
+                # Likewise for the text end after a word character
+                if candidate in term_skills and (k < last or _WORD_CHAR.match(segments[k])):
+                    skills.update(term_skills[candidate])
+
+        return skills
+
+    @cached_property
+    def _relationship_index(
+        self
+    ) -> Tuple[List[str], Dict[str, int], Dict[int, FrozenSet[int]], Dict[str, Tuple[str, ...]]]:
+        """Undirected adjacency over integer skill ids.
+
+        A skill is related to the skills it lists, to every skill listing it
+        and to that skill's other entries.
+        """
+        adjacency: Dict[str, Set[str]] = defaultdict(set)
+        for skill, related in self.relationships.items():
+            adjacency[skill].update(related)
+            for other in related:
+                adjacency[other].add(skill)
+                adjacency[other].update(related)
+
+        names = sorted(adjacency)
+        ids = {name: skill_id for skill_id, name in enumerate(names)}
+        related_ids: Dict[int, FrozenSet[int]] = {}
+        related_names: Dict[str, Tuple[str, ...]] = {}
+        for skill, related in adjacency.items():
+            related = related - {skill}
+            related_ids[ids[skill]] = frozenset(ids[name] for name in related)
+            related_names[skill] = tuple(sorted(related))
+        return names, ids, related_ids, related_names
+
+    def related_skills(self, skill: str) -> Tuple[str, ...]:
+        """Sorted skills related to the given skill."""
+        return self._relationship_index[3].get(self.normalize(skill), ())
+
+    def skill_ids(self, skills: Iterable[str]) -> FrozenSet[int]:
+        """Ids of the given skills that appear in the relationship index."""
+        ids = self._relationship_index[1]
+        found = (ids.get(self.normalize(skill)) for skill in skills)
+        return frozenset(skill_id for skill_id in found if skill_id is not None)
+
+    def related_skill_ids(self, skill: str) -> FrozenSet[int]:
+        """Ids of the skills related to the given skill."""
+        _, ids, related_ids, _ = self._relationship_index
+        return related_ids.get(ids.get(self.normalize(skill)), frozenset())
+
+    def skill_name(self, skill_id: int) -> str:
+        """Canonical name of a skill id."""
+        return self._relationship_index[0][skill_id]
+
+    @cached_property
+    def graph(self) -> SkillGraph:
+        """Weighted graph over the relationship index.
+
+        Listed skills are linked to their parent with the listed weight, and
+        to each other with the product of their weights.
+        """
+        names, ids, _, _ = self._relationship_index
+        edges: Dict[int, Dict[int, float]] = defaultdict(dict)
+
+        def connect(a: str, b: str, weight: float) -> None:
+            a, b = ids[a], ids[b]
+            if a != b and weight > edges[a].get(b, 0.0):
+                edges[a][b] = edges[b][a] = weight
+
+        for skill, related in self.relationships.items():
+            weights = self.relationship_weights.get(skill, {})
+            for i, name in enumerate(related):
+                connect(skill, name, weights.get(name, 1.0))
+                for sibling in related[i + 1:]:
+                    connect(name, sibling, weights.get(name, 1.0) * weights.get(sibling, 1.0))
+
+        return SkillGraph(len(names), dict(edges), self.hop_decay, self.max_hops)
+
+    @cached_property
+    def _pair_proximity(self) -> Callable[[str, str], float]:
+        @lru_cache(maxsize=PAIR_CACHE_SIZE)
+        def proximity(skill: str, other: str) -> float:
+            skill, other = self.normalize(skill), self.normalize(other)
+            if skill == other:
+                return 1.0
+            ids = self._relationship_index[1]
+            if skill not in ids or other not in ids:
+                return 0.0
+            return self.graph.proximity(ids[skill], ids[other])
+        return proximity
+
+    def skill_proximity(self, skill: str, other: str) -> float:
+        """Proximity in [0, 1] of two skills through the skill graph."""
+        return self._pair_proximity(skill, other)
+
+    def closest_skills(
+        self,
+        skills: Iterable[str],
+        candidates: Iterable[str]
+    ) -> Dict[str, Tuple[str, float]]:
+        """Closest other candidate skill to each skill, with its proximity.
+
+        Skills with no related candidate within reach are omitted. Ties go
+        to the alphabetically first candidate.
+        """
+        ids = self._relationship_index[1]
+        targets = [
+            (name, candidate)
+            for name, candidate in sorted((self.normalize(c), c) for c in candidates)
+            if name in ids
+        ]
+        sources = [(skill, ids.get(self.normalize(skill))) for skill in skills]
+        sources = [(skill, skill_id) for skill, skill_id in sources if skill_id is not None]
+
+        matches = self.graph.best_matches(
+            [skill_id for _, skill_id in sources],
+            [ids[name] for name, _ in targets]
+        )
+        return {
+            skill: (targets[index][1], proximity)
+            for (skill, _), (index, proximity) in zip(sources, matches)
+            if proximity > 0
+        }
+
+
+class OntologyStore:
+    """Current ontology of a data file, reloaded when the file changes.
+
+    ``current`` checks the file's modification time at most once per
+    ``check_interval`` seconds. A file that fails to load is logged and the
+    previous ontology stays in use.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        check_interval: float = 5.0
+    ):
+        """Initialize store and load the ontology.
+
+        Args:
+            path: JSON data file (defaults to the built-in taxonomy)
+            check_interval: Seconds between change checks; negative disables reloading
+        """
+        self.path = Path(path or DEFAULT_ONTOLOGY_PATH)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._checked_at = time.monotonic()
+        self._ontology = self._load()
+
+    @property
+    def version(self) -> str:
+        """Version of the ontology currently in use."""
+        return self._ontology.version
+
+    def current(self) -> SkillOntology:
+        """The latest successfully loaded ontology."""
+        if (
+            self.check_interval >= 0
+            and time.monotonic() - self._checked_at >= self.check_interval
+        ):
+            self.reload(force=False)
+        return self._ontology
+
+    def reload(self, force: bool = True) -> SkillOntology:
+        """Reload the data file, or only if it changed when ``force`` is False."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                if force or self._file_signature() != self._signature:
+                    self._ontology = self._load()
+            except (OSError, ValueError) as e:
+                logger.error(f"Keeping skill ontology {self._ontology.version}: {e}")
+            return self._ontology
+
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> SkillOntology:
+        signature = self._file_signature()
+        started = time.perf_counter()
+        ontology = SkillOntology.load(self.path)
+        self._signature = signature
+        logger.info(
+            f"Loaded skill ontology {ontology.version} from {self.path} "
+            f"({len(ontology.aliases)} aliases, {(time.perf_counter() - started) * 1000:.1f} ms)"
+        )
+        return ontology
+
+
+_stores: Dict[Path, OntologyStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ontology_store(
+    path: Optional[Union[str, Path]] = None,
+    check_interval: float = 5.0
+) -> OntologyStore:
+    """Process-wide store for a data file, created on first use."""
+    key = Path(path or DEFAULT_ONTOLOGY_PATH).resolve()
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = OntologyStore(key, check_interval=check_interval)
+        return _stores[key]
@@ -0,0 +1,325 @@
+"""Adaptive rate limiting and concurrency control for LLM and embedding calls."""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to pre-charge the tokens/min bucket
+CHARS_PER_TOKEN = 4
+
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Return True if the error is a provider throttle (HTTP 429)."""
+    if isinstance(error, openai.RateLimitError):
+        return True
+    return getattr(error, "status_code", None) == 429
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate_per_minute``.
+
+    Acquiring more than is available waits for the refill. Spending more than
+    was pre-charged (see ``consume``) drives the bucket negative so the debt
+    is paid back before later requests go through.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """Initialize bucket.
+
+        Args:
+            rate_per_minute: Sustained refill rate; 0 or less disables limiting
+            capacity: Maximum burst size (defaults to one minute of refill)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until ``amount`` tokens are available and take them.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        # A single request larger than the bucket may still proceed once full
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+    def consume(self, amount: float) -> None:
+        """Charge (or refund, if negative) tokens without waiting."""
+        if not self.enabled:
+            return
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit adjusted by additive-increase/multiplicative-decrease.
+
+    Each success raises the limit by ``1 / limit`` (about +1 per window of
+    successful calls); a throttle multiplies it by ``decrease_factor`` at
+    most once per congestion window. Throttles of calls acquired before the
+    last decrease belong to the same burst and are ignored, so a 429 storm
+    across N in-flight calls halves the limit once rather than N times.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease_factor: float = 0.5
+    ):
+        """Initialize limiter."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.in_flight = 0
+        self.waiting = 0
+        self.decreases = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> int:
+        """Wait for a free slot under the current limit.
+
+        Returns:
+            Congestion window the call was admitted in, to pass to ``release``
+        """
+        async with self._condition:
+            self.waiting += 1
+            try:
+                await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+            return self.decreases
+
+    async def release(self, throttled: bool = False, window: Optional[int] = None) -> None:
+        """Free a slot and adapt the limit to the call's outcome.
+
+        Args:
+            throttled: The call was throttled by the provider
+            window: Value returned by ``acquire``; throttles from windows
+                before the last decrease do not decrease the limit again
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                if window is None or window == self.decreases:
+                    self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                    self.decreases += 1
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._condition.notify_all()
+
+
+@dataclass
+class GovernorMetrics:
+    """Counters describing governor activity."""
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    throttle_events: int = 0
+    wait_seconds: float = 0.0
+
+
+class LLMGovernor:
+    """Shared gate for outbound LLM and embedding requests.
+
+    Every call passes a requests/min bucket, a tokens/min bucket and an AIMD
+    concurrency limiter. Throttled and transient failures are retried with
+    full-jitter exponential backoff.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 500,
+        tokens_per_minute: float = 200000,
+        initial_concurrency: int = 8,
+        max_concurrency: int = 64,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0
+    ):
+        """Initialize governor.
+
+        Args:
+            requests_per_minute: Request quota (0 disables the request bucket)
+            tokens_per_minute: Token quota (0 disables the token bucket)
+            initial_concurrency: Starting number of concurrent calls
+            max_concurrency: Upper bound the AIMD limit may grow to
+            max_retries: Retries per call after the first attempt
+            base_delay: Initial backoff in seconds
+            max_delay: Backoff ceiling in seconds
+        """
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial=initial_concurrency, maximum=max_concurrency
+        )
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.metrics = GovernorMetrics()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LLMGovernor":
+        """Create a governor from application config."""
+        return cls(
+            requests_per_minute=config.get("llm_requests_per_minute", 500),
+            tokens_per_minute=config.get("llm_tokens_per_minute", 200000),
+            initial_concurrency=config.get("llm_initial_concurrency", 8),
+            max_concurrency=config.get("llm_max_concurrency", 64),
+            max_retries=config.get("llm_max_retries", 5)
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a concurrency slot."""
+        return self.concurrency.waiting
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics, queue depth and concurrency limit."""
+        return {
+            **asdict(self.metrics),
+            "queue_depth": self.queue_depth,
+            "in_flight": self.concurrency.in_flight,
+            "concurrency_limit": int(self.concurrency.limit)
+        }
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        estimated_tokens: int = 0,
+        **kwargs: Any
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` under the rate and concurrency limits."""
+        self.metrics.requests += 1
+
+        for attempt in range(self.max_retries + 1):
+            window = await self.concurrency.acquire()
+            throttled = False
+            try:
+                self.metrics.wait_seconds += await self.request_bucket.acquire(1)
+                self.metrics.wait_seconds += await self.token_bucket.acquire(estimated_tokens)
+                response = await func(*args, **kwargs)
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                if throttled:
+                    self.metrics.throttle_events += 1
+                if not (throttled or isinstance(e, RETRYABLE_ERRORS)) or attempt == self.max_retries:
+                    self.metrics.failures += 1
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    f"LLM call failed ({type(e).__name__}), retry {attempt + 1} in {delay:.1f}s"
+                )
+            else:
+                self._reconcile_tokens(response, estimated_tokens)
+                self.metrics.successes += 1
+                return response
+            finally:
+                await self.concurrency.release(throttled=throttled, window=window)
+
+            self.metrics.retries += 1
+            await asyncio.sleep(delay)
+
+    def _reconcile_tokens(self, response: Any, estimated_tokens: int) -> None:
+        """Charge the token bucket for the difference between actual and estimated usage."""
+        usage = getattr(response, "usage", None)
+        total = getattr(usage, "total_tokens", None)
+        if isinstance(total, int):
+            self.token_bucket.consume(total - estimated_tokens)
+
+
+def estimate_tokens(value: Any) -> int:
+    """Estimate prompt tokens for a string, list of strings or chat messages."""
+    if isinstance(value, str):
+        return len(value) // CHARS_PER_TOKEN + 1
+    if isinstance(value, dict):
+        return estimate_tokens(value.get("content") or "")
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_tokens(item) for item in value)
+    return 0
+
+
+class _GovernedCompletions:
+    def __init__(self, completions: Any, governor: LLMGovernor):
+        self._completions = completions
+        self._governor = governor
+
+    async def create(self, **kwargs: Any) -> Any:
+        estimated = estimate_tokens(kwargs.get("messages", [])) + kwargs.get("max_tokens", 0)
+        return await self._governor.call(
+            self._completions.create, estimated_tokens=estimated, **kwargs
+        )
+
+
+class _GovernedChat:
+    def __init__(self, chat: Any, governor: LLMGovernor):
+        self.completions = _GovernedCompletions(chat.completions, governor)
+
+
+class _GovernedEmbeddings:
+    def __init__(self, embeddings: Any, governor: LLMGovernor):
+        self._embeddings = embeddings
+        self._governor = governor
+
+    async def create(self, **kwargs: Any) -> Any:
+        return await self._governor.call(
+            self._embeddings.create,
+            estimated_tokens=estimate_tokens(kwargs.get("input", "")),
+            **kwargs
+        )
+
+
+class GovernedOpenAI:
+    """AsyncOpenAI-compatible wrapper routing chat and embedding calls through a governor."""
+
+    def __init__(self, client: Any, governor: LLMGovernor):
+        """Wrap ``client`` so ``chat.completions.create`` and ``embeddings.create`` are governed."""
+        self.client = client
+        self.governor = governor
+        self.chat = _GovernedChat(client.chat, governor)
+        self.embeddings = _GovernedEmbeddings(client.embeddings, governor)
@@ -5,9 +5,18 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.client import NEVER_DECODE
+
+from .embedding_cache import pack_embedding, unpack_embedding, validate_embedding_dtype
+from .work_queue import ReliableQueue
 
 logger = logging.getLogger(__name__)
 
+# Workflow hash fields holding per-stage state are named "stage:<stage name>"
+# and those holding resumable stage outputs "checkpoint:<stage name>"
+STAGE_FIELD_PREFIX = "stage:"
+CHECKPOINT_FIELD_PREFIX = "checkpoint:"
+
 
 class RedisService:
     """Service for managing Redis connections and operations."""
@@ -17,6 +26,20 @@ class RedisService:
         self.config = config
         self.client: Optional[Redis] = None
         self.channel = config.get("redis_channel", "hitl_queue")
+        self.embedding_dtype = validate_embedding_dtype(
+            config.get("embedding_cache_dtype", "float32")
+        )
+        
+        # Optional write-behind buffer of workflow hash fields
+        self.workflow_write_behind = config.get("workflow_write_behind", False)
+        self._pending_workflow_state: Dict[str, Dict[str, str]] = {}
+        
+        # Workflows holding checkpoints expire unless completed, so an
+        # abandoned run cannot be resumed with outputs of an older pipeline
+        self.checkpoint_ttl = config.get("workflow_checkpoint_ttl", 86400)
+        
+        # Created on first use, once the client is connected
+        self._evaluation_queue: Optional[ReliableQueue] = None
     
     async def initialize(self) -> None:
         """Initialize Redis connection."""
@@ -44,22 +67,127 @@ class RedisService:
     async def set_workflow_state(
         self,
         workflow_id: str,
-        state: Dict[str, Any]
+        state: Dict[str, Any],
+        stage: Optional[str] = None
     ) -> None:
-        """Store workflow state."""
-        key = f"workflow:{workflow_id}"
+        """Store workflow state.
+        
+        ``state`` replaces the workflow's current state. When ``stage`` is
+        given it is also kept in its own ``stage:<name>`` field, so the output
+        of every stage survives later updates. All fields go out in a single
+        HSET, or are buffered until ``flush_workflow_state`` when write-behind
+        is enabled.
+        """
         state_json = json.dumps(state)
-        await self.client.hset(key, "state", state_json)
-        await self.client.hset(key, "updated_at", datetime.now(timezone.utc).isoformat())
+        fields = {
+            "state": state_json,
+            "updated_at": datetime.now(timezone.utc).isoformat()
+        }
+        if stage:
+            fields[f"{STAGE_FIELD_PREFIX}{stage}"] = state_json
+        
+        await self._write_workflow_fields(workflow_id, fields)
+    
+    async def save_stage_checkpoint(
+        self,
+        workflow_id: str,
+        stage: str,
+        output: Any
+    ) -> None:
+        """Store a completed stage's output so the workflow can resume after it.
+        
+        Each checkpoint renews the workflow's expiry of ``checkpoint_ttl``
+        seconds, which ``clear_stage_checkpoints`` removes again.
+        """
+        await self._write_workflow_fields(workflow_id, {
+            f"{CHECKPOINT_FIELD_PREFIX}{stage}": json.dumps(output)
+        })
+        if not self.workflow_write_behind:
+            await self.client.expire(f"workflow:{workflow_id}", self.checkpoint_ttl)
+    
+    async def get_stage_checkpoints(self, workflow_id: str) -> Dict[str, Any]:
+        """Retrieve checkpointed stage outputs of a workflow, keyed by stage name."""
+        return await self._get_workflow_fields(workflow_id, CHECKPOINT_FIELD_PREFIX)
+    
+    async def clear_stage_checkpoints(self, workflow_id: str) -> None:
+        """Delete checkpointed stage outputs of a completed workflow.
+        
+        Checkpoints only resume an interrupted run; a later run of the same
+        application must not restore them. The workflow's checkpoint expiry
+        is removed with them, so its recorded state is kept.
+        """
+        pending = self._pending_workflow_state.get(workflow_id, {})
+        for field in [field for field in pending if field.startswith(CHECKPOINT_FIELD_PREFIX)]:
+            del pending[field]
+        
+        key = f"workflow:{workflow_id}"
+        fields = [
+            field for field in await self.client.hkeys(key)
+            if field.startswith(CHECKPOINT_FIELD_PREFIX)
+        ]
+        pipe = self.client.pipeline(transaction=False)
+        if fields:
+            pipe.hdel(key, *fields)
+        pipe.persist(key)
+        await pipe.execute()
+    
+    async def _write_workflow_fields(self, workflow_id: str, fields: Dict[str, str]) -> None:
+        """Write workflow hash fields, or buffer them in write-behind mode."""
+        if self.workflow_write_behind:
+            self._pending_workflow_state.setdefault(workflow_id, {}).update(fields)
+            return
+        
+        await self.client.hset(f"workflow:{workflow_id}", mapping=fields)
+    
+    async def _get_workflow_fields(self, workflow_id: str, prefix: str) -> Dict[str, Any]:
+        """Read JSON workflow hash fields with a prefix, including buffered writes."""
+        fields = await self.client.hgetall(f"workflow:{workflow_id}")
+        fields.update(self._pending_workflow_state.get(workflow_id, {}))
+        return {
+            field[len(prefix):]: json.loads(value)
+            for field, value in fields.items()
+            if field.startswith(prefix)
+        }
+    
+    async def flush_workflow_state(self, workflow_id: Optional[str] = None) -> None:
+        """Write buffered workflow state in one pipelined round-trip.
+        
+        Args:
+            workflow_id: Flush only this workflow (default: all buffered workflows)
+        """
+        if workflow_id is None:
+            pending, self._pending_workflow_state = self._pending_workflow_state, {}
+        elif workflow_id in self._pending_workflow_state:
+            pending = {workflow_id: self._pending_workflow_state.pop(workflow_id)}
+        else:
+            return
+        
+        if not pending:
+            return
+        
+        pipe = self.client.pipeline(transaction=False)
+        for buffered_id, fields in pending.items():
+            pipe.hset(f"workflow:{buffered_id}", mapping=fields)
+            if any(field.startswith(CHECKPOINT_FIELD_PREFIX) for field in fields):
+                pipe.expire(f"workflow:{buffered_id}", self.checkpoint_ttl)
+        await pipe.execute()
     
     async def get_workflow_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve workflow state."""
+        buffered = self._pending_workflow_state.get(workflow_id, {}).get("state")
+        if buffered:
+            return json.loads(buffered)
+        
         key = f"workflow:{workflow_id}"
         state_json = await self.client.hget(key, "state")
         if state_json:
             return json.loads(state_json)
         return None
     
+    async def get_workflow_stages(self, workflow_id: str) -> Dict[str, Dict[str, Any]]:
+        """Retrieve the recorded state of each stage of a workflow, keyed by stage name."""
+        return await self._get_workflow_fields(workflow_id, STAGE_FIELD_PREFIX)
+    
     async def publish_hitl_request(
         self,
         request_id: str,
@@ -74,6 +202,18 @@ class RedisService:
         await self.client.publish(self.channel, json.dumps(message))
         logger.info(f"Published HITL request: {request_id}")
     
+    @property
+    def evaluation_queue(self) -> ReliableQueue:
+        """Reliable queue of (job, resume) evaluations shared by all workers."""
+        if self._evaluation_queue is None:
+            self._evaluation_queue = ReliableQueue(
+                self.client,
+                "evaluation_queue",
+                visibility_timeout=self.config.get("evaluation_queue_visibility_timeout", 300),
+                max_attempts=self.config.get("evaluation_queue_max_attempts", 3)
+            )
+        return self._evaluation_queue
+    
     async def add_to_evaluation_queue(
         self,
         job_id: str,
@@ -81,19 +221,43 @@ class RedisService:
         priority: int = 0
     ) -> None:
         """Add evaluation to processing queue."""
-        score = -priority  # Redis sorts ascending, we want high priority first
-        member = f"{job_id}:{resume_id}"
-        await self.client.zadd("evaluation_queue", {member: score})
+        await self.evaluation_queue.enqueue(f"{job_id}:{resume_id}", priority)
     
     async def get_next_evaluation(self) -> Optional[Tuple[str, str]]:
-        """Get next evaluation from queue."""
-        items = await self.client.zrange("evaluation_queue", 0, 0)
-        if items:
-            item = items[0]
-            await self.client.zrem("evaluation_queue", item)
-            job_id, resume_id = item.split(":")
-            return job_id, resume_id
-        return None
+        """Claim the next evaluation from the queue.
+        
+        The evaluation is leased, not removed: acknowledge it with
+        ``ack_evaluation`` or release it with ``fail_evaluation``, otherwise
+        it is redelivered once its visibility timeout expires.
+        """
+        claimed = await self.claim_evaluations(1)
+        return claimed[0] if claimed else None
+    
+    async def claim_evaluations(self, count: int) -> List[Tuple[str, str]]:
+        """Atomically claim up to ``count`` evaluations as (job_id, resume_id) pairs."""
+        items = await self.evaluation_queue.claim(count)
+        return [tuple(item.member.split(":", 1)) for item in items]
+    
+    async def extend_evaluation(self, job_id: str, resume_id: str) -> None:
+        """Renew the lease of a claimed evaluation that is still in progress."""
+        await self.evaluation_queue.extend(f"{job_id}:{resume_id}")
+    
+    async def ack_evaluation(self, job_id: str, resume_id: str) -> None:
+        """Mark a claimed evaluation as completed."""
+        await self.evaluation_queue.ack(f"{job_id}:{resume_id}")
+    
+    async def fail_evaluation(
+        self,
+        job_id: str,
+        resume_id: str,
+        error: str = ""
+    ) -> Optional[bool]:
+        """Release a failed evaluation for redelivery or dead-lettering."""
+        return await self.evaluation_queue.fail(f"{job_id}:{resume_id}", error)
+    
+    def _embedding_key(self, text_hash: str) -> str:
+        """Key of a packed embedding; the dtype keeps other encodings from being read as hits."""
+        return f"embedding:{self.embedding_dtype}:{text_hash}"
     
     async def cache_embedding(
         self,
@@ -101,20 +265,99 @@ class RedisService:
         embedding: List[float],
         ttl: int = 86400  # 24 hours
     ) -> None:
-        """Cache text embedding."""
-        key = f"embedding:{text_hash}"
+        """Cache text embedding as packed binary floats."""
+        key = self._embedding_key(text_hash)
         await self.client.setex(
             key,
             ttl,
-            json.dumps(embedding)
+            pack_embedding(embedding, self.embedding_dtype)
         )
     
     async def get_cached_embedding(self, text_hash: str) -> Optional[List[float]]:
         """Retrieve cached embedding."""
-        key = f"embedding:{text_hash}"
-        embedding_json = await self.client.get(key)
-        if embedding_json:
-            return json.loads(embedding_json)
+        key = self._embedding_key(text_hash)
+        data = await self.client.execute_command("GET", key, **{NEVER_DECODE: True})
+        if data:
+            return unpack_embedding(data, self.embedding_dtype)
+        return None
+    
+    async def cache_embeddings(
+        self,
+        embeddings: Dict[str, List[float]],
+        ttl: int = 86400  # 24 hours
+    ) -> None:
+        """Cache many embeddings in one pipelined round-trip."""
+        if not embeddings:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for text_hash, embedding in embeddings.items():
+            pipe.setex(
+                self._embedding_key(text_hash),
+                ttl,
+                pack_embedding(embedding, self.embedding_dtype)
+            )
+        await pipe.execute()
+    
+    async def get_cached_embeddings(
+        self,
+        text_hashes: List[str]
+    ) -> List[Optional[List[float]]]:
+        """Retrieve many cached embeddings with a single MGET."""
+        if not text_hashes:
+            return []
+        keys = [self._embedding_key(text_hash) for text_hash in text_hashes]
+        values = await self.client.execute_command("MGET", *keys, **{NEVER_DECODE: True})
+        return [
+            unpack_embedding(data, self.embedding_dtype) if data else None
+            for data in values
+        ]
+    
+    async def cache_job_requirements(
+        self,
+        job_hash: str,
+        requirements: Dict[str, Any],
+        ttl: int = 86400  # 24 hours
+    ) -> None:
+        """Cache structured job requirements by job description hash."""
+        key = f"job_requirements:{job_hash}"
+        await self.client.setex(
+            key,
+            ttl,
+            json.dumps(requirements)
+        )
+    
+    async def get_cached_job_requirements(self, job_hash: str) -> Optional[Dict[str, Any]]:
+        """Retrieve cached job requirements."""
+        key = f"job_requirements:{job_hash}"
+        requirements_json = await self.client.get(key)
+        if requirements_json:
+            return json.loads(requirements_json)
+        return None
+    
+    async def invalidate_job_requirements(self, job_hash: str) -> None:
+        """Remove cached job requirements."""
+        await self.client.delete(f"job_requirements:{job_hash}")
+    
+    async def cache_parsed_resume(
+        self,
+        resume_key: str,
+        parsed: Dict[str, Any],
+        ttl: int = 604800  # 7 days
+    ) -> None:
+        """Cache parsed resume by schema version and content hash."""
+        key = f"parsed_resume:{resume_key}"
+        await self.client.setex(
+            key,
+            ttl,
+            json.dumps(parsed)
+        )
+    
+    async def get_cached_parsed_resume(self, resume_key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve cached parsed resume."""
+        key = f"parsed_resume:{resume_key}"
+        parsed_json = await self.client.get(key)
+        if parsed_json:
+            return json.loads(parsed_json)
         return None
     
     async def increment_metric(self, metric_name: str) -> int:
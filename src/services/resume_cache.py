@@ -0,0 +1,81 @@
+"""Content-addressed cache for parsed resumes."""
+import logging
+from typing import Dict, Any, Optional
+
+from .content_cache import TTLCache, content_hash
+from .redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the resume parsing prompt or output shape changes so that
+# entries produced by the old prompt are no longer served.
+RESUME_SCHEMA_VERSION = 1
+
+
+class ResumeCache:
+    """Cache parsed resumes by schema version and normalized resume text hash.
+
+    Entries are checked in memory first, then in Redis. Resume embeddings are
+    cached separately by ``EmbeddingCache`` in front of the embedding API.
+    """
+
+    def __init__(self, redis_service: RedisService, config: Dict[str, Any]):
+        """Initialize resume cache."""
+        self.redis_service = redis_service
+        self.schema_version = config.get("resume_schema_version", RESUME_SCHEMA_VERSION)
+        self.ttl = config.get("resume_cache_ttl", 7 * 86400)
+
+        self.parsed = TTLCache(
+            max_size=config.get("resume_cache_size", 1024),
+            ttl=self.ttl
+        )
+
+    def parsed_key(self, resume_text: str) -> str:
+        """Cache key for a parsed resume under the current schema version."""
+        return f"v{self.schema_version}:{content_hash(resume_text)}"
+
+    async def get_parsed(self, resume_text: str) -> Optional[Dict[str, Any]]:
+        """Return the parsed resume for this text, if cached."""
+        key = self.parsed_key(resume_text)
+
+        parsed = self.parsed.get(key)
+        if parsed is None:
+            parsed = await self.redis_service.get_cached_parsed_resume(key)
+            if parsed is not None:
+                self.parsed.set(key, parsed)
+
+        return parsed
+
+    async def set_parsed(self, resume_text: str, parsed: Dict[str, Any]) -> None:
+        """Cache a parsed resume in memory and Redis."""
+        key = self.parsed_key(resume_text)
+        self.parsed.set(key, parsed)
+        await self.redis_service.cache_parsed_resume(key, parsed, ttl=self.ttl)
+
+    def stamp(self, resume_text: str, parsed: Dict[str, Any]) -> Dict[str, Any]:
+        """Return parsed data stamped for storage in ``Resume.parsed_data``."""
+        return {
+            **parsed,
+            "schema_version": self.schema_version,
+            "content_hash": content_hash(resume_text)
+        }
+
+    def load_record(self, resume_text: str, parsed_data: Dict[str, Any]) -> bool:
+        """Seed the memory cache from a stored ``Resume.parsed_data`` value.
+
+        Returns True if the record was stamped with the current schema version
+        and matches the resume text, False if it is stale and was ignored.
+        """
+        if not parsed_data:
+            return False
+        if parsed_data.get("schema_version") != self.schema_version:
+            return False
+        if parsed_data.get("content_hash") != content_hash(resume_text):
+            return False
+
+        parsed = {
+            k: v for k, v in parsed_data.items()
+            if k not in ("schema_version", "content_hash")
+        }
+        self.parsed.set(self.parsed_key(resume_text), parsed)
+        return True
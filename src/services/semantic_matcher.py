@@ -0,0 +1,80 @@
+"""Embedding-based skill matching with vectorized cosine similarity."""
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+def cosine_similarity_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cosine similarity of every row of ``a`` with every row of ``b``.
+
+    Rows are normalized once and compared with a single matrix product.
+    Zero vectors have zero similarity to everything.
+    """
+    a_norms = np.linalg.norm(a, axis=1, keepdims=True)
+    b_norms = np.linalg.norm(b, axis=1, keepdims=True)
+    a = np.divide(a, a_norms, out=np.zeros_like(a), where=a_norms > 0)
+    b = np.divide(b, b_norms, out=np.zeros_like(b), where=b_norms > 0)
+    return a @ b.T
+
+
+def greedy_assignment(
+    similarity: np.ndarray,
+    threshold: float
+) -> List[Tuple[int, int, float]]:
+    """One-to-one matching of rows to columns, highest similarity first.
+
+    Returns:
+        (row, column, similarity) for each pair at or above ``threshold``
+    """
+    rows, cols = np.nonzero(similarity >= threshold)
+    order = np.argsort(-similarity[rows, cols], kind="stable")
+
+    used_rows, used_cols = set(), set()
+    pairs = []
+    for row, col in zip(rows[order], cols[order]):
+        if row in used_rows or col in used_cols:
+            continue
+        used_rows.add(row)
+        used_cols.add(col)
+        pairs.append((int(row), int(col), float(similarity[row, col])))
+    return pairs
+
+
+class SemanticSkillMatcher:
+    """Match required skills to candidate skills by embedding similarity."""
+
+    def __init__(self, threshold: float = 0.8):
+        """Initialize matcher.
+
+        Args:
+            threshold: Minimum cosine similarity for two skills to match
+        """
+        self.threshold = threshold
+
+    def match(
+        self,
+        required: Dict[str, Sequence[float]],
+        candidates: Dict[str, Sequence[float]]
+    ) -> List[Tuple[str, str, float]]:
+        """Assign each required skill at most one distinct candidate skill.
+
+        Args:
+            required: Required skill to embedding
+            candidates: Candidate skill to embedding
+
+        Returns:
+            (required skill, candidate skill, similarity), best matches first
+        """
+        if not required or not candidates:
+            return []
+
+        required_names = list(required)
+        candidate_names = list(candidates)
+        similarity = cosine_similarity_matrix(
+            np.asarray([required[name] for name in required_names], dtype=np.float32),
+            np.asarray([candidates[name] for name in candidate_names], dtype=np.float32)
+        )
+        return [
+            (required_names[row], candidate_names[col], score)
+            for row, col, score in greedy_assignment(similarity, self.threshold)
+        ]
@@ -0,0 +1,87 @@
+"""Weighted skill graph with bounded multi-hop proximity."""
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+class SkillGraph:
+    """Proximity between skills connected by weighted relationships.
+
+    The proximity of a path is the product of its edge weights, decayed by
+    ``hop_decay`` for every hop after the first; the proximity of two skills
+    is that of their best path of at most ``max_hops`` hops, and 1.0 for a
+    skill and itself. Rows of the proximity matrix are computed on first use
+    and kept in an LRU cache, so scoring looks up precomputed vectors
+    instead of walking the graph.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        edges: Dict[int, Dict[int, float]],
+        hop_decay: float = 0.5,
+        max_hops: int = 2,
+        cache_size: int = 512
+    ):
+        """Initialize graph.
+
+        Args:
+            size: Number of skill ids
+            edges: Adjacency of skill id to neighbor id and weight in (0, 1]
+            hop_decay: Multiplier applied for each hop after the first
+            max_hops: Longest path considered
+            cache_size: Proximity rows kept in memory
+        """
+        self.size = size
+        self.hop_decay = hop_decay
+        self.max_hops = max_hops
+        self._edges = edges
+        self.row = lru_cache(maxsize=cache_size)(self._compute_row)
+
+    def _compute_row(self, source: int) -> np.ndarray:
+        """Proximity of ``source`` to every skill, by hop-bounded max-product search."""
+        best = {source: 1.0}
+        frontier = {source: 1.0}
+        for hop in range(self.max_hops):
+            scale = 1.0 if hop == 0 else self.hop_decay
+            reached: Dict[int, float] = {}
+            for node, value in frontier.items():
+                for neighbor, weight in self._edges.get(node, {}).items():
+                    proximity = value * weight * scale
+                    # Paths no better than an earlier one, which had more hops
+                    # left, cannot lead anywhere better
+                    if proximity > best.get(neighbor, 0.0) and proximity > reached.get(neighbor, 0.0):
+                        reached[neighbor] = proximity
+            if not reached:
+                break
+            best.update(reached)
+            frontier = reached
+
+        row = np.zeros(self.size)
+        row[list(best)] = list(best.values())
+        row.setflags(write=False)
+        return row
+
+    def proximity(self, source: int, target: int) -> float:
+        """Proximity between two skill ids."""
+        return float(self.row(source)[target])
+
+    def best_matches(
+        self,
+        sources: Sequence[int],
+        targets: Sequence[int]
+    ) -> List[Tuple[int, float]]:
+        """For each source, the index into ``targets`` of its closest skill and the proximity.
+
+        Ties go to the earliest target. A source is never matched to itself.
+        """
+        if not sources or not targets:
+            return [(-1, 0.0) for _ in sources]
+
+        target_ids = np.asarray(targets)
+        block = np.stack([self.row(source)[target_ids] for source in sources])
+        block[np.asarray(sources)[:, None] == target_ids[None, :]] = 0.0
+
+        best = block.argmax(axis=1)
+        return [(int(index), float(block[row, index])) for row, index in enumerate(best)]
@@ -1,237 +1,87 @@
 """Skill ontology service for normalizing and analyzing skills."""
 import re
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Iterable, FrozenSet, Mapping
 from collections import defaultdict
 import logging
 
+from .ontology_store import OntologyStore, SkillOntology, get_ontology_store
+
 logger = logging.getLogger(__name__)
 
 
 class SkillOntologyService:
     """Service for skill normalization, extraction, and analysis."""
     
-    def __init__(self):
-        """Initialize skill ontology with predefined mappings."""
-        # Skill normalization mappings
-        self.skill_aliases = {
-            # Programming Languages
-            "python": "Python",
-            "py": "Python",
-            "javascript": "JavaScript",
-            "js": "JavaScript",
-            "typescript": "TypeScript",
-            "ts": "TypeScript",
-            "java": "Java",
-            "c++": "C++",
-            "cpp": "C++",
-            "c#": "C#",
-            "csharp": "C#",
-            "golang": "Go",
-            "ruby": "Ruby",
-            "php": "PHP",
-            "swift": "Swift",
-            "kotlin": "Kotlin",
-            "rust": "Rust",
-            "r": "R",
-            "matlab": "MATLAB",
-            "scala": "Scala",
-            "f#": "F#",
-            "fsharp": "F#",
-            
-            # Web Frameworks
-            "react": "React",
-            "reactjs": "React",
-            "react.js": "React",
-            "vue": "Vue.js",
-            "vuejs": "Vue.js",
-            "vue.js": "Vue.js",
-            "angular": "Angular",
-            "angularjs": "AngularJS",
-            "django": "Django",
-            "flask": "Flask",
-            "fastapi": "FastAPI",
-            "express": "Express.js",
-            "expressjs": "Express.js",
-            "express.js": "Express.js",
-            "spring": "Spring",
-            "spring boot": "Spring Boot",
-            "springboot": "Spring Boot",
-            "rails": "Ruby on Rails",
-            "ruby on rails": "Ruby on Rails",
-            "laravel": "Laravel",
-            "asp.net": "ASP.NET",
-            "aspnet": "ASP.NET",
-            
-            # Databases
-            "postgres": "PostgreSQL",
-            "postgresql": "PostgreSQL",
-            "mysql": "MySQL",
-            "mongodb": "MongoDB",
-            "mongo": "MongoDB",
-            "redis": "Redis",
-            "elasticsearch": "Elasticsearch",
-            "elastic": "Elasticsearch",
-            "cassandra": "Cassandra",
-            "oracle": "Oracle",
-            "sql server": "SQL Server",
-            "mssql": "SQL Server",
-            "sqlite": "SQLite",
-            "dynamodb": "DynamoDB",
-            "neo4j": "Neo4j",
-            
-            # Cloud & DevOps
-            "aws": "AWS",
-            "amazon web services": "AWS",
-            "gcp": "Google Cloud",
-            "google cloud": "Google Cloud",
-            "google cloud platform": "Google Cloud",
-            "azure": "Azure",
-            "microsoft azure": "Azure",
-            "docker": "Docker",
-            "kubernetes": "Kubernetes",
-            "k8s": "Kubernetes",
-            "jenkins": "Jenkins",
-            "gitlab ci": "GitLab CI",
-            "github actions": "GitHub Actions",
-            "terraform": "Terraform",
-            "ansible": "Ansible",
-            "helm": "Helm",
-            
-            # Other Technologies
-            "node": "Node.js",
-            "nodejs": "Node.js",
-            "node.js": "Node.js",
-            "git": "Git",
-            "github": "GitHub",
-            "gitlab": "GitLab",
-            "bitbucket": "Bitbucket",
-            "jira": "Jira",
-            "confluence": "Confluence",
-            "ml": "Machine Learning",
-            "machine learning": "Machine Learning",
-            "ai": "Artificial Intelligence",
-            "artificial intelligence": "Artificial Intelligence",
-            "deep learning": "Deep Learning",
-            "tensorflow": "TensorFlow",
-            "pytorch": "PyTorch",
-            "scikit-learn": "scikit-learn",
-            "sklearn": "scikit-learn",
-            "pandas": "pandas",
-            "numpy": "NumPy",
-            "graphql": "GraphQL",
-            "rest": "REST",
-            "restful": "REST",
-            "soap": "SOAP",
-            "microservices": "Microservices",
-            "agile": "Agile",
-            "scrum": "Scrum",
-            "kanban": "Kanban",
-        }
-        
-        # Skill relationships (for finding related skills)
-        self.skill_relationships = {
-            "Python": ["Django", "Flask", "FastAPI", "pandas", "NumPy", "scikit-learn", "PyTorch", "TensorFlow"],
-            "JavaScript": ["TypeScript", "React", "Vue.js", "Angular", "Node.js", "Express.js"],
-            "Java": ["Spring", "Spring Boot", "Hibernate", "Maven", "Gradle"],
-            "React": ["JavaScript", "TypeScript", "Redux", "Next.js", "React Native"],
-            "Django": ["Python", "Django REST Framework", "PostgreSQL", "Celery"],
-            "Docker": ["Kubernetes", "Docker Compose", "Container Orchestration", "Podman"],
-            "AWS": ["EC2", "S3", "Lambda", "CloudFormation", "ECS", "EKS"],
-            "PostgreSQL": ["SQL", "Database Design", "Query Optimization", "MySQL", "Database"],
-            "MySQL": ["SQL", "Database Design", "Query Optimization", "PostgreSQL", "Database"],
-            "Machine Learning": ["Python", "TensorFlow", "PyTorch", "scikit-learn", "pandas", "NumPy"],
-        }
-        
-        # Skill categories
-        self.skill_categories = {
-            "Programming Language": ["Python", "JavaScript", "Java", "C++", "C#", "Go", "Ruby", "PHP", "Swift", "Kotlin", "Rust", "TypeScript", "R", "MATLAB", "Scala", "F#"],
-            "Framework": ["Django", "Flask", "FastAPI", "React", "Vue.js", "Angular", "Express.js", "Spring", "Spring Boot", "Ruby on Rails", "Laravel", "ASP.NET"],
-            "Database": ["PostgreSQL", "MySQL", "MongoDB", "Redis", "Elasticsearch", "Cassandra", "Oracle", "SQL Server", "SQLite", "DynamoDB", "Neo4j"],
-            "DevOps": ["Docker", "Kubernetes", "Jenkins", "GitLab CI", "GitHub Actions", "Terraform", "Ansible", "Helm", "CI/CD"],
-            "Cloud Platform": ["AWS", "Google Cloud", "Azure", "Heroku", "DigitalOcean"],
-            "Version Control": ["Git", "GitHub", "GitLab", "Bitbucket", "SVN"],
-            "Data Science": ["Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "scikit-learn", "pandas", "NumPy", "Data Analysis"],
-            "Soft Skills": ["Communication", "Leadership", "Problem Solving", "Teamwork", "Agile", "Scrum", "Project Management"],
-        }
-        
-        # Build reverse mapping for categories
-        self.skill_to_category = {}
-        for category, skills in self.skill_categories.items():
-            for skill in skills:
-                self.skill_to_category[skill] = category
+    def __init__(self, store: Optional[OntologyStore] = None):
+        """Initialize service.
+        
+        Args:
+            store: Ontology store to read from (defaults to the process-wide
+                store of the built-in taxonomy)
+        """
+        self.store = store or get_ontology_store()
+    
+    @property
+    def ontology(self) -> SkillOntology:
+        """Current ontology; may change between calls when the store reloads."""
+        return self.store.current()
+    
+    @property
+    def skill_aliases(self) -> Mapping[str, str]:
+        return self.ontology.aliases
+    
+    @property
+    def skill_relationships(self) -> Mapping[str, Tuple[str, ...]]:
+        return self.ontology.relationships
+    
+    @property
+    def skill_categories(self) -> Mapping[str, Tuple[str, ...]]:
+        return self.ontology.categories
+    
+    @property
+    def skill_to_category(self) -> Mapping[str, str]:
+        return self.ontology.skill_to_category
     
     def normalize_skill(self, skill: str) -> str:
         """Normalize skill name to canonical form."""
-        if not skill:
-            return ""
-        
-        # Convert to lowercase for lookup
-        skill_lower = skill.lower().strip()
-        
-        # Check if it's in our aliases
-        if skill_lower in self.skill_aliases:
-            return self.skill_aliases[skill_lower]
-        
-        # If not found, return with proper capitalization
-        # Handle special cases like ASP.NET, scikit-learn
-        if "." in skill or "-" in skill:
-            # For unknown skills with special chars, keep original case
-            return skill
-        
-        # Default: capitalize first letter of each word
-        return skill.title()
+        return self.ontology.normalize(skill)
+    
+    def skill_ids(self, skills: Iterable[str]) -> FrozenSet[int]:
+        """Ids of the given skills that appear in the relationship index."""
+        return self.ontology.skill_ids(skills)
+    
+    def related_skill_ids(self, skill: str) -> FrozenSet[int]:
+        """Ids of the skills related to the given skill."""
+        return self.ontology.related_skill_ids(skill)
     
     def extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from unstructured text."""
         if not text:
             return []
         
-        skills = set()
-        text_lower = text.lower()
-        
-        # Check for each known skill (including aliases)
-        all_skills = set()
-        all_skills.update(self.skill_aliases.keys())
-        all_skills.update(self.skill_aliases.values())
-        
-        # Also check skill categories
-        for category_skills in self.skill_categories.values():
-            all_skills.update([s.lower() for s in category_skills])
-        
-        for skill in all_skills:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                normalized = self.normalize_skill(skill)
-                skills.add(normalized)
-        
-        return sorted(list(skills))
+        # Single pass over the text regardless of the number of known skills
+        return sorted(self.ontology.find_skills(text))
     
     def get_related_skills(self, skill: str) -> List[str]:
         """Get skills related to the given skill."""
-        normalized = self.normalize_skill(skill)
-        
-        related = set()
-        
-        # Direct relationships
-        if normalized in self.skill_relationships:
-            related.update(self.skill_relationships[normalized])
-        
-        # Reverse relationships
-        for key, values in self.skill_relationships.items():
-            if normalized in values:
-                related.add(key)
-                related.update(values)
-        
-        # Remove the original skill
-        related.discard(normalized)
-        
-        return sorted(list(related))
+        return list(self.ontology.related_skills(skill))
+    
+    def skill_proximity(self, skill: str, other: str) -> float:
+        """Proximity in [0, 1] of two skills, counting multi-hop relationships."""
+        return self.ontology.skill_proximity(skill, other)
+    
+    def closest_related_skills(
+        self,
+        skills: Iterable[str],
+        candidate_skills: Iterable[str]
+    ) -> Dict[str, Tuple[str, float]]:
+        """Map each skill to its closest related candidate skill and their proximity."""
+        return self.ontology.closest_skills(skills, candidate_skills)
     
     def get_skill_category(self, skill: str) -> str:
         """Get the category of a skill."""
-        normalized = self.normalize_skill(skill)
-        return self.skill_to_category.get(normalized, "Other")
+        ontology = self.ontology
+        return ontology.skill_to_category.get(ontology.normalize(skill), "Other")
     
     def calculate_skill_similarity(
         self,
@@ -242,20 +92,17 @@ class SkillOntologyService:
         if not job_skills or not candidate_skills:
             return 0.0
         
-        # Normalize all skills
-        job_set = {self.normalize_skill(s) for s in job_skills}
-        candidate_set = {self.normalize_skill(s) for s in candidate_skills}
+        # Normalize all skills against one ontology version
+        ontology = self.ontology
+        job_set = {ontology.normalize(s) for s in job_skills}
+        candidate_set = {ontology.normalize(s) for s in candidate_skills}
         
         # Direct matches
         direct_matches = len(job_set.intersection(candidate_set))
         
-        # Related skill matches
-        related_matches = 0
-        for job_skill in job_set:
-            if job_skill not in candidate_set:
-                related = set(self.get_related_skills(job_skill))
-                if related.intersection(candidate_set):
-                    related_matches += 0.5  # Partial credit for related skills
+        # Related skill matches, with partial credit scaled by graph proximity
+        closest = ontology.closest_skills(job_set - candidate_set, candidate_set)
+        related_matches = sum(0.5 * proximity for _, proximity in closest.values())
         
         total_matches = direct_matches + related_matches
         similarity = total_matches / len(job_set)
@@ -412,24 +259,24 @@ class SkillOntologyService:
         candidate_skills: List[str]
     ) -> Dict[str, any]:
         """Analyze gaps between job requirements and candidate skills."""
-        # Normalize all skills
-        required_set = {self.normalize_skill(s) for s in job_skills.get("required", [])}
-        nice_to_have_set = {self.normalize_skill(s) for s in job_skills.get("nice_to_have", [])}
-        candidate_set = {self.normalize_skill(s) for s in candidate_skills}
+        # Normalize all skills against one ontology version
+        ontology = self.ontology
+        required_set = {ontology.normalize(s) for s in job_skills.get("required", [])}
+        nice_to_have_set = {ontology.normalize(s) for s in job_skills.get("nice_to_have", [])}
+        candidate_set = {ontology.normalize(s) for s in candidate_skills}
         
         # Calculate gaps
         missing_required = list(required_set - candidate_set)
         missing_nice = list(nice_to_have_set - candidate_set)
         
         # Find related skills the candidate has
+        candidate_ids = ontology.skill_ids(candidate_set)
         related_skills = []
         for missing in missing_required:
-            related = set(self.get_related_skills(missing))
-            candidate_related = related.intersection(candidate_set)
-            if candidate_related:
-                for skill in candidate_related:
-                    if skill not in related_skills:
-                        related_skills.append(skill)
+            for skill_id in ontology.related_skill_ids(missing) & candidate_ids:
+                skill = ontology.skill_name(skill_id)
+                if skill not in related_skills:
+                    related_skills.append(skill)
         
         # Calculate match percentage
         if required_set:
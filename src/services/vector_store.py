@@ -10,6 +10,9 @@ from pymilvus import MilvusClient, DataType, CollectionSchema, FieldSchema
 from pymilvus.milvus_client import IndexParams
 from openai import AsyncOpenAI
 
+from .embedding_cache import EmbeddingCache, MemoryEmbeddingBackend
+from .rate_limiter import estimate_tokens
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,7 +28,12 @@ class VectorSearchResult:
 class VectorStoreService:
     """Service for managing resume embeddings with Milvus Lite."""
     
-    def __init__(self, config: Dict[str, Any], openai_client: AsyncOpenAI):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        openai_client: AsyncOpenAI,
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
         """Initialize vector store service."""
         self.config = config
         self.openai_client = openai_client
@@ -34,6 +42,21 @@ class VectorStoreService:
         self.milvus_file = Path(config["milvus_lite_file"])
         self.client: Optional[MilvusClient] = None
         self.collection = None
+        
+        # Embedding request settings (OpenAI accepts up to 2048 inputs and
+        # 300k tokens per request; token counts are estimated, so keep a margin)
+        self.embedding_model = config.get("embedding_model", "text-embedding-3-small")
+        self.embedding_batch_size = config.get("embedding_batch_size", 2048)
+        self.embedding_batch_tokens = config.get("embedding_batch_tokens", 250000)
+        
+        # Read-through embedding cache, process-local unless a shared one is given
+        self.embedding_cache = embedding_cache or EmbeddingCache(
+            [MemoryEmbeddingBackend(
+                max_size=config.get("embedding_cache_size", 10000),
+                dtype=config.get("embedding_cache_dtype", "float32")
+            )],
+            model=self.embedding_model
+        )
     
     async def initialize(self) -> None:
         """Initialize Milvus Lite connection and create collection."""
@@ -106,12 +129,75 @@ class VectorStoreService:
         logger.info("Created index for embedding field")
     
     async def create_embedding(self, text: str) -> List[float]:
-        """Create embedding for text using OpenAI."""
+        """Create embedding for text using OpenAI, reading through the cache."""
+        cached = (await self.embedding_cache.get_many([text]))[0]
+        if cached is not None:
+            return cached
+        
         response = await self.openai_client.embeddings.create(
-            model="text-embedding-3-small",
+            model=self.embedding_model,
             input=text
         )
-        return response.data[0].embedding
+        embedding = response.data[0].embedding
+        await self.embedding_cache.set_many({text: embedding})
+        return embedding
+    
+    async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Create embeddings for many texts with as few requests as possible.
+        
+        Texts already embedded are served from the cache in one batched
+        lookup, duplicates are embedded once, and the remainder is sent in
+        chunks of at most ``embedding_batch_size`` inputs and an estimated
+        ``embedding_batch_tokens`` tokens. Results are returned in input order.
+        """
+        unique = list(dict.fromkeys(texts))
+        cached = await self.embedding_cache.get_many(unique)
+        
+        resolved: Dict[str, List[float]] = {}
+        missing = []
+        for text, embedding in zip(unique, cached):
+            if embedding is not None:
+                resolved[text] = embedding
+            else:
+                missing.append(text)
+        
+        chunks = self._embedding_chunks(missing)
+        responses = await asyncio.gather(*[
+            self.openai_client.embeddings.create(
+                model=self.embedding_model,
+                input=chunk
+            )
+            for chunk in chunks
+        ])
+        
+        created: Dict[str, List[float]] = {}
+        for chunk, response in zip(chunks, responses):
+            for text, item in zip(chunk, response.data):
+                created[text] = item.embedding
+        
+        await self.embedding_cache.set_many(created)
+        resolved.update(created)
+        
+        return [resolved[text] for text in texts]
+    
+    def _embedding_chunks(self, texts: List[str]) -> List[List[str]]:
+        """Split texts into request chunks capped by input count and estimated tokens."""
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        chunk_tokens = 0
+        for text in texts:
+            tokens = estimate_tokens(text)
+            if chunk and (
+                len(chunk) >= self.embedding_batch_size
+                or chunk_tokens + tokens > self.embedding_batch_tokens
+            ):
+                chunks.append(chunk)
+                chunk, chunk_tokens = [], 0
+            chunk.append(text)
+            chunk_tokens += tokens
+        if chunk:
+            chunks.append(chunk)
+        return chunks
     
     async def store_resume(
         self,
@@ -120,7 +206,7 @@ class VectorStoreService:
         metadata: Dict[str, Any]
     ) -> str:
         """Store resume with embedding."""
-        # Create embedding
+        # Create embedding (served from cache if this text was already embedded)
         embedding = await self.create_embedding(text)
         
         # Store in Milvus
@@ -254,11 +340,9 @@ class VectorStoreService:
         resumes: List[Dict[str, Any]]
     ) -> List[str]:
         """Store multiple resumes efficiently."""
-        # Create embeddings in parallel
+        # Create embeddings in batched requests
         texts = [r["text"] for r in resumes]
-        embeddings = await asyncio.gather(
-            *[self.create_embedding(text) for text in texts]
-        )
+        embeddings = await self.create_embeddings(texts)
         
         # Prepare batch data
         batch_data = []
@@ -0,0 +1,201 @@
+"""Reliable Redis work queue with visibility timeouts and dead-lettering."""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Atomically pop up to N members by priority and lease them to the caller.
+# KEYS: pending, processing, attempts, scores
+# ARGV: count, lease deadline
+CLAIM_SCRIPT = """
+local items = redis.call('ZPOPMIN', KEYS[1], ARGV[1])
+local claimed = {}
+for i = 1, #items, 2 do
+    local member = items[i]
+    redis.call('ZADD', KEYS[2], ARGV[2], member)
+    redis.call('HSET', KEYS[4], member, items[i + 1])
+    local attempts = redis.call('HINCRBY', KEYS[3], member, 1)
+    table.insert(claimed, member)
+    table.insert(claimed, attempts)
+end
+return claimed
+"""
+
+# Release a leased member: redeliver it, or dead-letter it once out of attempts.
+# KEYS: pending, processing, attempts, scores, dead, errors
+# ARGV: member, max attempts, now, error
+FAIL_SCRIPT = """
+if redis.call('ZREM', KEYS[2], ARGV[1]) == 0 then
+    return -1
+end
+local attempts = tonumber(redis.call('HGET', KEYS[3], ARGV[1]) or '0')
+if ARGV[4] ~= '' then
+    redis.call('HSET', KEYS[6], ARGV[1], ARGV[4])
+end
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[5], ARGV[3], ARGV[1])
+    redis.call('HDEL', KEYS[3], ARGV[1])
+    redis.call('HDEL', KEYS[4], ARGV[1])
+    return 0
+end
+redis.call('ZADD', KEYS[1], redis.call('HGET', KEYS[4], ARGV[1]) or 0, ARGV[1])
+return 1
+"""
+
+# Return members whose lease expired to the queue, or dead-letter them.
+# KEYS: pending, processing, attempts, scores, dead
+# ARGV: now, max attempts
+REQUEUE_EXPIRED_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+local requeued = 0
+local dead = 0
+for _, member in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], member)
+    local attempts = tonumber(redis.call('HGET', KEYS[3], member) or '0')
+    if attempts >= tonumber(ARGV[2]) then
+        redis.call('ZADD', KEYS[5], ARGV[1], member)
+        redis.call('HDEL', KEYS[3], member)
+        redis.call('HDEL', KEYS[4], member)
+        dead = dead + 1
+    else
+        redis.call('ZADD', KEYS[1], redis.call('HGET', KEYS[4], member) or 0, member)
+        requeued = requeued + 1
+    end
+end
+return {requeued, dead}
+"""
+
+
+@dataclass
+class ClaimedItem:
+    """A queue member leased to a worker until ``deadline`` (epoch seconds)."""
+    member: str
+    attempts: int
+    deadline: float
+
+
+class ReliableQueue:
+    """Priority work queue with at-least-once delivery.
+
+    Members wait in a sorted set scored by negated priority. A claim moves
+    them atomically into a processing set scored by their lease deadline.
+    Members that are not acknowledged before the deadline, or that fail,
+    are redelivered until ``max_attempts`` is reached, and are then moved
+    to a dead-letter set with their last error.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        name: str,
+        visibility_timeout: float = 300,
+        max_attempts: int = 3
+    ):
+        """Initialize queue.
+
+        Args:
+            client: redis.asyncio client
+            name: Key of the pending sorted set; other keys derive from it
+            visibility_timeout: Seconds a claimed member stays leased
+            max_attempts: Deliveries before a member is dead-lettered
+        """
+        self.client = client
+        self.name = name
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+
+        self.processing_key = f"{name}:processing"
+        self.attempts_key = f"{name}:attempts"
+        self.scores_key = f"{name}:scores"
+        self.dead_key = f"{name}:dead"
+        self.errors_key = f"{name}:errors"
+
+        self._claim = client.register_script(CLAIM_SCRIPT)
+        self._fail = client.register_script(FAIL_SCRIPT)
+        self._requeue_expired = client.register_script(REQUEUE_EXPIRED_SCRIPT)
+
+    async def enqueue(self, member: str, priority: int = 0) -> None:
+        """Add a member; higher priority is claimed first."""
+        await self.client.zadd(self.name, {member: -priority})
+
+    async def claim(self, count: int = 1) -> List[ClaimedItem]:
+        """Atomically lease up to ``count`` members, highest priority first."""
+        deadline = time.time() + self.visibility_timeout
+        result = await self._claim(
+            keys=[self.name, self.processing_key, self.attempts_key, self.scores_key],
+            args=[count, deadline]
+        )
+        return [
+            ClaimedItem(member=result[i], attempts=int(result[i + 1]), deadline=deadline)
+            for i in range(0, len(result), 2)
+        ]
+
+    async def ack(self, member: str) -> None:
+        """Mark a leased member as done."""
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zrem(self.processing_key, member)
+        pipe.hdel(self.attempts_key, member)
+        pipe.hdel(self.scores_key, member)
+        pipe.hdel(self.errors_key, member)
+        await pipe.execute()
+
+    async def fail(self, member: str, error: str = "") -> Optional[bool]:
+        """Release a leased member after a failure.
+
+        Returns:
+            True if it was queued for redelivery, False if it was dead-lettered,
+            None if it was no longer leased (e.g. its lease had expired)
+        """
+        outcome = await self._fail(
+            keys=[
+                self.name, self.processing_key, self.attempts_key,
+                self.scores_key, self.dead_key, self.errors_key
+            ],
+            args=[member, self.max_attempts, time.time(), error]
+        )
+        if int(outcome) == -1:
+            return None
+        if int(outcome) == 0:
+            logger.warning(f"Dead-lettered {member} from {self.name}: {error}")
+        return int(outcome) == 1
+
+    async def extend(self, member: str, visibility_timeout: Optional[float] = None) -> None:
+        """Push back the lease deadline of a member still being processed."""
+        deadline = time.time() + (visibility_timeout or self.visibility_timeout)
+        await self.client.zadd(self.processing_key, {member: deadline}, xx=True)
+
+    async def requeue_expired(self) -> Tuple[int, int]:
+        """Redeliver members whose lease expired.
+
+        Returns:
+            Number of members requeued and number dead-lettered
+        """
+        requeued, dead = await self._requeue_expired(
+            keys=[
+                self.name, self.processing_key, self.attempts_key,
+                self.scores_key, self.dead_key
+            ],
+            args=[time.time(), self.max_attempts]
+        )
+        if requeued or dead:
+            logger.info(f"{self.name}: requeued {requeued} expired items, dead-lettered {dead}")
+        return int(requeued), int(dead)
+
+    async def dead_letters(self) -> Dict[str, str]:
+        """Dead-lettered members with their last recorded error."""
+        members = await self.client.zrange(self.dead_key, 0, -1)
+        if not members:
+            return {}
+        errors = await self.client.hmget(self.errors_key, members)
+        return {member: error or "" for member, error in zip(members, errors)}
+
+    async def stats(self) -> Dict[str, int]:
+        """Number of pending, processing and dead-lettered members."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zcard(self.name)
+        pipe.zcard(self.processing_key)
+        pipe.zcard(self.dead_key)
+        pending, processing, dead = await pipe.execute()
+        return {"pending": pending, "processing": processing, "dead": dead}
@@ -0,0 +1,17 @@
+"""Background workers for the recruitment system."""
+from .evaluation_worker import (
+    EvaluationWorker,
+    WorkerStats,
+    ApplicationRecord,
+    DatabaseApplicationLoader
+)
+from .pool import WorkerPool, PoolStats
+
+__all__ = [
+    "EvaluationWorker",
+    "WorkerStats",
+    "ApplicationRecord",
+    "DatabaseApplicationLoader",
+    "WorkerPool",
+    "PoolStats"
+]
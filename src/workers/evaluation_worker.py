@@ -0,0 +1,306 @@
+"""Worker draining the evaluation queue through the unified agent."""
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from openai import AsyncOpenAI
+from sqlmodel import Session, create_engine, select
+
+from agents.unified_agent import EvaluationResult, UnifiedRecruitmentAgent
+from config import get_config
+from models.database import Job, Resume, migrate_schema
+from services.content_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ApplicationRecord:
+    """Inputs needed to evaluate one queued application."""
+    job_description: str
+    resume_text: str
+    candidate_id: str
+    parsed_data: Optional[Dict[str, Any]] = None
+
+
+ApplicationLoader = Callable[[str, str], Awaitable[ApplicationRecord]]
+ResultCallback = Callable[[str, str, EvaluationResult], None]
+ParsedResumeStore = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class DatabaseApplicationLoader:
+    """Load queued (job_id, resume_id) pairs from the application database.
+    
+    Parsed resumes are read from and stored to ``Resume.parsed_data``, so a
+    resume is parsed once however many jobs it is evaluated against.
+    """
+    
+    def __init__(self, database_url: str):
+        """Initialize loader with a shared engine."""
+        self.engine = create_engine(database_url)
+        migrate_schema(self.engine)
+    
+    async def __call__(self, job_id: str, resume_id: str) -> ApplicationRecord:
+        return await asyncio.to_thread(self._load, job_id, resume_id)
+    
+    def _load(self, job_id: str, resume_id: str) -> ApplicationRecord:
+        with Session(self.engine) as session:
+            job = session.get(Job, int(job_id))
+            resume = session.get(Resume, int(resume_id))
+            if job is None or resume is None:
+                raise LookupError(f"Application {job_id}:{resume_id} not found")
+            return ApplicationRecord(
+                job_description=job.description,
+                resume_text=resume.content,
+                candidate_id=resume.candidate_id,
+                parsed_data=resume.parsed_data or self._find_parsed(session, resume)
+            )
+    
+    def _find_parsed(self, session: Session, resume: Resume) -> Optional[Dict[str, Any]]:
+        """Parsed data stored with another resume of the same content."""
+        rows = session.exec(
+            select(Resume.parsed_data)
+            .where(Resume.content_hash == content_hash(resume.content))
+            .where(Resume.id != resume.id)
+        )
+        return next((parsed for parsed in rows if parsed), None)
+    
+    async def store_parsed_resume(self, resume_id: str, parsed_data: Dict[str, Any]) -> None:
+        """Store stamped parsed data with a resume."""
+        await asyncio.to_thread(self._store, resume_id, parsed_data)
+    
+    def _store(self, resume_id: str, parsed_data: Dict[str, Any]) -> None:
+        with Session(self.engine) as session:
+            resume = session.get(Resume, int(resume_id))
+            if resume is None:
+                return
+            resume.parsed_data = parsed_data
+            resume.content_hash = parsed_data["content_hash"]
+            session.add(resume)
+            session.commit()
+
+
+@dataclass
+class WorkerStats:
+    """Counters describing worker activity."""
+    claimed: int = 0
+    completed: int = 0
+    failed: int = 0
+    dead_lettered: int = 0
+
+
+class EvaluationWorker:
+    """Claim evaluations in batches and run them through the agent.
+    
+    Each claimed item is acknowledged once its evaluation completes and
+    released for redelivery if it fails. Its lease is renewed while the
+    evaluation runs, so slow evaluations are not redelivered to another
+    worker mid-flight. Items whose worker died are
+    redelivered after their visibility timeout and resume from their
+    checkpointed stages, since workflow ids are derived from the application.
+    """
+    
+    def __init__(
+        self,
+        agent: UnifiedRecruitmentAgent,
+        load_application: ApplicationLoader,
+        batch_size: int = 8,
+        poll_interval: float = 1.0,
+        requeue_interval: float = 30.0,
+        on_result: Optional[ResultCallback] = None,
+        lease_renewal_interval: Optional[float] = None,
+        store_parsed_resume: Optional[ParsedResumeStore] = None
+    ):
+        """Initialize worker.
+        
+        Args:
+            agent: Initialized recruitment agent
+            load_application: Async callable resolving (job_id, resume_id) to inputs
+            batch_size: Evaluations claimed and processed concurrently
+            poll_interval: Seconds to wait when the queue is empty
+            requeue_interval: Seconds between sweeps for expired leases
+            on_result: Called with (job_id, resume_id, result) after each evaluation
+            lease_renewal_interval: Seconds between lease renewals of items in
+                progress (default: a third of the queue's visibility timeout)
+            store_parsed_resume: Awaited with (resume_id, stamped parsed data)
+                when a record had no current parsed resume
+        """
+        self.agent = agent
+        self.redis_service = agent.redis_service
+        self.load_application = load_application
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.requeue_interval = requeue_interval
+        self.on_result = on_result
+        self.lease_renewal_interval = lease_renewal_interval
+        self.store_parsed_resume = store_parsed_resume
+        self.stats = WorkerStats()
+    
+    async def run(
+        self,
+        drain: bool = False,
+        stop_event: Optional[asyncio.Event] = None
+    ) -> WorkerStats:
+        """Process evaluations until stopped.
+        
+        Args:
+            drain: Return once the queue is empty instead of polling
+            stop_event: Set to stop after the batch in progress
+            
+        Returns:
+            Worker statistics
+        """
+        stop_event = stop_event or asyncio.Event()
+        last_sweep = float("-inf")
+        
+        while not stop_event.is_set():
+            if time.monotonic() - last_sweep >= self.requeue_interval:
+                await self.redis_service.evaluation_queue.requeue_expired()
+                last_sweep = time.monotonic()
+            
+            claimed = await self.redis_service.claim_evaluations(self.batch_size)
+            if not claimed:
+                if drain:
+                    break
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            self.stats.claimed += len(claimed)
+            outcomes = await asyncio.gather(
+                *(self._process(job_id, resume_id) for job_id, resume_id in claimed),
+                return_exceptions=True
+            )
+            # One item's failure must not stop the worker
+            for (job_id, resume_id), outcome in zip(claimed, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Processing {job_id}:{resume_id} failed: {outcome!r}")
+        
+        return self.stats
+    
+    async def _process(self, job_id: str, resume_id: str) -> None:
+        """Evaluate one claimed item and acknowledge or release it."""
+        try:
+            result = await self._evaluate(job_id, resume_id)
+        except Exception as e:
+            logger.error(f"Evaluation {job_id}:{resume_id} failed: {e}")
+            await self._release(job_id, resume_id, e)
+        else:
+            await self._complete(job_id, resume_id, result)
+    
+    async def _release(self, job_id: str, resume_id: str, error: Exception) -> None:
+        """Release a failed item for redelivery or dead-lettering."""
+        self.stats.failed += 1
+        try:
+            redelivered = await self.redis_service.fail_evaluation(job_id, resume_id, str(error))
+            if redelivered is False:
+                self.stats.dead_lettered += 1
+            await self.redis_service.increment_metric("queue_items_failed")
+        except Exception as e:
+            # The item is redelivered once its lease expires
+            logger.error(f"Could not release {job_id}:{resume_id}: {e}")
+    
+    async def _complete(self, job_id: str, resume_id: str, result: EvaluationResult) -> None:
+        """Acknowledge a completed item and report its result."""
+        try:
+            await self.redis_service.ack_evaluation(job_id, resume_id)
+        except Exception as e:
+            # The item is redelivered and resumes from its checkpoints
+            logger.error(f"Could not acknowledge {job_id}:{resume_id}: {e}")
+            return
+        self.stats.completed += 1
+        
+        try:
+            await self.redis_service.increment_metric("queue_items_completed")
+        except Exception as e:
+            logger.error(f"Could not record completion of {job_id}:{resume_id}: {e}")
+        if self.on_result:
+            try:
+                self.on_result(job_id, resume_id, result)
+            except Exception as e:
+                logger.error(f"Result callback for {job_id}:{resume_id} failed: {e}")
+    
+    async def _evaluate(self, job_id: str, resume_id: str) -> EvaluationResult:
+        """Run one claimed item through the agent, holding its lease until done."""
+        renewal = asyncio.ensure_future(self._renew_lease(job_id, resume_id))
+        try:
+            record = await self.load_application(job_id, resume_id)
+            # A current stored parse spares the parsing call
+            parsed_stored = self.agent.resume_cache.load_record(
+                record.resume_text, record.parsed_data or {}
+            )
+            result = await self.agent.process_job_application(
+                job_description=record.job_description,
+                resume_text=record.resume_text,
+                job_id=job_id,
+                candidate_id=record.candidate_id,
+                workflow_id=self.agent.application_workflow_id(
+                    job_id, record.candidate_id, record.job_description, record.resume_text
+                )
+            )
+            if not parsed_stored and self.store_parsed_resume:
+                await self._store_parsed(resume_id, record.resume_text)
+            return result
+        finally:
+            renewal.cancel()
+    
+    async def _store_parsed(self, resume_id: str, resume_text: str) -> None:
+        """Store the resume's fresh parse with it for later evaluations."""
+        cache = self.agent.resume_cache
+        try:
+            parsed = await cache.get_parsed(resume_text)
+            if parsed is not None:
+                await self.store_parsed_resume(resume_id, cache.stamp(resume_text, parsed))
+        except Exception as e:
+            # The evaluation succeeded; the resume is just parsed again next time
+            logger.warning(f"Could not store parsed resume {resume_id}: {e}")
+    
+    async def _renew_lease(self, job_id: str, resume_id: str) -> None:
+        """Push back an item's visibility timeout until cancelled."""
+        interval = (
+            self.lease_renewal_interval
+            or self.redis_service.evaluation_queue.visibility_timeout / 3
+        )
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.redis_service.extend_evaluation(job_id, resume_id)
+            except Exception as e:
+                # Keep evaluating; at worst the item is redelivered
+                logger.warning(f"Could not renew lease of {job_id}:{resume_id}: {e}")
+
+
+async def main(argv: Optional[list] = None) -> None:
+    """Run an evaluation worker against the configured Redis and database."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--drain", action="store_true", help="Exit once the queue is empty")
+    args = parser.parse_args(argv)
+    
+    config = get_config()
+    agent = UnifiedRecruitmentAgent(config, AsyncOpenAI(api_key=config["openai_api_key"]))
+    await agent.initialize()
+    
+    loader = DatabaseApplicationLoader(config["database_url"])
+    worker = EvaluationWorker(
+        agent,
+        loader,
+        batch_size=args.batch_size or config.get("worker_batch_size", 8),
+        poll_interval=config.get("worker_poll_interval", 1.0),
+        store_parsed_resume=loader.store_parsed_resume
+    )
+    try:
+        stats = await worker.run(drain=args.drain)
+        logger.info(f"Worker finished: {stats}")
+    finally:
+        await agent.redis_service.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,304 @@
+"""Multi-process supervisor running one evaluation worker per CPU core."""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from openai import AsyncOpenAI
+
+from agents.unified_agent import EvaluationResult, UnifiedRecruitmentAgent
+from config import get_config
+from .evaluation_worker import DatabaseApplicationLoader, EvaluationWorker
+
+logger = logging.getLogger(__name__)
+
+# Messages sent from worker processes to the supervisor
+RESULT_MESSAGE = "result"
+STATS_MESSAGE = "stats"
+ERROR_MESSAGE = "error"
+
+# Config keys holding provider quotas that are shared by all processes
+SHARED_QUOTA_KEYS = ("llm_requests_per_minute", "llm_tokens_per_minute")
+
+# Seconds between checks of the supervisor's stop flag inside a worker
+STOP_POLL_INTERVAL = 0.2
+
+
+@dataclass
+class PoolStats:
+    """Aggregated results and metrics from all worker processes."""
+    processes: int
+    claimed: int = 0
+    completed: int = 0
+    failed: int = 0
+    dead_lettered: int = 0
+    crashed: List[int] = field(default_factory=list)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    per_worker: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed evaluations per second."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def worker_config(config: Dict[str, Any], processes: int) -> Dict[str, Any]:
+    """Config for one of ``processes`` workers.
+
+    Rate limits apply to the whole account, so each process gets an equal
+    share of them; its own governor then adapts within that share.
+    """
+    config = dict(config)
+    for key in SHARED_QUOTA_KEYS:
+        if config.get(key):
+            config[key] = max(1, config[key] // processes)
+    return config
+
+
+def _summarize(job_id: str, resume_id: str, result: EvaluationResult) -> Dict[str, Any]:
+    """Picklable summary of an evaluation sent back to the supervisor."""
+    return {
+        "job_id": job_id,
+        "resume_id": resume_id,
+        "workflow_id": result.workflow_id,
+        "screening_score": result.screening_score,
+        "critic_score": result.critic_score,
+        "confidence": result.confidence,
+        "needs_review": result.needs_review,
+        "review_type": result.review_type,
+        "critic_bypassed": result.critic_bypassed
+    }
+
+
+async def _serve(
+    index: int,
+    config: Dict[str, Any],
+    batch_size: int,
+    drain: bool,
+    stop_flag: Any,
+    messages: Any
+) -> None:
+    """Run one worker on this process's event loop until drained or stopped."""
+    agent = UnifiedRecruitmentAgent(config, AsyncOpenAI(api_key=config["openai_api_key"]))
+    await agent.initialize()
+
+    stop_event = asyncio.Event()
+
+    async def watch_stop_flag() -> None:
+        while not stop_flag.is_set():
+            await asyncio.sleep(STOP_POLL_INTERVAL)
+        stop_event.set()
+
+    worker = EvaluationWorker(
+        agent,
+        DatabaseApplicationLoader(config["database_url"]),
+        batch_size=batch_size,
+        poll_interval=config.get("worker_poll_interval", 1.0),
+        on_result=lambda job_id, resume_id, result: messages.put(
+            (RESULT_MESSAGE, index, _summarize(job_id, resume_id, result))
+        )
+    )
+    watcher = asyncio.ensure_future(watch_stop_flag())
+    try:
+        stats = await worker.run(drain=drain, stop_event=stop_event)
+    finally:
+        watcher.cancel()
+        await agent.redis_service.close()
+
+    messages.put((STATS_MESSAGE, index, {**asdict(stats), "llm": agent.governor.snapshot()}))
+
+
+def _worker_main(
+    index: int,
+    config: Dict[str, Any],
+    batch_size: int,
+    drain: bool,
+    stop_flag: Any,
+    messages: Any
+) -> None:
+    """Entry point of a worker process."""
+    # Shutdown is coordinated by the supervisor through stop_flag
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(level=config.get("log_level", "INFO"))
+    try:
+        asyncio.run(_serve(index, config, batch_size, drain, stop_flag, messages))
+    except Exception as e:
+        logger.exception(f"Worker {index} failed")
+        messages.put((ERROR_MESSAGE, index, str(e)))
+
+
+class WorkerPool:
+    """Supervisor forking worker processes that share the Redis evaluation queue.
+
+    Each process runs its own event loop and agent, so CPU-bound parsing and
+    skill extraction run on separate cores. Work is distributed by the
+    queue's atomic claims; the supervisor only collects results and stats.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        processes: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        shutdown_timeout: float = 60.0
+    ):
+        """Initialize pool.
+
+        Args:
+            config: Application config
+            processes: Number of worker processes (defaults to the CPU count)
+            batch_size: Evaluations each worker claims at a time
+            shutdown_timeout: Seconds to wait for workers before terminating them
+        """
+        self.processes = processes or config.get("worker_processes") or os.cpu_count() or 1
+        self.batch_size = batch_size or config.get("worker_batch_size", 8)
+        self.config = worker_config(config, self.processes)
+        self.shutdown_timeout = shutdown_timeout
+
+        # Spawn rather than fork: the parent may hold event loops and sockets
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_flag = self._context.Event()
+        self._messages = self._context.Queue()
+        self._workers: Dict[int, Any] = {}
+        self._finished: set = set()
+
+    def start(self, drain: bool = False) -> None:
+        """Start the worker processes."""
+        for index in range(self.processes):
+            process = self._context.Process(
+                target=_worker_main,
+                args=(index, self.config, self.batch_size, drain, self._stop_flag, self._messages),
+                name=f"evaluation-worker-{index}"
+            )
+            process.start()
+            self._workers[index] = process
+        logger.info(f"Started {self.processes} evaluation workers")
+
+    def stop(self) -> None:
+        """Ask workers to finish their current batch and exit."""
+        if not self._stop_flag.is_set():
+            logger.info("Stopping evaluation workers")
+            self._stop_flag.set()
+
+    def run(self, drain: bool = False) -> PoolStats:
+        """Start workers and collect their output until all have exited.
+
+        SIGINT and SIGTERM trigger a graceful stop. Workers still running
+        ``shutdown_timeout`` seconds after the stop are terminated; their
+        claimed items are redelivered once their leases expire.
+
+        Args:
+            drain: Exit once the queue is empty instead of polling
+
+        Returns:
+            Aggregated pool statistics
+        """
+        stats = PoolStats(processes=self.processes)
+        started = time.perf_counter()
+        previous_handlers = {
+            sig: signal.signal(sig, lambda *_: self.stop())
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        stop_deadline: Optional[float] = None
+
+        try:
+            self.start(drain=drain)
+            while len(self._finished) < self.processes:
+                # Fall through after every message: workers streaming results
+                # must not hold off the shutdown deadline or exit checks
+                try:
+                    self._handle(self._messages.get(timeout=0.5), stats)
+                except queue.Empty:
+                    pass
+
+                if self._stop_flag.is_set():
+                    stop_deadline = stop_deadline or time.monotonic() + self.shutdown_timeout
+                    if time.monotonic() > stop_deadline:
+                        self._terminate(stats)
+                self._collect_exited(stats)
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+            for process in self._workers.values():
+                process.join(timeout=5)
+
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def _handle(self, message: tuple, stats: PoolStats) -> None:
+        """Fold one worker message into the pool statistics."""
+        kind, index, payload = message
+        if kind == RESULT_MESSAGE:
+            stats.results.append(payload)
+            return
+
+        self._finished.add(index)
+        if kind == STATS_MESSAGE:
+            stats.per_worker[index] = payload
+            stats.claimed += payload["claimed"]
+            stats.completed += payload["completed"]
+            stats.failed += payload["failed"]
+            stats.dead_lettered += payload["dead_lettered"]
+        else:
+            logger.error(f"Worker {index} exited with error: {payload}")
+            stats.crashed.append(index)
+
+    def _collect_exited(self, stats: PoolStats) -> None:
+        """Record workers that exited without reporting, e.g. killed by the OS."""
+        exited = [
+            index for index, process in self._workers.items()
+            if index not in self._finished and process.exitcode is not None
+        ]
+        if not exited:
+            return
+
+        # A worker flushes its messages before exiting; read them first
+        while True:
+            try:
+                self._handle(self._messages.get_nowait(), stats)
+            except queue.Empty:
+                break
+
+        for index in exited:
+            if index not in self._finished:
+                logger.error(
+                    f"Worker {index} exited with code {self._workers[index].exitcode}"
+                )
+                self._finished.add(index)
+                stats.crashed.append(index)
+
+    def _terminate(self, stats: PoolStats) -> None:
+        """Kill workers that did not stop within the shutdown timeout."""
+        for index, process in self._workers.items():
+            if index not in self._finished and process.is_alive():
+                logger.warning(f"Terminating worker {index} after shutdown timeout")
+                process.terminate()
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Run a worker pool against the configured Redis and database."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--drain", action="store_true", help="Exit once the queue is empty")
+    args = parser.parse_args(argv)
+
+    pool = WorkerPool(get_config(), processes=args.processes, batch_size=args.batch_size)
+    stats = pool.run(drain=args.drain)
+    logger.info(
+        f"Pool finished: {stats.completed} completed, {stats.failed} failed, "
+        f"{stats.dead_lettered} dead-lettered, {len(stats.crashed)} crashed "
+        f"({stats.throughput:.1f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -159,11 +159,15 @@ def mock_openai_client():
     """Mock OpenAI client."""
     client = Mock()
     client.embeddings = Mock()
-    client.embeddings.create = AsyncMock(
-        return_value=Mock(
-            data=[Mock(embedding=np.random.rand(1536).tolist())]
+    
+    async def _create_embeddings(model, input):
+        # One embedding per input, like the real API for list inputs
+        inputs = input if isinstance(input, list) else [input]
+        return Mock(
+            data=[Mock(embedding=np.random.rand(1536).tolist()) for _ in inputs]
         )
-    )
+    
+    client.embeddings.create = AsyncMock(side_effect=_create_embeddings)
     client.chat = Mock()
     client.chat.completions = Mock()
     client.chat.completions.create = AsyncMock()
@@ -370,8 +370,10 @@ class TestBaselineEvaluator:
         assert is_valid_strict is True  # Should still be valid with exact match
     
     def test_results_export_functionality(self):
-        """Test detailed results export to JSON."""
+        """Test detailed results export through a result sink."""
+        from dataclasses import asdict
         from evaluation.baseline_evaluator import BaselineEvaluator
+        from evaluation.result_sinks import open_result_sink, read_results
         
         evaluator = BaselineEvaluator()
         
@@ -395,15 +397,13 @@ class TestBaselineEvaluator:
         evaluation = evaluator.evaluate_candidate(candidate, "Test Job")
         
         # Test results saving
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-            temp_json_path = temp_file.name
-        
-        try:
-            evaluator._save_results([evaluation], temp_json_path)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results_path = str(Path(temp_dir) / "results.jsonl")
+            with open_result_sink(results_path) as sink:
+                sink.write(asdict(evaluation))
             
-            # Verify JSON file was created and contains correct data
-            with open(temp_json_path, 'r') as f:
-                saved_data = json.load(f)
+            # Verify results file was created and contains correct data
+            saved_data = list(read_results(results_path))
             
             assert len(saved_data) == 1
             result = saved_data[0]
@@ -411,9 +411,6 @@ class TestBaselineEvaluator:
             assert result['job_category'] == 'Test Job'
             assert 'overall_score' in result
             assert 'skills_matched' in result
-            
-        finally:
-            Path(temp_json_path).unlink()
     
     def test_evaluator_reset_functionality(self):
         """Test reset functionality for evaluator."""
@@ -516,3 +513,217 @@ class TestBaselineEvaluatorEdgeCases:
         # Rejection reason should mention specific gaps
         reason = evaluation.rejection_reason.lower()
         assert any(keyword in reason for keyword in ['skill', 'experience', 'education'])
+
+    def test_resolve_job_categories(self):
+        """Test category resolution via mapping with predicted_position fallback."""
+        from evaluation.baseline_evaluator import BaselineEvaluator
+        import pandas as pd
+
+        evaluator = BaselineEvaluator()
+        evaluator.job_descriptions = {"Python Developer": {}, "Data Science": {}}
+        df = pd.DataFrame([
+            {"actual_category": "Application Developer", "predicted_position": "Data Science"},
+            {"actual_category": " Data Science ", "predicted_position": "Sales"},
+            {"actual_category": None, "predicted_position": "Data Science"},
+            {"actual_category": "Sales", "predicted_position": "Application Developer"},
+            {"actual_category": "Sales", "predicted_position": "HR"},
+        ])
+
+        categories = evaluator.resolve_job_categories(df)
+
+        assert list(categories[:4]) == ["Python Developer", "Data Science", "Data Science", "Python Developer"]
+        assert pd.isna(categories[4])
+
+    def test_load_job_descriptions_reuses_index(self):
+        """Test a second load reads parsed requirements from the persisted index."""
+        from evaluation.baseline_evaluator import BaselineEvaluator
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jd_file = Path(temp_dir) / "JD_Python_Developer_job_description.md"
+            jd_file.write_text(SAMPLE_JOB_DESCRIPTIONS["python_developer"]["description"])
+            first = BaselineEvaluator()
+            first.load_job_descriptions(temp_dir)
+
+            second = BaselineEvaluator()
+            with patch.object(second.keyword_extractor, 'parse_job_description') as parse:
+                second.load_job_descriptions(temp_dir)
+
+            parse.assert_not_called()
+            assert second.job_descriptions == first.job_descriptions
+
+    def test_evaluate_candidates_frame_matches_single_evaluation(self):
+        """Test columnar batch scores equal per-candidate evaluation."""
+        from evaluation.baseline_evaluator import BaselineEvaluator
+        from dataclasses import asdict
+        import pandas as pd
+
+        evaluator = BaselineEvaluator()
+        evaluator.job_descriptions["Python Developer"] = {
+            "required_skills": ["Python", "MySQL", "Docker"],
+            "experience_years": 3,
+            "education_level": "Master's",
+            "nice_to_have": [],
+            "category": "Python Developer",
+            "raw_text": "Mock Python JD"
+        }
+        evaluator.job_descriptions["Data Science"] = {
+            "required_skills": ["Python", "Machine Learning"],
+            "experience_years": 0,
+            "education_level": None,
+            "nice_to_have": [],
+            "category": "Data Science",
+            "raw_text": "Mock DS JD"
+        }
+        df = pd.DataFrame([
+            {"id": 1, "skills": "Python, MySQL, Docker", "experience": "5 years",
+             "education": "Master's in CS", "actual_category": "Python Developer",
+             "predicted_position": "Python Developer"},
+            {"id": 2, "skills": "ML, Python", "experience": None, "education": "BSc",
+             "actual_category": None, "predicted_position": "Data Science"},
+            {"id": 3, "skills": None, "experience": "1 year", "education": "High school diploma",
+             "actual_category": "Python Developer", "predicted_position": "Sales Analyst"},
+            {"id": 4, "skills": "Python", "experience": "2 years", "education": "Some college",
+             "actual_category": "Application Developer", "predicted_position": "Engineer"},
+        ])
+
+        frame = evaluator.evaluate_candidates_frame(df)
+
+        assert list(frame.index) == [0, 1, 2, 3]
+        for index, row in df.iterrows():
+            expected = asdict(evaluator.evaluate_candidate(row.to_dict(), frame.loc[index, "job_category"]))
+            actual = frame.loc[index, list(expected)].to_dict()
+            assert actual == expected
+
+    def test_evaluate_candidates_frame_without_details(self):
+        """Test summary mode skips per-candidate skill lists and reasons."""
+        from evaluation.baseline_evaluator import BaselineEvaluator
+        import pandas as pd
+
+        evaluator = BaselineEvaluator()
+        evaluator.job_descriptions["Python Developer"] = {
+            "required_skills": ["Python"],
+            "experience_years": 0,
+            "education_level": None,
+            "category": "Python Developer"
+        }
+        df = pd.DataFrame([
+            {"id": 1, "skills": "Python", "predicted_position": "Python Developer"},
+            {"id": 2, "skills": "Python", "predicted_position": float("nan"),
+             "actual_category": "Python Developer"},
+            {"id": 3, "skills": "Python", "predicted_position": "Chef"},
+        ])
+
+        frame = evaluator.evaluate_candidates_frame(df, details=False)
+
+        # Candidates without a text position cannot be evaluated
+        assert list(frame["candidate_id"]) == ["1"]
+        assert "skills_missing" not in frame
+        assert frame["overall_score"].iloc[0] == 1.0
+
+    def test_evaluate_candidates_sharded_matches_serial(self):
+        """Test sharded evaluation reproduces a serial run and its FRR."""
+        from evaluation.baseline_evaluator import BaselineEvaluator
+        import pandas as pd
+
+        def evaluator():
+            instance = BaselineEvaluator()
+            instance.job_descriptions["Python Developer"] = {
+                "required_skills": ["Python", "MySQL"],
+                "experience_years": 2,
+                "education_level": "Bachelor's",
+                "category": "Python Developer"
+            }
+            return instance
+
+        candidates = pd.DataFrame([
+            {"id": i, "skills": ["Python, MySQL", "Java", "Python"][i % 3],
+             "experience": f"{i % 4} years", "education": ["Bachelor's", "High school"][i % 2],
+             "actual_category": "Python Developer", "predicted_position": "Python Developer"}
+            for i in range(25)
+        ])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            candidates_file = Path(temp_dir) / "candidates.csv"
+            candidates.to_csv(candidates_file, index=False)
+
+            serial = evaluator()
+            serial_results = serial.evaluate_candidates_batch(str(candidates_file))
+            sharded = evaluator()
+            frame = sharded.evaluate_candidates_sharded(str(candidates_file), shard_size=4, max_workers=2)
+
+        assert list(frame.index) == list(range(25))
+        assert list(frame["overall_score"]) == [result.overall_score for result in serial_results]
+        assert sharded.frr_calculator.results == serial.frr_calculator.results
+        assert sharded.get_evaluation_statistics() == serial.get_evaluation_statistics()
+
+    def test_evaluate_candidates_stream_flushes_chunks(self):
+        """Test streamed chunks are counted as they are yielded."""
+        from evaluation.baseline_evaluator import BaselineEvaluator
+        import pandas as pd
+
+        evaluator = BaselineEvaluator(keep_results=False)
+        evaluator.job_descriptions["Python Developer"] = {
+            "required_skills": ["Python"],
+            "experience_years": 0,
+            "education_level": None,
+            "category": "Python Developer"
+        }
+        candidates = pd.DataFrame({
+            "id": range(5),
+            "skills": ["Python", "Java", "Python", "Go", "Python"],
+            "predicted_position": ["Python Developer"] * 5
+        })
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            candidates_file = Path(temp_dir) / "candidates.csv"
+            candidates.to_csv(candidates_file, index=False)
+
+            totals = [
+                evaluator.get_evaluation_statistics()["total_candidates"]
+                for _ in evaluator.evaluate_candidates_stream(str(candidates_file), chunk_size=2)
+            ]
+
+        assert totals == [2, 4, 5]
+        assert evaluator.frr_calculator.results == []
+
+    def test_threshold_sweep_matches_reevaluation(self):
+        """Test a threshold sweep gives the FRR of re-evaluating with new thresholds."""
+        from evaluation.baseline_evaluator import BaselineEvaluator
+        import pandas as pd
+
+        job_descriptions = {
+            "Python Developer": {
+                "required_skills": ["Python", "SQL"],
+                "experience_years": 2,
+                "education_level": None,
+                "category": "Python Developer"
+            }
+        }
+        candidates = pd.DataFrame({
+            "id": range(6),
+            "skills": ["Python, SQL", "Java", "Python", "SQL", "Python, SQL, Go", "Go"],
+            "experience": ["3 years", "1 year", "2 years", "5 years", "0 years", "4 years"],
+            "predicted_position": ["Python Developer"] * 6
+        })
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            candidates_file = str(Path(temp_dir) / "candidates.csv")
+            candidates.to_csv(candidates_file, index=False)
+
+            evaluator = BaselineEvaluator()
+            evaluator.job_descriptions.update(job_descriptions)
+            sweep = evaluator.build_threshold_sweep(candidates_file, chunk_size=4)
+
+            for qualification_threshold, acceptance_threshold in [(0.31, 0.5), (0.2, 0.7), (0.6, 0.4)]:
+                reevaluated = BaselineEvaluator()
+                reevaluated.job_descriptions.update(job_descriptions)
+                reevaluated.qualification_threshold = qualification_threshold
+                reevaluated.acceptance_threshold = acceptance_threshold
+                reevaluated.evaluate_candidates_batch(candidates_file)
+
+                row = sweep.sweep([qualification_threshold], [acceptance_threshold]).iloc[0]
+                assert row.frr == reevaluated.calculate_frr()
+                assert row.accuracy == reevaluated.get_evaluation_statistics()["accuracy"]
+
+        assert sweep.total == 6
+        assert evaluator.frr_calculator.results == []
@@ -0,0 +1,76 @@
+"""Unit tests for streaming candidate sources."""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from evaluation.candidate_stream import iter_candidate_chunks, iter_candidates
+
+
+@pytest.fixture
+def candidates():
+    return pd.DataFrame({
+        "id": range(7),
+        "skills": ["Python, SQL", "Java", None, "Go", "Rust", "C#", "Python"],
+        "predicted_position": ["Python Developer"] * 7
+    })
+
+
+class TestCandidateChunks:
+    """Test reading candidates files in bounded chunks."""
+
+    def test_csv_chunks_are_indexed_by_file_row(self, candidates, tmp_path):
+        """Test: CSV files are read in chunks that together equal the file."""
+        # Arrange
+        path = tmp_path / "candidates.csv"
+        candidates.to_csv(path, index=False)
+
+        # Act
+        chunks = list(iter_candidate_chunks(str(path), chunk_size=3))
+
+        # Assert
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_csv(path))
+
+    def test_parquet_chunks_stay_within_row_groups(self, candidates, tmp_path):
+        """Test: Parquet files are read batch by batch without crossing row groups."""
+        # Arrange
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "candidates.parquet"
+        candidates.to_parquet(path, row_group_size=4)
+
+        # Act
+        chunks = list(iter_candidate_chunks(str(path), chunk_size=3))
+
+        # Assert
+        assert [len(chunk) for chunk in chunks] == [3, 1, 3]
+        combined = pd.concat(chunks)
+        assert list(combined.index) == list(range(7))
+        pd.testing.assert_frame_equal(combined, pd.read_parquet(path))
+
+    def test_parquet_without_pyarrow(self, candidates, tmp_path, monkeypatch):
+        """Test: Reading Parquet without pyarrow explains how to install it."""
+        # Arrange
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        # Act & Assert
+        with pytest.raises(ImportError, match="parquet"):
+            list(iter_candidate_chunks(str(tmp_path / "candidates.parquet")))
+
+    def test_iter_candidates_yields_rows(self, candidates, tmp_path):
+        """Test: Rows are yielded as dictionaries."""
+        # Arrange
+        path = tmp_path / "candidates.csv"
+        candidates.to_csv(path, index=False)
+
+        # Act
+        rows = list(iter_candidates(str(path), chunk_size=2))
+
+        # Assert
+        assert len(rows) == 7
+        assert rows[0]["skills"] == "Python, SQL"
+        assert pd.isna(rows[2]["skills"])
@@ -0,0 +1,40 @@
+"""Unit tests for content-addressed cache helpers."""
+from unittest.mock import patch
+
+from services.content_cache import TTLCache, content_hash
+
+
+class TestContentCache:
+    """Test content hashing and the in-memory TTL cache."""
+
+    def test_content_hash_ignores_whitespace_layout(self):
+        """Test: Reformatted copies of the same text should share a hash."""
+        assert content_hash("Python  developer\n") == content_hash("Python developer")
+        assert content_hash("Python developer") != content_hash("Java developer")
+
+    def test_entries_expire_after_ttl(self):
+        """Test: Expired entries should be treated as misses."""
+        cache = TTLCache(max_size=10, ttl=60)
+
+        with patch("services.content_cache.time.monotonic", return_value=1000.0):
+            cache.set("job", {"skills": ["python"]})
+            assert cache.get("job") == {"skills": ["python"]}
+
+        with patch("services.content_cache.time.monotonic", return_value=1061.0):
+            assert cache.get("job") is None
+            assert len(cache) == 0
+
+    def test_least_recently_used_entries_evicted(self):
+        """Test: Cache should stay within max_size by evicting LRU entries."""
+        cache = TTLCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+        cache.delete("a")
+        assert cache.get("a") is None
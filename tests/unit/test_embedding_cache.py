@@ -0,0 +1,120 @@
+"""Unit tests for the read-through embedding cache."""
+import pytest
+import numpy as np
+from unittest.mock import Mock, AsyncMock
+
+from services.embedding_cache import (
+    EmbeddingCache,
+    EmbeddingCacheBackend,
+    MemoryEmbeddingBackend,
+    RedisEmbeddingBackend,
+    pack_embedding,
+    unpack_embedding,
+    validate_embedding_dtype
+)
+
+
+class TestEmbeddingCodec:
+    """Test binary embedding encoding."""
+
+    def test_pack_sizes(self):
+        """Test: 1536-dim vectors should pack to 6 KB as float32 and 3 KB as float16."""
+        # Arrange
+        embedding = np.random.rand(1536).tolist()
+
+        # Act & Assert
+        assert len(pack_embedding(embedding, "float32")) == 6144
+        assert len(pack_embedding(embedding, "float16")) == 3072
+
+    def test_round_trip(self):
+        """Test: Unpacked vectors should match the originals within dtype precision."""
+        # Arrange
+        embedding = np.random.rand(1536).tolist()
+
+        # Act
+        float32 = unpack_embedding(pack_embedding(embedding, "float32"), "float32")
+        float16 = unpack_embedding(pack_embedding(embedding, "float16"), "float16")
+
+        # Assert
+        assert np.allclose(float32, embedding, atol=1e-6)
+        assert np.allclose(float16, embedding, atol=1e-3)
+
+    def test_invalid_dtype_rejected(self):
+        """Test: Unsupported storage dtypes should raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            validate_embedding_dtype("int8")
+
+
+class TestEmbeddingCache:
+    """Test tiered read-through lookups."""
+
+    @pytest.fixture
+    def redis_service(self):
+        """Mock Redis service with an empty embedding cache."""
+        service = Mock()
+        service.get_cached_embeddings = AsyncMock(
+            side_effect=lambda keys: [None] * len(keys)
+        )
+        service.cache_embeddings = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_skips_redis(self, redis_service):
+        """Test: Entries found in memory should not reach Redis."""
+        # Arrange
+        cache = EmbeddingCache(
+            [MemoryEmbeddingBackend(), RedisEmbeddingBackend(redis_service, ttl=60)],
+            model="text-embedding-3-small"
+        )
+        await cache.set_many({"python": [0.1, 0.2]})
+        redis_service.cache_embeddings.assert_awaited_once()
+
+        # Act
+        results = await cache.get_many(["python"])
+
+        # Assert
+        assert np.allclose(results[0], [0.1, 0.2])
+        redis_service.get_cached_embeddings.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_redis_hits_backfill_memory(self, redis_service):
+        """Test: Redis hits should be written back to memory; misses return None."""
+        # Arrange
+        cache = EmbeddingCache(
+            [MemoryEmbeddingBackend(), RedisEmbeddingBackend(redis_service, ttl=60)],
+            model="text-embedding-3-small"
+        )
+        redis_service.get_cached_embeddings = AsyncMock(return_value=[[0.3, 0.4], None])
+
+        # Act
+        first = await cache.get_many(["docker", "kubernetes"])
+        second = await cache.get_many(["docker"])
+
+        # Assert
+        assert np.allclose(first[0], [0.3, 0.4])
+        assert first[1] is None
+        assert np.allclose(second[0], [0.3, 0.4])
+        redis_service.get_cached_embeddings.assert_awaited_once_with(
+            [cache.key("docker"), cache.key("kubernetes")]
+        )
+
+    def test_keys_depend_on_model(self):
+        """Test: The same text embedded by different models should not collide."""
+        # Arrange
+        small = EmbeddingCache([], model="text-embedding-3-small")
+        large = EmbeddingCache([], model="text-embedding-3-large")
+
+        # Assert
+        assert small.key("python") != large.key("python")
+        assert small.key("python  developer") == small.key("python developer")
+
+    def test_backends_must_implement_interface(self):
+        """Test: A backend missing an interface method should not be instantiable."""
+        # Arrange
+        class ReadOnlyBackend(EmbeddingCacheBackend):
+            async def get_many(self, keys):
+                return [None] * len(keys)
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            ReadOnlyBackend()
@@ -0,0 +1,229 @@
+"""Unit tests for the evaluation queue worker."""
+import asyncio
+import pytest
+from functools import partial
+from unittest.mock import Mock, AsyncMock
+from sqlmodel import Session, create_engine
+
+from agents.unified_agent import UnifiedRecruitmentAgent
+from models.database import Job, Resume, create_all_tables
+from services.resume_cache import ResumeCache
+from workers.evaluation_worker import ApplicationRecord, DatabaseApplicationLoader, EvaluationWorker
+
+
+class TestEvaluationWorker:
+    """Test draining the queue through the agent."""
+    
+    @pytest.fixture
+    def agent(self):
+        """Mock agent with a mock Redis service holding two queued items."""
+        agent = Mock()
+        agent.pipeline_version = Mock(return_value="v1")
+        agent.application_workflow_id = partial(UnifiedRecruitmentAgent.application_workflow_id, agent)
+        agent.redis_service = Mock()
+        agent.redis_service.evaluation_queue.requeue_expired = AsyncMock(return_value=(0, 0))
+        agent.redis_service.claim_evaluations = AsyncMock(
+            side_effect=[[("1", "10"), ("1", "11")], []]
+        )
+        agent.redis_service.evaluation_queue.visibility_timeout = 300
+        agent.redis_service.extend_evaluation = AsyncMock()
+        agent.redis_service.ack_evaluation = AsyncMock()
+        agent.redis_service.fail_evaluation = AsyncMock(return_value=True)
+        agent.redis_service.increment_metric = AsyncMock()
+        return agent
+    
+    @pytest.fixture
+    def loader(self):
+        """Loader returning a record per resume id."""
+        async def load(job_id, resume_id):
+            return ApplicationRecord("Python Developer", f"Resume {resume_id}", f"cand_{resume_id}")
+        return load
+    
+    @pytest.mark.asyncio
+    async def test_drain_acks_completed_and_releases_failed(self, agent, loader):
+        """Test: Completed items should be acked; failed ones released with their error."""
+        # Arrange
+        async def process(**kwargs):
+            if kwargs["candidate_id"] == "cand_11":
+                raise RuntimeError("LLM unavailable")
+        agent.process_job_application = AsyncMock(side_effect=process)
+        worker = EvaluationWorker(agent, loader, batch_size=4)
+        
+        # Act
+        stats = await worker.run(drain=True)
+        
+        # Assert
+        assert (stats.claimed, stats.completed, stats.failed) == (2, 1, 1)
+        agent.redis_service.claim_evaluations.assert_awaited_with(4)
+        agent.redis_service.ack_evaluation.assert_awaited_once_with("1", "10")
+        agent.redis_service.fail_evaluation.assert_awaited_once_with(
+            "1", "11", "LLM unavailable"
+        )
+        agent.redis_service.evaluation_queue.requeue_expired.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_failing_result_callback_does_not_stop_worker(self, agent, loader):
+        """Test: A raising result callback should not keep the worker from draining the queue."""
+        # Arrange
+        agent.redis_service.claim_evaluations = AsyncMock(
+            side_effect=[[("1", "10")], [("1", "11")], []]
+        )
+        agent.process_job_application = AsyncMock()
+        on_result = Mock(side_effect=RuntimeError("results store down"))
+        worker = EvaluationWorker(agent, loader, on_result=on_result)
+        
+        # Act
+        stats = await worker.run(drain=True)
+        
+        # Assert
+        assert (stats.claimed, stats.completed, stats.failed) == (2, 2, 0)
+        assert agent.redis_service.claim_evaluations.await_count == 3
+        assert agent.redis_service.ack_evaluation.await_count == 2
+        assert on_result.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_queue_errors_do_not_stop_worker(self, agent, loader):
+        """Test: Failing acks and releases should be logged and the queue drained."""
+        # Arrange
+        async def process(**kwargs):
+            if kwargs["candidate_id"] == "cand_11":
+                raise RuntimeError("LLM unavailable")
+        agent.process_job_application = AsyncMock(side_effect=process)
+        agent.redis_service.ack_evaluation = AsyncMock(side_effect=ConnectionError("Redis down"))
+        agent.redis_service.fail_evaluation = AsyncMock(side_effect=ConnectionError("Redis down"))
+        worker = EvaluationWorker(agent, loader)
+        
+        # Act
+        stats = await worker.run(drain=True)
+        
+        # Assert - unacknowledged items are left to be redelivered
+        assert (stats.claimed, stats.completed, stats.failed) == (2, 0, 1)
+        assert agent.redis_service.claim_evaluations.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_redelivered_items_reuse_workflow_id(self, agent, loader):
+        """Test: The same application should always map to the same workflow id."""
+        # Arrange
+        agent.redis_service.claim_evaluations = AsyncMock(
+            side_effect=[[("1", "10")], [("1", "10")], []]
+        )
+        agent.process_job_application = AsyncMock()
+        worker = EvaluationWorker(agent, loader)
+        
+        # Act
+        await worker.run(drain=True)
+        
+        # Assert
+        first, second = agent.process_job_application.await_args_list
+        assert first.kwargs["workflow_id"] == second.kwargs["workflow_id"]
+    
+    @pytest.mark.asyncio
+    async def test_leases_are_renewed_until_evaluation_ends(self, agent, loader):
+        """Test: Slow evaluations should keep their lease instead of being redelivered."""
+        # Arrange
+        agent.redis_service.claim_evaluations = AsyncMock(side_effect=[[("1", "10")], []])
+        
+        async def slow_process(**kwargs):
+            await asyncio.sleep(0.05)
+        agent.process_job_application = AsyncMock(side_effect=slow_process)
+        worker = EvaluationWorker(agent, loader, lease_renewal_interval=0.01)
+        
+        # Act
+        await worker.run(drain=True)
+        renewals = agent.redis_service.extend_evaluation.await_count
+        await asyncio.sleep(0.03)
+        
+        # Assert - renewed while running, never after the ack
+        assert renewals >= 2
+        agent.redis_service.extend_evaluation.assert_awaited_with("1", "10")
+        assert agent.redis_service.extend_evaluation.await_count == renewals
+        agent.redis_service.ack_evaluation.assert_awaited_once_with("1", "10")
+    
+    @pytest.mark.asyncio
+    async def test_stored_parse_seeds_resume_cache(self, agent):
+        """Test: A current stored parse should be cached and not stored again."""
+        # Arrange
+        agent.redis_service.claim_evaluations = AsyncMock(side_effect=[[("1", "10")], []])
+        agent.resume_cache = ResumeCache(agent.redis_service, {})
+        parsed = {"skills": ["python"]}
+        stored = agent.resume_cache.stamp("Resume 10", parsed)
+        
+        async def load(job_id, resume_id):
+            return ApplicationRecord("Python Developer", "Resume 10", "cand_10", stored)
+        agent.process_job_application = AsyncMock()
+        store = AsyncMock()
+        worker = EvaluationWorker(agent, load, store_parsed_resume=store)
+        
+        # Act
+        await worker.run(drain=True)
+        
+        # Assert
+        assert await agent.resume_cache.get_parsed("Resume 10") == parsed
+        store.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_fresh_parse_is_stored(self, agent, loader):
+        """Test: Records without a current parse should store the agent's parse."""
+        # Arrange
+        agent.redis_service.claim_evaluations = AsyncMock(side_effect=[[("1", "10")], []])
+        agent.redis_service.cache_parsed_resume = AsyncMock()
+        agent.resume_cache = ResumeCache(agent.redis_service, {})
+        parsed = {"skills": ["python"]}
+        
+        async def process(**kwargs):
+            await agent.resume_cache.set_parsed(kwargs["resume_text"], parsed)
+        agent.process_job_application = AsyncMock(side_effect=process)
+        store = AsyncMock()
+        worker = EvaluationWorker(agent, loader, store_parsed_resume=store)
+        
+        # Act
+        await worker.run(drain=True)
+        
+        # Assert
+        store.assert_awaited_once_with("10", agent.resume_cache.stamp("Resume 10", parsed))
+
+
+class TestDatabaseApplicationLoader:
+    """Test loading applications and parsed resumes from the database."""
+    
+    @pytest.fixture
+    def loader(self, tmp_path):
+        """Loader over a database with one job and two copies of a resume."""
+        database_url = f"sqlite:///{tmp_path / 'recruitment.db'}"
+        engine = create_engine(database_url)
+        create_all_tables(engine)
+        with Session(engine) as session:
+            session.add(Job(id=1, title="Python Developer", description="Python Developer"))
+            session.add(Resume(id=10, candidate_id="cand_10", content="Python, SQL"))
+            session.add(Resume(id=11, candidate_id="cand_11", content="Python, SQL"))
+            session.commit()
+        return DatabaseApplicationLoader(database_url)
+    
+    @pytest.mark.asyncio
+    async def test_stored_parse_is_loaded(self, loader):
+        """Test: A stored parse should be loaded with its resume."""
+        # Arrange
+        stored = ResumeCache(Mock(), {}).stamp("Python, SQL", {"skills": ["python"]})
+        
+        # Act
+        await loader.store_parsed_resume("10", stored)
+        record = await loader("1", "10")
+        
+        # Assert
+        assert record.parsed_data == stored
+        assert record.candidate_id == "cand_10"
+    
+    @pytest.mark.asyncio
+    async def test_parse_is_shared_by_identical_resumes(self, loader):
+        """Test: A resume without a parse should reuse one stored for the same content."""
+        # Arrange
+        stored = ResumeCache(Mock(), {}).stamp("Python, SQL", {"skills": ["python"]})
+        
+        # Act
+        before = await loader("1", "11")
+        await loader.store_parsed_resume("10", stored)
+        after = await loader("1", "11")
+        
+        # Assert
+        assert not before.parsed_data
+        assert after.parsed_data == stored
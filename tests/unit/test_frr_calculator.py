@@ -165,6 +165,82 @@ class TestFRRCalculator:
         stats_after_reset = calculator.get_qualification_stats()
         assert stats_after_reset["total_candidates"] == 0
     
+    def test_add_evaluation_results_in_bulk(self):
+        """Test bulk results equal adding them one at a time."""
+        from evaluation.frr_calculator import FRRCalculator
+        
+        single = FRRCalculator()
+        single.add_evaluation_result("test_1", True, "reject")
+        single.add_evaluation_result("test_2", False, "accept")
+        
+        bulk = FRRCalculator()
+        bulk.add_evaluation_results(["test_1", "test_2"], [True, False], ["reject", "accept"])
+        
+        assert bulk.results == single.results
+        with pytest.raises(ValueError):
+            bulk.add_evaluation_results(["test_3"], [True], ["maybe"])
+        assert len(bulk.results) == 2
+    
+    def test_merge_shard_calculators(self):
+        """Test merged statistics do not depend on merge order."""
+        from evaluation.frr_calculator import FRRCalculator
+        
+        shard_a = FRRCalculator()
+        shard_a.add_evaluation_results(["a1", "a2"], [True, True], ["reject", "accept"])
+        shard_b = FRRCalculator()
+        shard_b.add_evaluation_results(["b1"], [False], ["accept"])
+        
+        forward, backward = FRRCalculator(), FRRCalculator()
+        forward.merge(shard_a)
+        forward.merge(shard_b)
+        backward.merge(shard_b)
+        backward.merge(shard_a)
+        
+        assert forward.get_qualification_stats() == backward.get_qualification_stats()
+        assert forward.calculate_frr() == backward.calculate_frr() == 0.5
+        assert [r.candidate_id for r in forward.results] == ["a1", "a2", "b1"]
+    
+    def test_statistics_without_kept_results(self):
+        """Test statistics come from counts when results are not retained."""
+        from evaluation.frr_calculator import FRRCalculator
+        
+        kept = FRRCalculator()
+        counted = FRRCalculator(keep_results=False)
+        for calculator in (kept, counted):
+            calculator.add_evaluation_results(
+                ["1", "2", "3", "4"], [True, True, False, False], ["reject", "accept", "accept", "reject"]
+            )
+        
+        assert counted.results == []
+        assert counted.get_qualification_stats() == kept.get_qualification_stats()
+        assert counted.get_frr_confidence_interval() == kept.get_frr_confidence_interval()
+        
+        counted.reset_results()
+        assert counted.get_qualification_stats()["total_candidates"] == 0
+    
+    def test_counted_bulk_results_from_columns(self):
+        """Test counting frame columns without retained results matches kept results."""
+        import pandas as pd
+        from evaluation.frr_calculator import FRRCalculator
+        
+        frame = pd.DataFrame({
+            "candidate_id": ["1", "2", "3", "4", "5"],
+            "is_qualified": [True, True, False, False, True],
+            "system_decision": ["reject", "accept", "accept", "reject", "reject"]
+        })
+        kept = FRRCalculator()
+        counted = FRRCalculator(keep_results=False)
+        for calculator in (kept, counted):
+            calculator.add_evaluation_results(
+                frame["candidate_id"], frame["is_qualified"], frame["system_decision"]
+            )
+            calculator.add_evaluation_results([], [], [])
+        
+        assert counted.get_qualification_stats() == kept.get_qualification_stats()
+        with pytest.raises(ValueError):
+            counted.add_evaluation_results(["6"], [True], ["maybe"])
+        assert counted.get_qualification_stats()["total_candidates"] == 5
+    
     def test_frr_with_sample_test_data(self):
         """Test FRR calculation using sample test fixtures."""
         from evaluation.frr_calculator import FRRCalculator
@@ -0,0 +1,145 @@
+"""Unit tests for the persisted job description index."""
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from evaluation.jd_index import (
+    JobDescriptionIndex,
+    job_category_from_filename,
+    load_job_description_index
+)
+
+
+def parser():
+    """Parser mock returning the text length as requirements."""
+    return Mock(side_effect=lambda text: {"required_skills": [], "experience_years": len(text)})
+
+
+@pytest.fixture
+def job_dir(tmp_path):
+    (tmp_path / "JD_Python_Developer_job_description.md").write_text("Python, SQL")
+    (tmp_path / "Data_Science_job_description.md").write_text("Pandas")
+    return tmp_path
+
+
+class TestJobDescriptionIndex:
+    """Test parsing job descriptions once across runs."""
+
+    def test_category_from_filename(self):
+        """Test: Categories are derived from job description filenames."""
+        assert job_category_from_filename(Path("JD_Python_Developer_job_description.md")) == "Python Developer"
+        assert job_category_from_filename(Path("Data_Science_job_description.md")) == "Data Science"
+
+    def test_first_load_parses_and_persists(self, job_dir):
+        """Test: Every file is parsed and the index is written."""
+        # Arrange
+        parse = parser()
+
+        # Act
+        job_descriptions = load_job_description_index(job_dir, parse, "1")
+
+        # Assert
+        assert parse.call_count == 2
+        assert job_descriptions["Python Developer"] == {
+            "required_skills": [],
+            "experience_years": 11,
+            "raw_text": "Python, SQL",
+            "category": "Python Developer"
+        }
+        data = json.loads((job_dir / ".jd_index.json").read_text())
+        assert set(data["entries"]) == {
+            "JD_Python_Developer_job_description.md", "Data_Science_job_description.md"
+        }
+
+    def test_unchanged_files_are_not_parsed(self, job_dir):
+        """Test: A second load is served entirely from the index."""
+        # Arrange
+        first = load_job_description_index(job_dir, parser(), "1")
+        parse = parser()
+
+        # Act
+        second = load_job_description_index(job_dir, parse, "1")
+
+        # Assert
+        parse.assert_not_called()
+        assert second == first
+
+    def test_modified_file_is_reparsed(self, job_dir):
+        """Test: Only files whose content changed are parsed again."""
+        # Arrange
+        load_job_description_index(job_dir, parser(), "1")
+        (job_dir / "Data_Science_job_description.md").write_text("Pandas, NumPy")
+        parse = parser()
+
+        # Act
+        job_descriptions = load_job_description_index(job_dir, parse, "1")
+
+        # Assert
+        parse.assert_called_once_with("Pandas, NumPy")
+        assert job_descriptions["Data Science"]["experience_years"] == 13
+
+    def test_touched_file_with_same_content_is_not_parsed(self, job_dir):
+        """Test: A new mtime alone only triggers a hash check."""
+        # Arrange
+        load_job_description_index(job_dir, parser(), "1")
+        jd_file = job_dir / "Data_Science_job_description.md"
+        stat = jd_file.stat()
+        os.utime(jd_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        parse = parser()
+
+        # Act
+        load_job_description_index(job_dir, parse, "1")
+
+        # Assert
+        parse.assert_not_called()
+        data = json.loads((job_dir / ".jd_index.json").read_text())
+        assert data["entries"]["Data_Science_job_description.md"]["mtime_ns"] == stat.st_mtime_ns + 10**9
+
+    def test_parser_version_change_rebuilds_index(self, job_dir):
+        """Test: Entries from another parser version are discarded."""
+        # Arrange
+        load_job_description_index(job_dir, parser(), "1")
+        parse = parser()
+
+        # Act
+        load_job_description_index(job_dir, parse, "2")
+
+        # Assert
+        assert parse.call_count == 2
+
+    def test_removed_files_are_dropped(self, job_dir):
+        """Test: Entries of deleted files are removed from the index."""
+        # Arrange
+        load_job_description_index(job_dir, parser(), "1")
+        (job_dir / "Data_Science_job_description.md").unlink()
+
+        # Act
+        job_descriptions = load_job_description_index(job_dir, parser(), "1")
+
+        # Assert
+        assert list(job_descriptions) == ["Python Developer"]
+        data = json.loads((job_dir / ".jd_index.json").read_text())
+        assert list(data["entries"]) == ["JD_Python_Developer_job_description.md"]
+
+    def test_corrupt_index_is_ignored(self, job_dir):
+        """Test: An unreadable index is rebuilt instead of failing the load."""
+        # Arrange
+        index_path = job_dir / "index.json"
+        index_path.write_text("{not json")
+        parse = parser()
+
+        # Act
+        index = JobDescriptionIndex(index_path, "1")
+        job_descriptions = load_job_description_index(job_dir, parse, "1", index_path=index_path)
+
+        # Assert
+        assert index._entries == {}
+        assert parse.call_count == 2
+        assert len(job_descriptions) == 2
@@ -143,7 +143,43 @@ class TestKeywordExtractor:
         for input_skill, expected_normalized in test_cases:
             normalized = extractor.normalize_skill(input_skill)
             assert normalized == expected_normalized, f"Failed normalizing '{input_skill}'"
-    
+
+    def test_skill_normalization_is_memoized(self):
+        """Test repeated normalization of a skill is served from the cache."""
+        from evaluation.keyword_extractor import KeywordExtractor
+
+        extractor = KeywordExtractor()
+
+        first = extractor.normalize_skill("Senior Python Developer")
+        second = extractor.normalize_skill("Senior Python Developer")
+
+        assert first == second == "python"
+        assert extractor.normalize_skill.cache_info().hits == 1
+
+    def test_extractors_do_not_share_normalization_cache(self):
+        """Test each extractor normalizes with its own aliases."""
+        from evaluation.keyword_extractor import KeywordExtractor
+
+        custom = KeywordExtractor()
+        custom.skill_aliases["py"] = "python"
+        custom.normalize_skill("py")
+
+        assert KeywordExtractor().normalize_skill.cache_info().currsize == 0
+
+    def test_parser_version_follows_tables(self):
+        """Test the parser version changes with the keyword tables and revision."""
+        from evaluation.keyword_extractor import KeywordExtractor
+
+        default = KeywordExtractor().parser_version
+        extended = KeywordExtractor()
+        extended.known_skills.add("elixir")
+        revised = KeywordExtractor()
+        revised.PARSER_REVISION = "2"
+
+        assert KeywordExtractor().parser_version == default
+        assert extended.parser_version != default
+        assert revised.parser_version != default
+
     def test_extract_skills_with_variations(self):
         """Test extraction handles skill name variations."""
         from evaluation.keyword_extractor import KeywordExtractor
@@ -270,6 +306,19 @@ class TestSkillMatching:
         assert any("machine learning" in match.lower() for match in matches)  # ML -> Machine Learning
         assert any("sql" in match.lower() for match in matches)  # MySQL contains SQL
     
+    def test_fuzzy_match_ids_agree_with_pairwise_matching(self):
+        """Test fuzzy match indices select exactly the pairwise fuzzy matches."""
+        from evaluation.keyword_extractor import KeywordExtractor
+        
+        extractor = KeywordExtractor()
+        skills = ["javascript", "js", "sql", "mysql", "ml", "machine learning", "db", "", "go"]
+        
+        for skill in skills:
+            expected = [i for i, other in enumerate(skills) if extractor._is_fuzzy_match(skill, other)]
+            assert extractor.fuzzy_match_ids(skill, skills) == expected
+        assert extractor.fuzzy_match_ids("js", skills) == [0, 1]
+        assert extractor.fuzzy_match_ids("", skills) == []
+    
     def test_skill_gap_analysis(self):
         """Test identification of missing skills."""
         from evaluation.keyword_extractor import KeywordExtractor
@@ -286,4 +335,16 @@ class TestSkillMatching:
             assert gap in gaps, f"Missing skill gap: {gap}"
         
         assert "Python" not in gaps  # Candidate has this
-        assert "MySQL" not in gaps   # Candidate has this
\ No newline at end of file
+        assert "MySQL" not in gaps   # Candidate has this
+    def test_extractor_can_be_pickled(self):
+        """Test extractors can be sent to worker processes."""
+        import pickle
+        from evaluation.keyword_extractor import KeywordExtractor
+
+        extractor = KeywordExtractor()
+        extractor.normalize_skill("ML")
+
+        restored = pickle.loads(pickle.dumps(extractor))
+
+        assert restored.normalize_skill("ML") == "machine learning"
+        assert restored.normalize_skill.cache_info().currsize == 1
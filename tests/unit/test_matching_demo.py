@@ -24,14 +24,28 @@ async def test_matching_logic_demo(mock_config, mock_openai_client):
         mock_skill_instance.normalize_skill = Mock(side_effect=lambda x: x.lower())
         mock_skill_instance.extract_skills_from_text = Mock(return_value=["Python", "FastAPI"])
         mock_skill_instance.calculate_skill_similarity = Mock(return_value=0.85)
-        mock_skill_instance.get_related_skills = Mock(return_value=["Flask"])
+        mock_skill_instance.closest_related_skills = Mock(
+            side_effect=lambda missing, candidates: {
+                skill: ("flask", 1.0) for skill in missing if "flask" in candidates
+            }
+        )
         mock_skill.return_value = mock_skill_instance
         
         mock_redis_instance = Mock()
         mock_redis_instance.initialize = AsyncMock()
         mock_redis_instance.set_workflow_state = AsyncMock()
+        mock_redis_instance.flush_workflow_state = AsyncMock()
+        mock_redis_instance.save_stage_checkpoint = AsyncMock()
+        mock_redis_instance.get_stage_checkpoints = AsyncMock(return_value={})
+        mock_redis_instance.clear_stage_checkpoints = AsyncMock()
         mock_redis_instance.increment_metric = AsyncMock()
         mock_redis_instance.publish_hitl_request = AsyncMock()
+        mock_redis_instance.get_cached_job_requirements = AsyncMock(return_value=None)
+        mock_redis_instance.cache_job_requirements = AsyncMock()
+        mock_redis_instance.get_cached_parsed_resume = AsyncMock(return_value=None)
+        mock_redis_instance.cache_parsed_resume = AsyncMock()
+        mock_redis_instance.get_cached_embedding = AsyncMock(return_value=None)
+        mock_redis_instance.cache_embedding = AsyncMock()
         mock_redis.return_value = mock_redis_instance
         
         # Create agent
@@ -10,6 +10,7 @@ from models.database import (
     Job, Resume, Candidate, ScreeningResult,
     InterviewFeedback, AuditLog, create_all_tables
 )
+from sqlalchemy import inspect, text
 
 
 class TestDatabaseModels:
@@ -353,4 +354,31 @@ class TestDatabaseModels:
             InterviewFeedback.candidate_id == candidate.id
         )
         result = session.exec(statement).first()
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+
+class TestSchemaMigration:
+    """Test adding columns to tables created by earlier versions."""
+    
+    def test_content_hash_added_to_existing_resume_table(self):
+        """Test: create_all_tables should add resume.content_hash to an older table."""
+        # Arrange
+        engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE resume (id INTEGER PRIMARY KEY, candidate_id VARCHAR, content VARCHAR)"
+            ))
+            connection.execute(text(
+                "INSERT INTO resume (candidate_id, content) VALUES ('cand_1', 'Python developer')"
+            ))
+        
+        # Act
+        create_all_tables(engine)
+        create_all_tables(engine)
+        
+        # Assert
+        inspector = inspect(engine)
+        assert "content_hash" in {column["name"] for column in inspector.get_columns("resume")}
+        assert "ix_resume_content_hash" in {index["name"] for index in inspector.get_indexes("resume")}
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT content FROM resume")).scalar() == "Python developer"
@@ -0,0 +1,78 @@
+"""Unit tests for the multi-agent evaluator."""
+import asyncio
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from evaluation.multiagent_evaluator import MultiAgentEvaluator
+from evaluation.result_sinks import read_results
+
+
+@pytest.fixture
+def mock_evaluator(monkeypatch):
+    """Evaluator without an API key, which falls back to the mock agent."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    # Skip the simulated agent latency
+    real_sleep = asyncio.sleep
+
+    async def no_delay(delay, *args, **kwargs):
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", no_delay)
+    evaluator = MultiAgentEvaluator()
+    evaluator.job_descriptions["Python Developer"] = {
+        "category": "Python Developer",
+        "raw_text": "Python developer with SQL and AWS experience",
+        "required_skills": [],
+        "experience_years": 0,
+        "education_level": None
+    }
+    return evaluator
+
+
+class TestMockMode:
+    """Test evaluation without an LLM client."""
+
+    @pytest.mark.asyncio
+    async def test_evaluate_candidate_uses_mock_agent(self, mock_evaluator):
+        """Test: Candidates are evaluated by the mock agent when no agent is configured."""
+        # Arrange
+        candidate = {"id": 1, "skills": "Python, SQL", "experience": "3 years"}
+
+        # Act
+        evaluation = await mock_evaluator.evaluate_candidate(candidate, "Python Developer")
+
+        # Assert
+        assert mock_evaluator.unified_agent is None
+        assert evaluation.candidate_id == "1"
+        assert evaluation.agent_rationale.startswith("Mock evaluation")
+        assert evaluation.system_decision in ("accept", "reject")
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluates_every_categorized_candidate(self, mock_evaluator, tmp_path):
+        """Test: A mock-mode batch returns and saves a result per categorized candidate."""
+        # Arrange
+        candidates_file = tmp_path / "candidates.csv"
+        results_file = tmp_path / "results.jsonl"
+        pd.DataFrame({
+            "id": range(8),
+            "skills": ["Python, SQL", "Java", "AWS", "Python", "SQL", "Go", "Python, AWS", "Docker"],
+            "predicted_position": ["Python Developer"] * 7 + ["Unknown"]
+        }).to_csv(candidates_file, index=False)
+
+        # Act
+        results = await mock_evaluator.evaluate_candidates_batch(
+            str(candidates_file), str(results_file), batch_size=3
+        )
+
+        # Assert
+        assert len(results) == 7
+        assert mock_evaluator.get_evaluation_statistics()["total_candidates"] == 7
+        assert [result["candidate_id"] for result in read_results(str(results_file))] == [
+            result.candidate_id for result in results
+        ]
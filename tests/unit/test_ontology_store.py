@@ -0,0 +1,138 @@
+"""Unit tests for the versioned skill ontology store."""
+import json
+import os
+import pytest
+
+from services.ontology_store import OntologyStore, SkillOntology, get_ontology_store
+from services.skill_ontology import SkillOntologyService
+
+
+def write_ontology(path, version, aliases):
+    """Write an ontology data file and bump its mtime so changes are detected."""
+    path.write_text(json.dumps({
+        "version": version,
+        "aliases": aliases,
+        "relationships": {"Python": ["Django"]},
+        "categories": {"Framework": ["Django"]}
+    }))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+class TestSkillOntology:
+    """Test the immutable ontology."""
+    
+    def test_round_trip(self):
+        """Test: An ontology should survive conversion to and from its JSON form."""
+        # Arrange
+        ontology = SkillOntology.from_dict({
+            "version": "7",
+            "aliases": {"PY": "Python"},
+            "relationships": {"Python": ["Django"]},
+            "categories": {"Framework": ["Django"]}
+        })
+        
+        # Act
+        copy = SkillOntology.from_dict(ontology.to_dict())
+        
+        # Assert
+        assert copy == ontology
+        assert ontology.aliases == {"py": "Python"}
+        assert ontology.related_skills("django") == ("Python",)
+    
+    def test_weighted_relationships(self):
+        """Test: Weighted relationships should scale multi-hop proximity."""
+        # Arrange
+        ontology = SkillOntology.from_dict({
+            "relationships": {
+                "Python": {"Django": 0.8, "Flask": 0.5},
+                "Django": ["Celery"]
+            },
+            "graph": {"hop_decay": 0.5, "max_hops": 2}
+        })
+        
+        # Act & Assert
+        assert ontology.skill_proximity("python", "django") == pytest.approx(0.8)
+        assert ontology.skill_proximity("django", "flask") == pytest.approx(0.4)
+        assert ontology.skill_proximity("celery", "python") == pytest.approx(0.4)
+        assert ontology.closest_skills(["flask"], ["django", "celery"]) == {
+            "flask": ("django", pytest.approx(0.4))
+        }
+        assert SkillOntology.from_dict(ontology.to_dict()) == ontology
+    
+    def test_invalid_weight_rejected(self):
+        """Test: Weights outside (0, 1] should fail to load."""
+        with pytest.raises(ValueError, match="Weight"):
+            SkillOntology.from_dict({"relationships": {"Python": {"Django": 2}}})
+    
+    def test_version_defaults_to_content_hash(self):
+        """Test: Files without a version should be versioned by content."""
+        first = SkillOntology.from_dict({"aliases": {"py": "Python"}})
+        same = SkillOntology.from_dict({"aliases": {"py": "Python"}})
+        other = SkillOntology.from_dict({"aliases": {"js": "JavaScript"}})
+        
+        assert first.version == same.version
+        assert first.version != other.version
+    
+    def test_is_immutable(self):
+        """Test: Shared ontologies should reject modification."""
+        ontology = SkillOntology.from_dict({"aliases": {"py": "Python"}})
+        
+        with pytest.raises(TypeError):
+            ontology.aliases["js"] = "JavaScript"
+        with pytest.raises(AttributeError):
+            ontology.version = "2"
+
+
+class TestOntologyStore:
+    """Test loading and hot reloading."""
+    
+    def test_reloads_changed_file(self, tmp_path):
+        """Test: Services should see a new version once the file changes."""
+        # Arrange
+        path = tmp_path / "ontology.json"
+        write_ontology(path, "1", {"py": "Python"})
+        service = SkillOntologyService(OntologyStore(path, check_interval=0))
+        assert service.extract_skills_from_text("nextjs and py") == ["Python"]
+        
+        # Act
+        write_ontology(path, "2", {"py": "Python", "nextjs": "Next.js"})
+        
+        # Assert
+        assert service.ontology.version == "2"
+        assert service.extract_skills_from_text("nextjs and py") == ["Next.js", "Python"]
+    
+    def test_invalid_file_keeps_previous_version(self, tmp_path):
+        """Test: A broken update should be logged and the last good ontology kept."""
+        # Arrange
+        path = tmp_path / "ontology.json"
+        write_ontology(path, "1", {"py": "Python"})
+        store = OntologyStore(path, check_interval=0)
+        
+        # Act
+        path.write_text("{not json")
+        
+        # Assert
+        assert store.current().version == "1"
+    
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        """Test: Checks without a file change should return the same instance."""
+        path = tmp_path / "ontology.json"
+        write_ontology(path, "1", {"py": "Python"})
+        store = OntologyStore(path, check_interval=0)
+        
+        assert store.current() is store.current()
+    
+    def test_store_is_shared_per_path(self, tmp_path):
+        """Test: The process-wide store should be created once per data file."""
+        path = tmp_path / "ontology.json"
+        write_ontology(path, "1", {"py": "Python"})
+        
+        assert get_ontology_store(path) is get_ontology_store(str(path))
+    
+    def test_builtin_taxonomy(self):
+        """Test: The default store should load the bundled data file."""
+        ontology = get_ontology_store().current()
+        
+        assert ontology.normalize("k8s") == "Kubernetes"
+        assert ontology.skill_to_category["Django"] == "Framework"
@@ -0,0 +1,215 @@
+"""Unit tests for the LLM rate limiter and concurrency governor."""
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from services.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    GovernedOpenAI,
+    LLMGovernor,
+    TokenBucket,
+    estimate_tokens
+)
+
+
+class ThrottledError(Exception):
+    """Provider error carrying an HTTP 429 status."""
+    status_code = 429
+
+
+class TestTokenBucket:
+    """Test token bucket refill and waiting."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        """Test: Acquiring beyond the burst should wait for refill."""
+        # Arrange - 600/min refills 10 tokens per second, burst of 2
+        bucket = TokenBucket(600, capacity=2)
+
+        # Act
+        first = await bucket.acquire(2)
+        second = await bucket.acquire(1)
+
+        # Assert
+        assert first == 0.0
+        assert second == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_disabled_bucket_never_waits(self):
+        """Test: A zero rate should disable limiting."""
+        bucket = TokenBucket(0)
+        assert await bucket.acquire(10 ** 6) == 0.0
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD concurrency adaptation."""
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_multiplicative_decrease(self):
+        """Test: Successes should grow the limit slowly; throttles should halve it."""
+        # Arrange
+        limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=16)
+
+        # Act - one window of successes
+        for _ in range(4):
+            await limiter.acquire()
+            await limiter.release()
+
+        # Assert
+        assert 4.9 < limiter.limit < 5.0
+
+        # Act - throttle
+        before = limiter.limit
+        await limiter.acquire()
+        await limiter.release(throttled=True)
+
+        # Assert
+        assert limiter.limit == pytest.approx(before * 0.5)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_throttles_decrease_once(self):
+        """Test: Throttles of calls in flight together should halve the limit once."""
+        # Arrange
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+        windows = await asyncio.gather(*(limiter.acquire() for _ in range(8)))
+
+        # Act - a 429 storm hits every in-flight call
+        await asyncio.gather(*(limiter.release(throttled=True, window=w) for w in windows))
+
+        # Assert
+        assert limiter.limit == pytest.approx(4.0)
+        assert limiter.in_flight == 0
+
+        # Act - a call admitted after the decrease is throttled again
+        window = await limiter.acquire()
+        await limiter.release(throttled=True, window=window)
+
+        # Assert
+        assert limiter.limit == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_limit_caps_in_flight_calls(self):
+        """Test: Callers beyond the limit should queue."""
+        # Arrange
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        # Act
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        # Assert
+        assert limiter.waiting == 1
+        assert not waiter.done()
+
+        await limiter.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert limiter.in_flight == 2
+
+
+class TestLLMGovernor:
+    """Test governed calls, retries and metrics."""
+
+    @pytest.fixture
+    def governor(self):
+        """Governor without rate limits and with instant backoff."""
+        return LLMGovernor(
+            requests_per_minute=0,
+            tokens_per_minute=0,
+            initial_concurrency=4,
+            max_retries=2,
+            base_delay=0
+        )
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_calls(self, governor):
+        """Test: 429 responses should be retried, counted and shrink concurrency."""
+        # Arrange
+        func = AsyncMock(side_effect=[ThrottledError(), "ok"])
+
+        # Act
+        result = await governor.call(func, "prompt")
+
+        # Assert
+        assert result == "ok"
+        assert func.await_count == 2
+        metrics = governor.snapshot()
+        assert metrics["throttle_events"] == 1
+        assert metrics["retries"] == 1
+        assert metrics["successes"] == 1
+        assert metrics["concurrency_limit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_throttle_storm_halves_concurrency_once(self, governor):
+        """Test: 429s hitting every in-flight call should halve the limit once."""
+        # Arrange - all four calls are in flight before any is throttled
+        started = asyncio.Event()
+        in_flight = 0
+
+        async def func():
+            nonlocal in_flight
+            in_flight += 1
+            if in_flight == 4:
+                started.set()
+            await started.wait()
+            raise ThrottledError()
+
+        governor.max_retries = 0
+
+        # Act
+        results = await asyncio.gather(*(governor.call(func) for _ in range(4)), return_exceptions=True)
+
+        # Assert
+        assert all(isinstance(result, ThrottledError) for result in results)
+        metrics = governor.snapshot()
+        assert metrics["throttle_events"] == 4
+        assert metrics["concurrency_limit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors_raise(self, governor):
+        """Test: Errors other than throttles and transient failures should not be retried."""
+        # Arrange
+        func = AsyncMock(side_effect=ValueError("bad request"))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await governor.call(func)
+        assert func.await_count == 1
+        assert governor.metrics.failures == 1
+        assert governor.concurrency.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, governor):
+        """Test: Persistent throttling should surface after the retry budget."""
+        func = AsyncMock(side_effect=ThrottledError())
+
+        with pytest.raises(ThrottledError):
+            await governor.call(func)
+        assert func.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_governed_client_routes_calls(self, governor, mock_openai_client):
+        """Test: Wrapped chat and embedding calls should pass through the governor."""
+        # Arrange
+        mock_openai_client.chat = Mock()
+        mock_openai_client.chat.completions.create = AsyncMock(return_value=Mock(usage=None))
+        client = GovernedOpenAI(mock_openai_client, governor)
+
+        # Act
+        await client.chat.completions.create(
+            model="gpt-4", messages=[{"role": "user", "content": "Hello"}]
+        )
+        await client.embeddings.create(model="text-embedding-3-small", input=["python"])
+
+        # Assert
+        assert governor.metrics.requests == 2
+        mock_openai_client.embeddings.create.assert_awaited_once_with(
+            model="text-embedding-3-small", input=["python"]
+        )
+
+    def test_estimate_tokens(self):
+        """Test: Token estimates should cover strings, lists and chat messages."""
+        assert estimate_tokens("a" * 40) == 11
+        assert estimate_tokens(["a" * 40, "b" * 40]) == 22
+        assert estimate_tokens([{"role": "user", "content": "a" * 40}]) == 11
@@ -5,6 +5,8 @@ import json
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any
 import hashlib
+import numpy as np
+from redis.client import NEVER_DECODE
 
 from services.redis_service import RedisService
 
@@ -29,6 +31,7 @@ class TestRedisService:
         mock_client.zrem = AsyncMock()
         mock_client.setex = AsyncMock()
         mock_client.get = AsyncMock()
+        mock_client.delete = AsyncMock()
         mock_client.hincrby = AsyncMock(return_value=1)
         mock_client.close = AsyncMock()
         
@@ -67,7 +70,7 @@ class TestRedisService:
     
     @pytest.mark.asyncio
     async def test_set_workflow_state(self, redis_service: RedisService):
-        """Test: Should store workflow state in Redis."""
+        """Test: Should store workflow state and its stage field in one HSET."""
         # Arrange
         workflow_id = "workflow-123"
         state = {
@@ -77,18 +80,129 @@ class TestRedisService:
         }
         
         # Act
-        await redis_service.set_workflow_state(workflow_id, state)
+        await redis_service.set_workflow_state(workflow_id, state, stage="screening")
         
         # Assert
         key = f"workflow:{workflow_id}"
-        redis_service.client.hset.assert_any_call(
-            key, "state", json.dumps(state)
+        redis_service.client.hset.assert_called_once()
+        args, kwargs = redis_service.client.hset.call_args
+        assert args == (key,)
+        assert kwargs["mapping"]["state"] == json.dumps(state)
+        assert kwargs["mapping"]["stage:screening"] == json.dumps(state)
+        assert "updated_at" in kwargs["mapping"]
+    
+    @pytest.mark.asyncio
+    async def test_workflow_stage_history(self, redis_service: RedisService):
+        """Test: Later stages should not overwrite earlier stage fields."""
+        # Arrange
+        redis_service.client.hgetall = AsyncMock(return_value={
+            "state": json.dumps({"status": "screening_completed"}),
+            "updated_at": "2024-01-01T00:00:00+00:00",
+            "stage:parsed_resume": json.dumps({"status": "resume_parsed"}),
+            "stage:screening": json.dumps({"status": "screening_completed"})
+        })
+        
+        # Act
+        stages = await redis_service.get_workflow_stages("workflow-123")
+        
+        # Assert
+        assert stages == {
+            "parsed_resume": {"status": "resume_parsed"},
+            "screening": {"status": "screening_completed"}
+        }
+    
+    @pytest.mark.asyncio
+    async def test_stage_checkpoints(self, redis_service: RedisService):
+        """Test: Stage outputs should be checkpointed as separate hash fields."""
+        # Act
+        await redis_service.save_stage_checkpoint("wf_1", "screening", {"score": 0.7})
+        
+        # Assert
+        redis_service.client.hset.assert_called_once_with(
+            "workflow:wf_1", mapping={"checkpoint:screening": json.dumps({"score": 0.7})}
+        )
+        redis_service.client.expire.assert_awaited_once_with(
+            "workflow:wf_1", redis_service.checkpoint_ttl
+        )
+        
+        # Arrange
+        redis_service.client.hgetall = AsyncMock(return_value={
+            "state": json.dumps({"status": "screening_completed"}),
+            "stage:screening": json.dumps({"status": "screening_completed"}),
+            "checkpoint:screening": json.dumps({"score": 0.7})
+        })
+        
+        # Act
+        checkpoints = await redis_service.get_stage_checkpoints("wf_1")
+        
+        # Assert
+        assert checkpoints == {"screening": {"score": 0.7}}
+    
+    @pytest.mark.asyncio
+    async def test_clear_stage_checkpoints(self, redis_service: RedisService):
+        """Test: Completed workflows should drop their checkpoints and expiry."""
+        # Arrange
+        redis_service.client.hkeys = AsyncMock(return_value=[
+            "state", "stage:screening", "checkpoint:parsed_resume", "checkpoint:screening"
+        ])
+        pipe = Mock()
+        pipe.execute = AsyncMock()
+        redis_service.client.pipeline = Mock(return_value=pipe)
+        
+        # Act
+        await redis_service.clear_stage_checkpoints("wf_1")
+        
+        # Assert
+        pipe.hdel.assert_called_once_with(
+            "workflow:wf_1", "checkpoint:parsed_resume", "checkpoint:screening"
         )
-        # Check that updated_at was set
-        calls = redis_service.client.hset.call_args_list
-        assert len(calls) == 2
-        assert calls[1][0][0] == key
-        assert calls[1][0][1] == "updated_at"
+        pipe.persist.assert_called_once_with("workflow:wf_1")
+        pipe.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_write_behind_checkpoints_expire_on_flush(self, redis_service: RedisService):
+        """Test: Buffered checkpoints should set the workflow expiry when flushed."""
+        # Arrange
+        redis_service.workflow_write_behind = True
+        pipe = Mock()
+        pipe.execute = AsyncMock()
+        redis_service.client.pipeline = Mock(return_value=pipe)
+        
+        # Act
+        await redis_service.save_stage_checkpoint("wf_1", "screening", {"score": 0.7})
+        await redis_service.set_workflow_state("wf_2", {"status": "started"})
+        await redis_service.flush_workflow_state()
+        
+        # Assert
+        pipe.expire.assert_called_once_with("workflow:wf_1", redis_service.checkpoint_ttl)
+    
+    @pytest.mark.asyncio
+    async def test_write_behind_buffers_until_flush(self, redis_service: RedisService):
+        """Test: Write-behind mode should coalesce stage writes into one pipeline."""
+        # Arrange
+        redis_service.workflow_write_behind = True
+        pipe = Mock()
+        pipe.execute = AsyncMock()
+        redis_service.client.pipeline = Mock(return_value=pipe)
+        
+        # Act
+        await redis_service.set_workflow_state("wf_1", {"status": "started"}, stage="started")
+        await redis_service.set_workflow_state("wf_1", {"status": "resume_parsed"}, stage="parsed_resume")
+        buffered = await redis_service.get_workflow_state("wf_1")
+        
+        # Assert - nothing written yet, but reads see the buffer
+        redis_service.client.hset.assert_not_called()
+        assert buffered == {"status": "resume_parsed"}
+        
+        # Act
+        await redis_service.flush_workflow_state("wf_1")
+        await redis_service.flush_workflow_state("wf_1")
+        
+        # Assert - one HSET mapping holding both stages
+        pipe.hset.assert_called_once()
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert {"stage:started", "stage:parsed_resume", "state"} <= set(mapping)
+        pipe.execute.assert_awaited_once()
     
     @pytest.mark.asyncio
     async def test_get_workflow_state(self, redis_service: RedisService):
@@ -146,7 +260,13 @@ class TestRedisService:
     
     @pytest.mark.asyncio
     async def test_evaluation_queue_operations(self, redis_service: RedisService):
-        """Test: Should add and retrieve evaluations from queue."""
+        """Test: Should add evaluations and lease them atomically when claimed."""
+        # Arrange
+        claim_script = AsyncMock(return_value=["job-2:resume-2", 1])
+        redis_service.client.register_script = Mock(
+            side_effect=[claim_script, AsyncMock(), AsyncMock()]
+        )
+        
         # Test adding to queue
         await redis_service.add_to_evaluation_queue("job-1", "resume-1", priority=1)
         redis_service.client.zadd.assert_called_once_with(
@@ -154,20 +274,21 @@ class TestRedisService:
         )
         
         # Test getting from queue
-        redis_service.client.zrange = AsyncMock(return_value=["job-2:resume-2"])
         result = await redis_service.get_next_evaluation()
         
         assert result == ("job-2", "resume-2")
-        redis_service.client.zrange.assert_called_once_with("evaluation_queue", 0, 0)
-        redis_service.client.zrem.assert_called_once_with(
-            "evaluation_queue", "job-2:resume-2"
-        )
+        keys = claim_script.await_args.kwargs["keys"]
+        assert keys[:2] == ["evaluation_queue", "evaluation_queue:processing"]
+        assert claim_script.await_args.kwargs["args"][0] == 1
+        redis_service.client.zrem.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_empty_evaluation_queue(self, redis_service: RedisService):
         """Test: Should return None for empty queue."""
         # Arrange
-        redis_service.client.zrange = AsyncMock(return_value=[])
+        redis_service.client.register_script = Mock(
+            side_effect=[AsyncMock(return_value=[]), AsyncMock(), AsyncMock()]
+        )
         
         # Act
         result = await redis_service.get_next_evaluation()
@@ -177,30 +298,55 @@ class TestRedisService:
     
     @pytest.mark.asyncio
     async def test_embedding_cache_operations(self, redis_service: RedisService):
-        """Test: Should cache and retrieve embeddings."""
+        """Test: Should cache and retrieve embeddings as packed float32 bytes."""
         # Test caching
         text_hash = hashlib.sha256("test text".encode()).hexdigest()
         embedding = [0.1, 0.2, 0.3, 0.4]
+        packed = np.asarray(embedding, dtype="<f4").tobytes()
         
         await redis_service.cache_embedding(text_hash, embedding, ttl=3600)
         redis_service.client.setex.assert_called_once_with(
-            f"embedding:{text_hash}",
+            f"embedding:float32:{text_hash}",
             3600,
-            json.dumps(embedding)
+            packed
         )
         
-        # Test retrieval
-        redis_service.client.get = AsyncMock(return_value=json.dumps(embedding))
+        # Test retrieval (raw bytes, bypassing response decoding)
+        redis_service.client.execute_command = AsyncMock(return_value=packed)
         result = await redis_service.get_cached_embedding(text_hash)
         
-        assert result == embedding
-        redis_service.client.get.assert_called_once_with(f"embedding:{text_hash}")
+        assert np.allclose(result, embedding)
+        redis_service.client.execute_command.assert_called_once_with(
+            "GET", f"embedding:float32:{text_hash}", **{NEVER_DECODE: True}
+        )
+    
+    @pytest.mark.asyncio
+    async def test_embeddings_of_another_dtype_are_misses(self, redis_service: RedisService, mock_config):
+        """Test: Embeddings packed as float32 should not be read back as float16."""
+        # Arrange - both services share one store
+        store = {}
+        redis_service.client.setex = AsyncMock(
+            side_effect=lambda key, ttl, value: store.__setitem__(key, value)
+        )
+        half = RedisService({**mock_config, "embedding_cache_dtype": "float16"})
+        half.client = AsyncMock()
+        half.client.execute_command = AsyncMock(
+            side_effect=lambda command, *keys, **kwargs: [store.get(key) for key in keys]
+        )
+        await redis_service.cache_embedding("hash1", [0.1] * 8)
+        
+        # Act
+        results = await half.get_cached_embeddings(["hash1"])
+        
+        # Assert
+        assert results == [None]
+        assert list(store) == ["embedding:float32:hash1"]
     
     @pytest.mark.asyncio
     async def test_cached_embedding_not_found(self, redis_service: RedisService):
         """Test: Should return None for cache miss."""
         # Arrange
-        redis_service.client.get = AsyncMock(return_value=None)
+        redis_service.client.execute_command = AsyncMock(return_value=None)
         
         # Act
         result = await redis_service.get_cached_embedding("nonexistent")
@@ -208,6 +354,58 @@ class TestRedisService:
         # Assert
         assert result is None
     
+    @pytest.mark.asyncio
+    async def test_batch_embedding_cache_operations(self, redis_service: RedisService):
+        """Test: Should pipeline batch writes and MGET batch reads."""
+        # Arrange
+        pipe = Mock()
+        pipe.execute = AsyncMock()
+        redis_service.client.pipeline = Mock(return_value=pipe)
+        embeddings = {"hash1": [0.1, 0.2], "hash2": [0.3, 0.4]}
+        
+        # Act
+        await redis_service.cache_embeddings(embeddings, ttl=60)
+        
+        # Assert
+        redis_service.client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.setex.call_count == 2
+        pipe.setex.assert_any_call(
+            "embedding:float32:hash2", 60, np.asarray([0.3, 0.4], dtype="<f4").tobytes()
+        )
+        pipe.execute.assert_awaited_once()
+        
+        # Arrange retrieval with one miss
+        redis_service.client.execute_command = AsyncMock(return_value=[
+            np.asarray([0.1, 0.2], dtype="<f4").tobytes(), None
+        ])
+        
+        # Act
+        results = await redis_service.get_cached_embeddings(["hash1", "missing"])
+        
+        # Assert
+        redis_service.client.execute_command.assert_called_once_with(
+            "MGET", "embedding:float32:hash1", "embedding:float32:missing", **{NEVER_DECODE: True}
+        )
+        assert np.allclose(results[0], [0.1, 0.2])
+        assert results[1] is None
+    
+    @pytest.mark.asyncio
+    async def test_parsed_resume_cache_operations(self, redis_service: RedisService):
+        """Test: Should cache and retrieve parsed resumes by versioned key."""
+        # Arrange
+        resume_key = "v1:abc123"
+        parsed = {"skills": {"technical": ["python"]}, "total_experience_years": 4.0}
+        
+        # Act & Assert - caching
+        await redis_service.cache_parsed_resume(resume_key, parsed, ttl=600)
+        redis_service.client.setex.assert_called_once_with(
+            f"parsed_resume:{resume_key}", 600, json.dumps(parsed)
+        )
+        
+        # Act & Assert - retrieval
+        redis_service.client.get = AsyncMock(return_value=json.dumps(parsed))
+        assert await redis_service.get_cached_parsed_resume(resume_key) == parsed
+    
     @pytest.mark.asyncio
     async def test_metrics_operations(self, redis_service: RedisService):
         """Test: Should increment and retrieve metrics."""
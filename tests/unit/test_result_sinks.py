@@ -0,0 +1,248 @@
+"""Unit tests for incremental result sinks and the lazy results reader."""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from evaluation.result_sinks import (
+    JSONArraySink,
+    JSONLinesSink,
+    ParquetSink,
+    ResultSink,
+    SQLiteSink,
+    open_result_sink,
+    read_results
+)
+
+RESULTS = [
+    {
+        "candidate_id": "1",
+        "is_qualified": True,
+        "overall_score": 0.8,
+        "skills_matched": ["python", "sql"],
+        "rejection_reason": None
+    },
+    {
+        "candidate_id": "2",
+        "is_qualified": False,
+        "overall_score": 0.2,
+        "skills_matched": [],
+        "rejection_reason": "Missing critical skills: python"
+    }
+]
+
+
+class TestResultSinks:
+    """Test writing results to each sink and reading them back."""
+
+    @pytest.mark.parametrize("filename", ["results.jsonl", "results.parquet", "results.sqlite", "results.json"])
+    def test_round_trip(self, filename, tmp_path):
+        """Test: Results read back equal the results written, in order."""
+        # Arrange
+        path = str(tmp_path / filename)
+
+        # Act
+        with open_result_sink(path) as sink:
+            for result in RESULTS:
+                sink.write(result)
+
+        # Assert
+        assert list(read_results(path)) == RESULTS
+
+    @pytest.mark.parametrize("filename", ["results.jsonl", "results.parquet", "results.sqlite"])
+    def test_append_keeps_earlier_results(self, filename, tmp_path):
+        """Test: An appending sink adds to the results of an earlier run."""
+        # Arrange
+        path = str(tmp_path / filename)
+        with open_result_sink(path) as sink:
+            sink.write(RESULTS[0])
+
+        # Act
+        with open_result_sink(path, append=True) as sink:
+            sink.write(RESULTS[1])
+
+        # Assert
+        assert list(read_results(path)) == RESULTS
+
+    @pytest.mark.parametrize("filename", ["results.jsonl", "results.parquet", "results.sqlite"])
+    def test_new_run_replaces_results(self, filename, tmp_path):
+        """Test: A sink that does not append starts from empty results."""
+        # Arrange
+        path = str(tmp_path / filename)
+        with open_result_sink(path) as sink:
+            sink.write_all(RESULTS)
+
+        # Act
+        with open_result_sink(path) as sink:
+            sink.write(RESULTS[1])
+
+        # Assert
+        assert list(read_results(path)) == [RESULTS[1]]
+
+    def test_sink_is_chosen_by_suffix(self, tmp_path):
+        """Test: The results path suffix selects the sink."""
+        # Arrange
+        expected = {
+            "results.jsonl": JSONLinesSink,
+            "results.parquet": ParquetSink,
+            "results.db": SQLiteSink,
+            "results.json": JSONArraySink
+        }
+
+        for filename, sink_type in expected.items():
+            # Act
+            sink = open_result_sink(str(tmp_path / filename))
+            sink.close()
+
+            # Assert
+            assert type(sink) is sink_type
+
+    def test_sinks_must_implement_write_all(self):
+        """Test: A sink without write_all should not be instantiable."""
+        # Arrange
+        class NullSink(ResultSink):
+            pass
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            NullSink()
+
+    def test_parquet_sink_without_pyarrow(self, tmp_path, monkeypatch):
+        """Test: A Parquet sink fails on creation when pyarrow is missing."""
+        # Arrange
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        # Act & Assert
+        with pytest.raises(ImportError, match="parquet"):
+            open_result_sink(str(tmp_path / "results.parquet"))
+
+    def test_json_array_cannot_be_appended(self, tmp_path):
+        """Test: Appending to a JSON array results file is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            open_result_sink(str(tmp_path / "results.json"), append=True)
+
+
+class TestPartialRuns:
+    """Test results of interrupted runs stay readable."""
+
+    def test_jsonl_results_are_readable_before_close(self, tmp_path):
+        """Test: Written JSON lines are readable while the sink is open."""
+        # Arrange
+        path = str(tmp_path / "results.jsonl")
+
+        # Act
+        with open_result_sink(path) as sink:
+            sink.write(RESULTS[0])
+            partial = list(read_results(path))
+
+        # Assert
+        assert partial == [RESULTS[0]]
+
+    def test_truncated_final_line_is_skipped(self, tmp_path):
+        """Test: A JSON line cut off mid-write is ignored by the reader."""
+        # Arrange
+        path = tmp_path / "results.jsonl"
+        path.write_text(json.dumps(RESULTS[0]) + '\n' + json.dumps(RESULTS[1])[:20])
+
+        # Act
+        results = list(read_results(str(path)))
+
+        # Assert
+        assert results == [RESULTS[0]]
+
+    def test_append_after_truncated_line(self, tmp_path):
+        """Test: Appending after an interrupted run drops the cut-off line."""
+        # Arrange
+        path = tmp_path / "results.jsonl"
+        path.write_text(json.dumps(RESULTS[0]) + '\n' + json.dumps(RESULTS[1])[:20])
+
+        # Act
+        with open_result_sink(str(path), append=True) as sink:
+            sink.write(RESULTS[1])
+
+        # Assert
+        assert list(read_results(str(path))) == RESULTS
+
+    def test_append_after_truncated_only_line(self, tmp_path):
+        """Test: A file holding only a cut-off line is appended to from empty."""
+        # Arrange
+        path = tmp_path / "results.jsonl"
+        path.write_text(json.dumps(RESULTS[0])[:20])
+
+        # Act
+        with open_result_sink(str(path), append=True) as sink:
+            sink.write(RESULTS[1])
+
+        # Assert
+        assert list(read_results(str(path))) == [RESULTS[1]]
+
+    def test_sqlite_rows_are_committed_per_write(self, tmp_path):
+        """Test: SQLite results are readable while the sink is open."""
+        # Arrange
+        path = str(tmp_path / "results.sqlite")
+
+        # Act
+        with open_result_sink(path) as sink:
+            sink.write(RESULTS[0])
+            partial = list(read_results(path))
+
+        # Assert
+        assert partial == [RESULTS[0]]
+
+    def test_parquet_writes_one_part_per_row_group(self, tmp_path):
+        """Test: Full row groups are written as parts before the sink closes."""
+        # Arrange
+        path = tmp_path / "results.parquet"
+        sink = ParquetSink(str(path), row_group_size=1)
+
+        # Act
+        sink.write_all(RESULTS)
+        partial = list(read_results(str(path)))
+        sink.close()
+
+        # Assert
+        assert partial == RESULTS
+        assert len(list(path.glob("part-*.parquet"))) == 2
+
+
+class TestJSONArraySink:
+    """Test writing JSON arrays incrementally."""
+
+    @pytest.mark.parametrize("items", [
+        [],
+        [{"candidate_id": "1", "skills": ["python"], "reason": None}],
+        [{"a": 1}, {"b": {"c": [1, 2]}}, {"d": []}]
+    ])
+    def test_output_matches_json_dump(self, items, tmp_path):
+        """Test: Incremental output is identical to dumping the whole list."""
+        # Arrange
+        streamed, dumped = tmp_path / "streamed.json", tmp_path / "dumped.json"
+
+        # Act
+        with JSONArraySink(str(streamed)) as sink:
+            for item in items:
+                sink.write(item)
+        with open(dumped, 'w') as f:
+            json.dump(items, f, indent=2)
+
+        # Assert
+        assert streamed.read_text() == dumped.read_text()
+
+    def test_items_are_flushed_before_close(self, tmp_path):
+        """Test: Written items reach the file before the array is closed."""
+        # Arrange
+        path = tmp_path / "results.json"
+
+        # Act
+        with JSONArraySink(str(path)) as sink:
+            sink.write_all([{"candidate_id": "1"}])
+            partial = path.read_text()
+
+        # Assert
+        assert '"candidate_id": "1"' in partial
+        assert json.loads(path.read_text()) == [{"candidate_id": "1"}]
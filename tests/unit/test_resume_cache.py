@@ -0,0 +1,59 @@
+"""Unit tests for the parsed-resume cache."""
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from services.resume_cache import ResumeCache, RESUME_SCHEMA_VERSION
+
+
+class TestResumeCache:
+    """Test parsed resume caching."""
+
+    @pytest.fixture
+    def redis_service(self):
+        """Mock Redis service with an empty cache."""
+        service = Mock()
+        service.get_cached_parsed_resume = AsyncMock(return_value=None)
+        service.cache_parsed_resume = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_parsed_resume_round_trip(self, redis_service):
+        """Test: Parsed resumes should be served from memory after caching."""
+        # Arrange
+        cache = ResumeCache(redis_service, {})
+        parsed = {"skills": {"technical": ["python"]}}
+
+        # Act
+        await cache.set_parsed("John Doe\nPython developer", parsed)
+        result = await cache.get_parsed("John Doe Python developer")
+
+        # Assert
+        assert result == parsed
+        redis_service.cache_parsed_resume.assert_awaited_once()
+        redis_service.get_cached_parsed_resume.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_schema_version_change_invalidates_entries(self, redis_service):
+        """Test: Entries parsed under an older prompt should not be served."""
+        # Arrange
+        old_cache = ResumeCache(redis_service, {"resume_schema_version": 1})
+        new_cache = ResumeCache(redis_service, {"resume_schema_version": 2})
+
+        # Assert
+        assert old_cache.parsed_key("resume") != new_cache.parsed_key("resume")
+        assert new_cache.parsed_key("resume").startswith("v2:")
+
+    @pytest.mark.asyncio
+    async def test_database_records_seed_cache(self, redis_service):
+        """Test: Stamped Resume.parsed_data should seed the cache; stale data should not."""
+        # Arrange
+        cache = ResumeCache(redis_service, {})
+        parsed = {"skills": {"technical": ["python"]}}
+        stamped = cache.stamp("resume text", parsed)
+
+        # Act & Assert
+        assert stamped["schema_version"] == RESUME_SCHEMA_VERSION
+        assert cache.load_record("other text", stamped) is False
+        assert cache.load_record("resume text", {**stamped, "schema_version": 0}) is False
+        assert cache.load_record("resume text", stamped) is True
+        assert await cache.get_parsed("resume text") == parsed
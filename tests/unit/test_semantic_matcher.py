@@ -0,0 +1,58 @@
+"""Unit tests for embedding-based skill matching."""
+import pytest
+import numpy as np
+
+from services.semantic_matcher import (
+    SemanticSkillMatcher,
+    cosine_similarity_matrix,
+    greedy_assignment
+)
+
+
+class TestSemanticMatcher:
+    """Test vectorized similarity and assignment."""
+    
+    def test_cosine_matrix_matches_pairwise(self):
+        """Test: The matrix should equal pairwise cosine similarity, zero for zero vectors."""
+        # Arrange
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=(3, 8))
+        b = np.vstack([rng.normal(size=(2, 8)), np.zeros((1, 8))])
+        
+        # Act
+        similarity = cosine_similarity_matrix(a, b)
+        
+        # Assert
+        assert similarity.shape == (3, 3)
+        expected = a[1] @ b[0] / (np.linalg.norm(a[1]) * np.linalg.norm(b[0]))
+        assert similarity[1, 0] == pytest.approx(expected)
+        assert np.all(similarity[:, 2] == 0)
+    
+    def test_greedy_assignment_is_one_to_one(self):
+        """Test: Each row and column should be used at most once, best pairs first."""
+        # Arrange
+        similarity = np.array([
+            [0.95, 0.90],
+            [0.93, 0.40]
+        ])
+        
+        # Act
+        pairs = greedy_assignment(similarity, threshold=0.5)
+        
+        # Assert
+        assert pairs == [(0, 0, 0.95)]
+    
+    def test_match_applies_threshold(self):
+        """Test: Only sufficiently similar skills should match."""
+        # Arrange
+        matcher = SemanticSkillMatcher(threshold=0.9)
+        required = {"postgresql": [1.0, 0.0, 0.0], "kafka": [0.0, 1.0, 0.0]}
+        candidates = {"postgres": [0.99, 0.1, 0.0], "rabbitmq": [0.0, 0.6, 0.8]}
+        
+        # Act
+        matches = matcher.match(required, candidates)
+        
+        # Assert
+        assert [(req, found) for req, found, _ in matches] == [("postgresql", "postgres")]
+        assert matches[0][2] == pytest.approx(0.995, abs=1e-3)
+        assert matcher.match({}, candidates) == []
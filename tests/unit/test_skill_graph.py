@@ -0,0 +1,59 @@
+"""Unit tests for the weighted skill graph."""
+import pytest
+
+from services.skill_graph import SkillGraph
+
+
+def chain_graph(**kwargs):
+    """Graph 0 - 1 - 2 - 3 with unit weights and a weak shortcut 0 - 2."""
+    edges = {
+        0: {1: 1.0, 2: 0.1},
+        1: {0: 1.0, 2: 1.0},
+        2: {1: 1.0, 3: 1.0, 0: 0.1},
+        3: {2: 1.0}
+    }
+    return SkillGraph(4, edges, **kwargs)
+
+
+class TestSkillGraph:
+    """Test multi-hop proximity and matrix lookups."""
+    
+    def test_proximity_decays_per_hop(self):
+        """Test: Each hop after the first should multiply proximity by the decay."""
+        # Arrange
+        graph = chain_graph(hop_decay=0.5, max_hops=3)
+        
+        # Act & Assert
+        assert graph.proximity(0, 0) == 1.0
+        assert graph.proximity(0, 1) == 1.0
+        assert graph.proximity(0, 2) == pytest.approx(0.5)  # Two hops beat the weak shortcut
+        assert graph.proximity(0, 3) == pytest.approx(0.25)
+    
+    def test_max_hops_bounds_reach(self):
+        """Test: Skills beyond max_hops should have zero proximity."""
+        graph = chain_graph(hop_decay=0.5, max_hops=2)
+        
+        assert graph.proximity(1, 3) == pytest.approx(0.5)
+        assert graph.proximity(0, 3) == pytest.approx(0.05)  # Only via the weak shortcut
+        assert chain_graph(max_hops=1).proximity(0, 3) == 0.0
+    
+    def test_rows_are_cached(self):
+        """Test: Proximity rows should be computed once per source."""
+        graph = chain_graph()
+        
+        assert graph.row(0) is graph.row(0)
+        assert graph.row.cache_info().hits == 1
+    
+    def test_best_matches(self):
+        """Test: Each source should get its closest target, never itself."""
+        # Arrange
+        graph = chain_graph(hop_decay=0.5, max_hops=3)
+        
+        # Act
+        matches = graph.best_matches([0, 3, 1], [3, 1, 2])
+        
+        # Assert
+        assert matches[0] == (1, 1.0)
+        assert matches[1] == (2, 1.0)
+        assert matches[2][1] == 1.0 and matches[2][0] in (1, 2)
+        assert graph.best_matches([0], []) == [(-1, 0.0)]
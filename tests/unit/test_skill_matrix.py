@@ -0,0 +1,103 @@
+"""Unit tests for columnar skill matching."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from evaluation.keyword_extractor import KeywordExtractor
+from evaluation.skill_matrix import RequiredSkillMatcher, SkillIncidence, map_unique
+
+
+class TestMapUnique:
+    """Test mapping distinct column values."""
+
+    def test_function_runs_once_per_distinct_value(self):
+        """Test: Repeated values reuse one result and missing values get the default."""
+        # Arrange
+        calls = []
+
+        def length(value):
+            calls.append(value)
+            return len(value)
+
+        # Act
+        mapped, codes = map_unique(pd.Series(["ab", None, "ab", "c"]), length, -1)
+
+        # Assert
+        assert list(mapped) == [2, -1, 2, 1]
+        assert list(codes) == [0, -1, 0, 1]
+        assert calls == ["ab", "c"]
+
+
+class TestSkillIncidence:
+    """Test building the candidate x skill matrix."""
+
+    def test_rows_hold_distinct_skill_ids(self):
+        """Test: Each row stores its distinct tokens, empty for missing text."""
+        # Arrange
+        texts = pd.Series(["a b a", None, "b c", "a b a"])
+
+        # Act
+        incidence = SkillIncidence.from_texts(texts, str.split)
+
+        # Assert
+        assert incidence.rows == 4
+        rows = [
+            sorted(incidence.vocabulary[i] for i in incidence.indices[start:end])
+            for start, end in zip(incidence.indptr[:-1], incidence.indptr[1:])
+        ]
+        assert rows == [["a", "b"], [], ["b", "c"], ["a", "b"]]
+        assert list(incidence.row_ids()) == [0, 0, 2, 2, 3, 3]
+
+
+class TestRequiredSkillMatcher:
+    """Test scoring candidates against required skills."""
+
+    def setup_method(self):
+        self.extractor = KeywordExtractor()
+        self.matcher = RequiredSkillMatcher(
+            [["Python", "MySQL", "Docker"], ["JavaScript", "SQL"], []],
+            self.extractor.normalize_skill
+        )
+
+    def test_scores_match_keyword_extractor(self):
+        """Test: Scores equal the fraction of exactly matched required skills."""
+        # Arrange
+        texts = pd.Series(["Python, MySQL, React", "JS, PostgreSQL", "Python", None])
+        jobs = np.array([0, 1, 2, 0])
+        incidence = SkillIncidence.from_texts(
+            texts, lambda text: self.extractor.tokenize_skills(text)
+        )
+
+        # Act
+        scores = self.matcher.skill_scores(incidence, jobs)
+
+        # Assert
+        expected = [
+            len(self.extractor.find_skill_matches(["Python", "MySQL", "Docker"], "Python, MySQL, React")) / 3,
+            len(self.extractor.find_skill_matches(["JavaScript", "SQL"], "JS, PostgreSQL")) / 2,
+            0.0,
+            0.0
+        ]
+        assert list(scores) == expected
+
+    def test_skill_lists_match_keyword_extractor(self):
+        """Test: Matched skills are exact matches and missing skills lack even a fuzzy match."""
+        # Arrange
+        texts = pd.Series(["JS, PostgreSQL", "JS, PostgreSQL"])
+        incidence = SkillIncidence.from_texts(texts, self.extractor.tokenize_skills)
+
+        # Act
+        matched, missing = self.matcher.skill_lists(
+            incidence, np.array([1, 1]), self.extractor.fuzzy_match_ids
+        )
+
+        # Assert
+        required = ["JavaScript", "SQL"]
+        assert matched == [self.extractor.find_skill_matches(required, "JS, PostgreSQL")] * 2
+        assert missing == [self.extractor.find_skill_gaps(required, "JS, PostgreSQL")] * 2
+        assert missing[0] is not missing[1]
@@ -60,6 +60,26 @@ class TestSkillOntologyService:
         }
         assert set(skills) == expected_skills
     
+    def test_extract_overlapping_and_nested_skills(self, skill_service: SkillOntologyService):
+        """Test: Terms sharing a prefix or nested in longer ones should all be found."""
+        # Act
+        skills = skill_service.extract_skills_from_text(
+            "Spring Boot services on Google Cloud Platform, Ruby on Rails, node.js"
+        )
+        
+        # Assert
+        assert {"Spring", "Spring Boot", "Google Cloud", "Ruby", "Ruby on Rails",
+                "Node.js", "JavaScript"} <= set(skills)
+        assert "Springboot" not in skills
+    
+    def test_extract_respects_word_boundaries(self, skill_service: SkillOntologyService):
+        """Test: Aliases inside longer words should not match."""
+        # Act
+        skills = skill_service.extract_skills_from_text("Typescripting rusty rubyists in Reactor")
+        
+        # Assert
+        assert skills == []
+    
     def test_get_related_skills(self, skill_service: SkillOntologyService):
         """Test: Should return related skills from ontology."""
         # Test Python ecosystem
@@ -82,6 +102,27 @@ class TestSkillOntologyService:
         assert "Docker Compose" in docker_related
         assert "Container Orchestration" in docker_related
     
+    def test_related_skills_are_bidirectional(self, skill_service: SkillOntologyService):
+        """Test: Listed skills should link back to their parent and siblings."""
+        # Act
+        redux_related = skill_service.get_related_skills("redux")
+        
+        # Assert
+        assert "React" in redux_related
+        assert "Next.js" in redux_related
+        assert "Redux" not in redux_related
+        assert skill_service.get_related_skills("unknownskill") == []
+    
+    def test_related_skill_ids(self, skill_service: SkillOntologyService):
+        """Test: Id lookups should agree with the named related skills."""
+        # Act
+        related_ids = skill_service.related_skill_ids("postgres")
+        candidate_ids = skill_service.skill_ids(["mysql", "database design", "unknownskill"])
+        
+        # Assert
+        assert len(related_ids) == len(skill_service.get_related_skills("PostgreSQL"))
+        assert related_ids & candidate_ids == skill_service.skill_ids(["MySQL", "Database Design"])
+    
     def test_get_skill_category(self, skill_service: SkillOntologyService):
         """Test: Should categorize skills correctly."""
         # Programming languages
@@ -129,6 +170,18 @@ class TestSkillOntologyService:
         assert 0 <= similarity_2 <= 1
         assert 0 <= similarity_3 <= 1
     
+    def test_multi_hop_similarity(self, skill_service: SkillOntologyService):
+        """Test: Two-hop relationships should earn less credit than direct ones."""
+        # Act
+        direct = skill_service.calculate_skill_similarity(["Redux"], ["React"])
+        two_hops = skill_service.calculate_skill_similarity(["Redux"], ["Node.js"])
+        unrelated = skill_service.calculate_skill_similarity(["Redux"], ["Oracle"])
+        
+        # Assert
+        assert direct == pytest.approx(0.5)
+        assert 0 < two_hops < direct
+        assert unrelated == 0.0
+    
     def test_identify_transferable_skills(self, skill_service: SkillOntologyService):
         """Test: Should identify transferable skills between domains."""
         # Arrange
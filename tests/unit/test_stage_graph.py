@@ -0,0 +1,203 @@
+"""Unit tests for the pipeline stage graph."""
+import asyncio
+import pytest
+
+from agents.stage_graph import (
+    PipelineStage,
+    StageGraph,
+    STAGE_STARTED,
+    STAGE_FINISHED,
+    STAGE_FAILED
+)
+
+
+class TestStageGraph:
+    """Test dependency-ordered concurrent stage execution."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        """Test: Stages without dependencies between them should overlap."""
+        # Arrange
+        running = set()
+        overlaps = []
+
+        def make_stage(name):
+            async def stage():
+                running.add(name)
+                await asyncio.sleep(0.01)
+                overlaps.append(set(running))
+                running.discard(name)
+                return name
+            return stage
+
+        graph = StageGraph([
+            PipelineStage("a", make_stage("a")),
+            PipelineStage("b", make_stage("b")),
+            PipelineStage("c", make_stage("c")),
+        ])
+
+        # Act
+        results = await graph.run()
+
+        # Assert
+        assert results == {"a": "a", "b": "b", "c": "c"}
+        assert overlaps[0] == {"a", "b", "c"}
+
+    @pytest.mark.asyncio
+    async def test_dependencies_receive_upstream_results(self):
+        """Test: A stage should run after its dependencies and get their results."""
+        # Arrange
+        async def source():
+            return 2
+
+        async def other():
+            return 3
+
+        async def combine(source, other):
+            return source * other
+
+        graph = StageGraph([
+            PipelineStage("combine", combine, depends_on=("source", "other")),
+            PipelineStage("source", source),
+            PipelineStage("other", other),
+        ])
+
+        # Act
+        results = await graph.run()
+
+        # Assert
+        assert graph.order.index("combine") > graph.order.index("source")
+        assert results["combine"] == 6
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending_stages(self):
+        """Test: A failing stage should cancel downstream stages and re-raise."""
+        # Arrange
+        downstream = []
+
+        async def fails():
+            raise RuntimeError("LLM unavailable")
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def after(fails):
+            downstream.append(fails)
+
+        graph = StageGraph([
+            PipelineStage("fails", fails),
+            PipelineStage("slow", slow),
+            PipelineStage("after", after, depends_on=("fails",)),
+        ])
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="LLM unavailable"):
+            await asyncio.wait_for(graph.run(), timeout=1)
+        assert downstream == []
+
+    @pytest.mark.asyncio
+    async def test_stage_events_emitted(self):
+        """Test: Each stage should report start and finish with its result and duration."""
+        # Arrange
+        events = []
+
+        async def source():
+            return 2
+
+        async def double(source):
+            return source * 2
+
+        graph = StageGraph([
+            PipelineStage("source", source),
+            PipelineStage("double", double, depends_on=("source",)),
+        ])
+
+        # Act
+        await graph.run(on_event=events.append)
+
+        # Assert
+        assert [(e.stage, e.status) for e in events] == [
+            ("source", STAGE_STARTED),
+            ("source", STAGE_FINISHED),
+            ("double", STAGE_STARTED),
+            ("double", STAGE_FINISHED),
+        ]
+        assert events[-1].result == 4
+        assert events[-1].duration >= 0
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_event_and_broken_callback(self):
+        """Test: Failures should be reported; a raising callback should not break the run."""
+        # Arrange
+        events = []
+
+        async def callback(event):
+            events.append(event)
+            raise RuntimeError("UI disconnected")
+
+        async def fails():
+            raise ValueError("bad JSON")
+
+        async def works():
+            return "ok"
+
+        # Act
+        results = await StageGraph([PipelineStage("works", works)]).run(on_event=callback)
+        with pytest.raises(ValueError):
+            await StageGraph([PipelineStage("fails", fails)]).run(on_event=callback)
+
+        # Assert
+        assert results == {"works": "ok"}
+        assert events[-1].status == STAGE_FAILED
+        assert events[-1].error == "bad JSON"
+
+    @pytest.mark.asyncio
+    async def test_completed_stages_are_restored(self):
+        """Test: Completed stages and stages only they need should not run."""
+        # Arrange
+        ran = []
+
+        def make_stage(name):
+            async def stage(**inputs):
+                ran.append(name)
+                return name
+            return stage
+
+        events = []
+        graph = StageGraph([
+            PipelineStage("parse", make_stage("parse")),
+            PipelineStage("embed", make_stage("embed")),
+            PipelineStage("requirements", make_stage("requirements")),
+            PipelineStage("screen", make_stage("screen"), depends_on=("parse", "embed")),
+            PipelineStage("critic", make_stage("critic"), depends_on=("screen", "requirements")),
+        ])
+
+        # Act
+        results = await graph.run(
+            on_event=events.append,
+            completed={"parse": "cached parse", "screen": "cached screen"}
+        )
+
+        # Assert - embed was only needed by the restored screen stage
+        assert sorted(ran) == ["critic", "requirements"]
+        assert results["screen"] == "cached screen"
+        assert "embed" not in results
+        restored = [e.stage for e in events if e.restored]
+        assert sorted(restored) == ["parse", "screen"]
+
+    def test_invalid_graphs_rejected(self):
+        """Test: Unknown dependencies and cycles should be rejected."""
+        async def noop(**kwargs):
+            return None
+
+        with pytest.raises(ValueError, match="unknown"):
+            StageGraph([PipelineStage("a", noop, depends_on=("missing",))])
+
+        with pytest.raises(ValueError, match="cycle"):
+            StageGraph([
+                PipelineStage("a", noop, depends_on=("b",)),
+                PipelineStage("b", noop, depends_on=("a",)),
+            ])
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            StageGraph([PipelineStage("a", noop), PipelineStage("a", noop)])
@@ -0,0 +1,103 @@
+"""Unit tests for threshold sweeps over overall scores."""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from evaluation.frr_calculator import FRRCalculator
+from evaluation.result_sinks import open_result_sink
+from evaluation.threshold_sweep import ThresholdSweep
+
+SCORES = [0.1, 0.3, 0.3, 0.45, 0.5, 0.62, 0.8, 0.95]
+
+
+def evaluate_directly(scores, qualification_threshold, acceptance_threshold) -> FRRCalculator:
+    """Decide every score the way the evaluators do."""
+    calculator = FRRCalculator()
+    for index, score in enumerate(scores):
+        calculator.add_evaluation_result(
+            candidate_id=str(index),
+            is_qualified=score >= qualification_threshold,
+            system_decision="accept" if score >= acceptance_threshold else "reject"
+        )
+    return calculator
+
+
+class TestThresholdSweep:
+    """Test statistics of threshold grids."""
+
+    def test_grid_matches_direct_evaluation(self):
+        """Test: Every threshold pair gives the counts of deciding each score."""
+        # Arrange
+        sweep = ThresholdSweep(SCORES)
+        # Includes thresholds equal to scores, where ties must count as reaching it
+        thresholds = [0.0, 0.3, 0.31, 0.5, 0.8, 1.0]
+
+        # Act
+        grid = sweep.sweep(thresholds, thresholds)
+
+        # Assert
+        assert len(grid) == len(thresholds) ** 2
+        for row in grid.itertuples():
+            stats = evaluate_directly(SCORES, row.qualification_threshold, row.acceptance_threshold)
+            counts = stats.get_qualification_stats()
+            assert row.qualified == counts["qualified_candidates"]
+            assert row.false_rejections == counts["false_rejections"]
+            assert row.false_acceptances == counts["false_acceptances"]
+            assert row.frr == pytest.approx(stats.calculate_frr())
+            assert row.accuracy == pytest.approx(counts["correct_decisions"] / len(SCORES))
+
+    def test_rates_without_qualified_or_unqualified_candidates(self):
+        """Test: Rates are zero when there is nobody to reject or accept."""
+        # Arrange
+        sweep = ThresholdSweep(SCORES)
+
+        # Act
+        grid = sweep.sweep([0.0, 2.0], [0.5])
+
+        # Assert
+        everyone_qualified, nobody_qualified = grid.iloc[0], grid.iloc[1]
+        assert everyone_qualified.far == 0.0
+        assert nobody_qualified.frr == 0.0
+
+    def test_empty_scores(self):
+        """Test: A sweep without candidates reports zero rates."""
+        # Act
+        grid = ThresholdSweep([]).sweep([0.5], [0.5])
+
+        # Assert
+        assert grid.iloc[0][["qualified", "frr", "far", "accuracy"]].tolist() == [0, 0.0, 0.0, 0.0]
+
+    def test_curve_spans_accept_all_to_reject_all(self):
+        """Test: The default curve runs from no rejections to rejecting everyone."""
+        # Arrange
+        sweep = ThresholdSweep(SCORES)
+
+        # Act
+        curve = sweep.curve(0.4)
+
+        # Assert
+        assert len(curve) == len(set(SCORES)) + 1
+        assert curve["frr"].iloc[0] == 0.0 and curve["far"].iloc[0] == 1.0
+        assert curve["frr"].iloc[-1] == 1.0 and curve["far"].iloc[-1] == 0.0
+        assert np.all(np.diff(curve["frr"]) >= 0)
+        assert np.all(np.diff(curve["far"]) <= 0)
+        assert (curve["tpr"] == 1.0 - curve["frr"]).all()
+
+    def test_from_results_file(self, tmp_path):
+        """Test: A sweep can be built from saved results without re-evaluating."""
+        # Arrange
+        path = str(tmp_path / "results.jsonl")
+        with open_result_sink(path) as sink:
+            sink.write_all({"candidate_id": str(index), "overall_score": score} for index, score in enumerate(SCORES))
+
+        # Act
+        sweep = ThresholdSweep.from_results(path)
+
+        # Assert
+        assert sweep.total == len(SCORES)
+        assert sweep.scores.tolist() == sorted(SCORES)
@@ -0,0 +1,58 @@
+"""Unit tests for Critic triage."""
+import pytest
+
+from agents.triage import CriticTriagePolicy, CLEAR_ACCEPT, CLEAR_REJECT
+
+
+class TestCriticTriagePolicy:
+    """Test clear-cut classification of screening results."""
+
+    @pytest.fixture
+    def policy(self):
+        """Policy with default thresholds."""
+        return CriticTriagePolicy()
+
+    def test_strong_direct_match_is_clear_accept(self, policy):
+        """Test: High score, full coverage and enough experience should bypass the Critic."""
+        screening_result = {
+            "score": 0.95,
+            "skill_coverage": 1.0,
+            "experience_match": True,
+            "matched_skills": [{"required": "python", "found": "python", "confidence": 1.0}]
+        }
+        assert policy.decide(screening_result) == CLEAR_ACCEPT
+
+    def test_no_match_is_clear_reject(self, policy):
+        """Test: Low score with nothing matched should bypass the Critic."""
+        screening_result = {
+            "score": 0.05,
+            "skill_coverage": 0.0,
+            "experience_match": False,
+            "matched_skills": []
+        }
+        assert policy.decide(screening_result) == CLEAR_REJECT
+
+    def test_borderline_and_ontology_cases_go_to_critic(self, policy):
+        """Test: Borderline scores and ontology-inferred matches should still be reviewed."""
+        # Borderline score
+        assert policy.decide({
+            "score": 0.6, "skill_coverage": 0.5, "experience_match": True, "matched_skills": []
+        }) is None
+
+        # High score, but a match came from a related skill
+        assert policy.decide({
+            "score": 0.9,
+            "skill_coverage": 1.0,
+            "experience_match": True,
+            "matched_skills": [{"required": "fastapi", "found": "flask", "confidence": 0.7}]
+        }) is None
+
+        # High skills score, but experience below the minimum
+        assert policy.decide({
+            "score": 0.9, "skill_coverage": 1.0, "experience_match": False, "matched_skills": []
+        }) is None
+
+    def test_disabled_policy_never_bypasses(self):
+        """Test: Triage can be turned off through config."""
+        policy = CriticTriagePolicy.from_config({"critic_triage_enabled": False})
+        assert policy.decide({"score": 0.0, "skill_coverage": 0.0, "matched_skills": []}) is None
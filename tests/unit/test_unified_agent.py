@@ -1,4 +1,5 @@
 """Unit tests for unified recruitment agent."""
+import asyncio
 import pytest
 import pytest_asyncio
 import json
@@ -37,6 +38,9 @@ class TestUnifiedRecruitmentAgent:
             mock_vector_instance = Mock()
             mock_vector_instance.initialize = AsyncMock()
             mock_vector_instance.create_embedding = AsyncMock(return_value=[0.1] * 1536)
+            mock_vector_instance.create_embeddings = AsyncMock(
+                side_effect=lambda texts: [[0.1] * 1536 for _ in texts]
+            )
             mock_vector_instance.search_similar_resumes = AsyncMock(return_value=[])
             mock_vector.return_value = mock_vector_instance
             
@@ -44,14 +48,25 @@ class TestUnifiedRecruitmentAgent:
             mock_skill_instance.normalize_skill = Mock(side_effect=lambda x: x.lower())
             mock_skill_instance.extract_skills_from_text = Mock(return_value=["Python", "FastAPI"])
             mock_skill_instance.calculate_skill_similarity = Mock(return_value=0.75)
-            mock_skill_instance.get_related_skills = Mock(return_value=[])
+            mock_skill_instance.closest_related_skills = Mock(return_value={})
             mock_skill.return_value = mock_skill_instance
             
             mock_redis_instance = Mock()
             mock_redis_instance.initialize = AsyncMock()
             mock_redis_instance.set_workflow_state = AsyncMock()
+            mock_redis_instance.flush_workflow_state = AsyncMock()
+            mock_redis_instance.save_stage_checkpoint = AsyncMock()
+            mock_redis_instance.get_stage_checkpoints = AsyncMock(return_value={})
+            mock_redis_instance.clear_stage_checkpoints = AsyncMock()
             mock_redis_instance.increment_metric = AsyncMock()
             mock_redis_instance.publish_hitl_request = AsyncMock()
+            mock_redis_instance.get_cached_job_requirements = AsyncMock(return_value=None)
+            mock_redis_instance.cache_job_requirements = AsyncMock()
+            mock_redis_instance.get_cached_parsed_resume = AsyncMock(return_value=None)
+            mock_redis_instance.cache_parsed_resume = AsyncMock()
+            mock_redis_instance.get_cached_embedding = AsyncMock(return_value=None)
+            mock_redis_instance.cache_embedding = AsyncMock()
+            mock_redis_instance.invalidate_job_requirements = AsyncMock()
             mock_redis.return_value = mock_redis_instance
             
             agent = UnifiedRecruitmentAgent(mock_config, mock_openai_client)
@@ -108,12 +123,12 @@ class TestUnifiedRecruitmentAgent:
         })))]
         
         agent.llm.chat.completions.create = AsyncMock(return_value=mock_response)
-        agent.vector_store.create_embedding = AsyncMock(return_value=[0.1] * 1536)
         
         # Act
         result = await agent._decompose_job_requirements(job_description, "workflow_123")
         
         # Assert
+        agent.vector_store.create_embeddings.assert_awaited_once_with(["python", "fastapi"])
         assert result["technical_skills"] == ["python", "fastapi"]  # Normalized
         assert result["experience_years"]["minimum"] == 5
         assert result["experience_years"]["preferred"] == 7
@@ -178,6 +193,27 @@ class TestUnifiedRecruitmentAgent:
         assert len(result["experience"]) == 2
         assert result["education"][0]["degree"] == "Bachelor's"
     
+    @pytest.mark.asyncio
+    async def test_resume_parsed_once_across_jobs(self, agent: UnifiedRecruitmentAgent):
+        """Test: A resume screened against several jobs should be parsed once."""
+        # Arrange
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content=json.dumps({
+            "skills": {"technical": ["Python"], "soft": []},
+            "experience": [{"duration": "2 years"}]
+        })))]
+        agent.llm.chat.completions.create = AsyncMock(return_value=mock_response)
+        resume_text = "Jane Doe - Python developer"
+        
+        # Act
+        first = await agent._parse_resume(resume_text, "wf_1")
+        second = await agent._parse_resume(resume_text, "wf_2")
+        
+        # Assert
+        assert first == second
+        assert agent.llm.chat.completions.create.await_count == 1
+        agent.redis_service.cache_parsed_resume.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_semantic_screening(self, agent: UnifiedRecruitmentAgent):
         """Test: Should perform semantic matching between job and resume."""
@@ -214,6 +250,58 @@ class TestUnifiedRecruitmentAgent:
         assert result["missing_skills"] == ["docker"]
         assert result["experience_match"] == True
     
+    @pytest.mark.asyncio
+    async def test_semantic_screening_matches_by_embedding(self, agent: UnifiedRecruitmentAgent):
+        """Test: Skills missed by the ontology should match on embedding similarity."""
+        # Arrange
+        job_requirements = {
+            "technical_skills": ["python", "postgresql"],
+            "experience_years": {"minimum": 0},
+            "skill_embeddings": {"python": [0.0, 1.0], "postgresql": [1.0, 0.0]}
+        }
+        parsed_resume = {
+            "skills": {"technical": ["python", "postgres", "excel"]},
+            "total_experience_years": 2.0
+        }
+        agent.vector_store.create_embeddings = AsyncMock(return_value=[[0.0, 1.0], [0.98, 0.2]])
+        agent.skill_service.calculate_skill_similarity = Mock(return_value=0.5)
+        
+        # Act
+        result = await agent._semantic_screening(job_requirements, parsed_resume, "workflow_123")
+        
+        # Assert
+        agent.vector_store.create_embeddings.assert_awaited_once_with(["excel", "postgres"])
+        semantic = [m for m in result["matched_skills"] if m["required"] == "postgresql"]
+        assert semantic[0]["found"] == "postgres"
+        assert 0.6 < semantic[0]["confidence"] < 0.7
+        assert result["missing_skills"] == []
+        # Skill score 0.5 plus the embedding match's confidence over two skills
+        skill_score = 0.5 + semantic[0]["confidence"] / 2
+        assert result["score"] == pytest.approx(skill_score * 0.7 + 0.3)
+    
+    @pytest.mark.asyncio
+    async def test_semantic_screening_skips_embeddings_when_all_matched(self, agent: UnifiedRecruitmentAgent):
+        """Test: Candidate skills should not be embedded when no required skill is missing."""
+        # Arrange
+        job_requirements = {
+            "technical_skills": ["python"],
+            "experience_years": {"minimum": 0},
+            "skill_embeddings": {"python": [0.0, 1.0]}
+        }
+        parsed_resume = {
+            "skills": {"technical": ["python", "excel"]},
+            "total_experience_years": 2.0
+        }
+        agent.vector_store.create_embeddings = AsyncMock()
+        agent.skill_service.calculate_skill_similarity = Mock(return_value=1.0)
+        
+        # Act
+        result = await agent._semantic_screening(job_requirements, parsed_resume, "workflow_123")
+        
+        # Assert
+        agent.vector_store.create_embeddings.assert_not_awaited()
+        assert result["score"] == pytest.approx(1.0)
+    
     @pytest.mark.asyncio
     async def test_critical_review(self, agent: UnifiedRecruitmentAgent):
         """Test: Should perform critical review with bias detection."""
@@ -256,6 +344,35 @@ class TestUnifiedRecruitmentAgent:
         assert result["hidden_gem"] == True
         assert len(result["transferable_skills"]) > 0
     
+    @pytest.mark.asyncio
+    async def test_critical_review_bypassed_for_clear_match(self, agent: UnifiedRecruitmentAgent):
+        """Test: A clear-cut screening result should skip the Critic LLM call."""
+        # Arrange
+        screening_result = {
+            "score": 0.95,
+            "skill_coverage": 1.0,
+            "experience_match": True,
+            "matched_skills": [
+                {"required": "python", "found": "python", "confidence": 1.0}
+            ],
+            "missing_skills": []
+        }
+        
+        # Act
+        result = await agent._critical_review(screening_result, {}, {}, "workflow_123")
+        confidence_metrics = agent._calculate_confidence(screening_result, result)
+        
+        # Assert
+        agent.llm.chat.completions.create.assert_not_awaited()
+        assert result["critic_bypassed"]
+        assert result["triage_decision"] == "clear_accept"
+        assert result["score"] == 0.95
+        assert not confidence_metrics["needs_review"]
+        agent.redis_service.set_workflow_state.assert_awaited_with("workflow_123", {
+            "status": "critic_review_bypassed",
+            "critic_result": result
+        }, stage="critic")
+    
     @pytest.mark.asyncio
     async def test_confidence_calculation(self, agent: UnifiedRecruitmentAgent):
         """Test: Should calculate confidence correctly."""
@@ -353,6 +470,238 @@ class TestUnifiedRecruitmentAgent:
         assert len(result.matched_skills) == 2
         assert len(result.missing_skills) == 0
     
+    @pytest.mark.asyncio
+    async def test_stream_job_application_events(self, agent: UnifiedRecruitmentAgent):
+        """Test: Screening results should stream before the Critic finishes."""
+        # Arrange
+        agent._init_workflow_state = AsyncMock(return_value="workflow_123")
+        agent._decompose_job_requirements = AsyncMock(return_value={
+            "technical_skills": ["python"],
+            "experience_years": {"minimum": 3}
+        })
+        agent._parse_resume = AsyncMock(return_value={
+            "skills": {"technical": ["python"]},
+            "total_experience_years": 5
+        })
+        agent._semantic_screening = AsyncMock(return_value={
+            "score": 0.7, "matched_skills": [], "missing_skills": []
+        })
+        agent._critical_review = AsyncMock(return_value={
+            "score": 0.72,
+            "bias_flags": [],
+            "hidden_gem": False,
+            "transferable_skills": [],
+            "confidence_in_assessment": 0.9
+        })
+        agent._log_evaluation = AsyncMock()
+        agent._generate_explanation = AsyncMock(return_value="Good candidate")
+        
+        # Act
+        events = [
+            event async for event in agent.stream_job_application(
+                "Python Developer", "Jane Doe - Python", "job_123", "cand_456"
+            )
+        ]
+        
+        # Assert
+        finished = [e.stage for e in events if e.status == "finished"]
+        assert finished.index("screening") < finished.index("critic")
+        assert finished[-1] == "evaluation"
+        assert isinstance(events[-1].result, EvaluationResult)
+        assert events[-1].result.critic_score == 0.72
+    
+    @pytest.mark.asyncio
+    async def test_resume_workflow_from_checkpoints(self, agent: UnifiedRecruitmentAgent):
+        """Test: A resumed workflow should not re-run checkpointed LLM stages."""
+        # Arrange - the previous run crashed after screening
+        screening_result = {"score": 0.7, "matched_skills": [], "missing_skills": []}
+        agent.redis_service.get_stage_checkpoints = AsyncMock(return_value={
+            "parsed_resume": {"skills": {"technical": ["python"]}, "total_experience_years": 5},
+            "screening": screening_result
+        })
+        agent._decompose_job_requirements = AsyncMock(return_value={"technical_skills": ["python"]})
+        agent._parse_resume = AsyncMock()
+        agent._semantic_screening = AsyncMock()
+        agent._critical_review = AsyncMock(return_value={
+            "score": 0.72,
+            "bias_flags": [],
+            "hidden_gem": False,
+            "transferable_skills": [],
+            "confidence_in_assessment": 0.9
+        })
+        agent._generate_explanation = AsyncMock(return_value="Good candidate")
+        
+        # Act
+        result = await agent.process_job_application(
+            "Python Developer", "Jane Doe - Python", "job_123", "cand_456",
+            workflow_id="wf_crashed"
+        )
+        
+        # Assert
+        assert result.workflow_id == "wf_crashed"
+        assert result.screening_score == 0.7
+        agent._parse_resume.assert_not_awaited()
+        agent._semantic_screening.assert_not_awaited()
+        agent.vector_store.create_embedding.assert_not_awaited()
+        agent._critical_review.assert_awaited_once()
+        agent.redis_service.save_stage_checkpoint.assert_awaited_once_with(
+            "wf_crashed", "critic", agent._critical_review.return_value
+        )
+        agent.redis_service.clear_stage_checkpoints.assert_awaited_once_with("wf_crashed")
+    
+    def test_application_workflow_ids_are_deterministic(self, agent: UnifiedRecruitmentAgent):
+        """Test: Re-running a batch should map each application to the same workflow."""
+        first = agent.application_workflow_id("job_1", "cand_1", "Python Developer", "Resume")
+        again = agent.application_workflow_id("job_1", "cand_1", "Python  Developer", "Resume")
+        other = agent.application_workflow_id("job_1", "cand_1", "Python Developer", "New resume")
+        
+        assert first == again
+        assert first != other
+    
+    def test_application_workflow_ids_change_with_pipeline_version(self, agent: UnifiedRecruitmentAgent):
+        """Test: Ontology or triage changes should not resume checkpoints of the old pipeline."""
+        # Arrange
+        agent.skill_service.ontology.version = "v1"
+        first = agent.application_workflow_id("job_1", "cand_1", "Python Developer", "Resume")
+        
+        # Act
+        agent.skill_service.ontology.version = "v2"
+        new_ontology = agent.application_workflow_id("job_1", "cand_1", "Python Developer", "Resume")
+        agent.critic_triage.accept_score = 0.95
+        new_triage = agent.application_workflow_id("job_1", "cand_1", "Python Developer", "Resume")
+        
+        # Assert
+        assert len({first, new_ontology, new_triage}) == 3
+    
+    @pytest.mark.asyncio
+    async def test_job_requirements_cache(self, agent: UnifiedRecruitmentAgent):
+        """Test: Re-screening against a known job should skip the Supervisor."""
+        # Arrange
+        requirements = {"technical_skills": ["python"], "skill_embeddings": {}}
+        agent._decompose_job_requirements = AsyncMock(return_value=requirements)
+        job_desc = "Senior Python Developer"
+        
+        # Act - first call decomposes, whitespace-only changes hit the cache
+        first = await agent._get_job_requirements(job_desc, "wf_1")
+        second = await agent._get_job_requirements("  Senior   Python Developer\n", "wf_2")
+        
+        # Assert
+        assert first == second == requirements
+        agent._decompose_job_requirements.assert_awaited_once()
+        agent.redis_service.cache_job_requirements.assert_awaited_once()
+        
+        # Act - invalidation forces a fresh decomposition
+        await agent.invalidate_job_requirements(job_desc)
+        await agent._get_job_requirements(job_desc, "wf_3")
+        
+        # Assert
+        assert agent._decompose_job_requirements.await_count == 2
+        agent.redis_service.invalidate_job_requirements.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_job_requirements_loaded_from_redis(self, agent: UnifiedRecruitmentAgent):
+        """Test: Requirements cached in Redis by another process should be reused."""
+        # Arrange
+        requirements = {"technical_skills": ["java"], "skill_embeddings": {}}
+        agent.redis_service.get_cached_job_requirements = AsyncMock(return_value=requirements)
+        agent._decompose_job_requirements = AsyncMock()
+        
+        # Act
+        result = await agent._get_job_requirements("Java Developer", "wf_1")
+        
+        # Assert
+        assert result == requirements
+        agent._decompose_job_requirements.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_job_requirements_cache_is_versioned(self, agent: UnifiedRecruitmentAgent, monkeypatch):
+        """Test: Requirements cached under an older prompt or version should not be reused."""
+        # Arrange
+        import agents.unified_agent as unified_agent
+        job_desc = "Senior Python Developer"
+        agent.redis_service.get_cached_job_requirements = AsyncMock(
+            return_value={"technical_skills": ["python"], "skill_embeddings": {}}
+        )
+        first = agent.job_requirements_key(job_desc)
+        
+        # Act
+        monkeypatch.setattr(unified_agent, "JOB_REQUIREMENTS_PROMPT", "Extract requirements:\n{job_description}")
+        new_prompt = agent.job_requirements_key(job_desc)
+        monkeypatch.setattr(unified_agent, "JOB_REQUIREMENTS_VERSION", "2")
+        new_version = agent.job_requirements_key(job_desc)
+        await agent._get_job_requirements(job_desc, "wf_1")
+        
+        # Assert
+        assert len({first, new_prompt, new_version}) == 3
+        assert agent.job_requirements_key(job_desc) == new_version
+        agent.redis_service.get_cached_job_requirements.assert_awaited_with(new_version)
+    
+    @pytest.mark.asyncio
+    async def test_batch_shares_decomposition_and_bounds_concurrency(
+        self, agent: UnifiedRecruitmentAgent
+    ):
+        """Test: A batch should decompose the job once and cap in-flight applications."""
+        # Arrange
+        requirements = {"technical_skills": ["python"], "skill_embeddings": {}}
+        agent._decompose_job_requirements = AsyncMock(return_value=requirements)
+        in_flight = []
+        peak = []
+        
+        async def process(job_description, resume_text, job_id, candidate_id, **kwargs):
+            assert kwargs["job_requirements"] == requirements
+            in_flight.append(candidate_id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(candidate_id)
+            return Mock(spec=EvaluationResult)
+        
+        agent.process_job_application = AsyncMock(side_effect=process)
+        resumes = [(f"cand_{i}", f"Resume {i}") for i in range(7)]
+        
+        # Act
+        items = [
+            item async for item in agent.process_job_applications_batch(
+                "Python Developer", resumes, "job_1", max_concurrency=3
+            )
+        ]
+        
+        # Assert
+        assert sorted(item.candidate_id for item in items) == [c for c, _ in resumes]
+        assert all(item.error is None for item in items)
+        assert max(peak) == 3
+        agent._decompose_job_requirements.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_batch_collects_item_errors(self, agent: UnifiedRecruitmentAgent):
+        """Test: A failing application should be reported without failing the batch."""
+        # Arrange
+        agent._decompose_job_requirements = AsyncMock(return_value={"technical_skills": []})
+        
+        async def process(job_description, resume_text, job_id, candidate_id, **kwargs):
+            if candidate_id == "bad":
+                raise ValueError("Unparseable resume")
+            return Mock(spec=EvaluationResult)
+        
+        agent.process_job_application = AsyncMock(side_effect=process)
+        
+        async def resumes():
+            for candidate_id in ("good_1", "bad", "good_2"):
+                yield candidate_id, "Resume text"
+        
+        # Act
+        items = {
+            item.candidate_id: item
+            async for item in agent.process_job_applications_batch(
+                "Python Developer", resumes(), "job_1"
+            )
+        }
+        
+        # Assert
+        assert set(items) == {"good_1", "bad", "good_2"}
+        assert items["bad"].result is None
+        assert items["bad"].error == "Unparseable resume"
+        assert items["good_1"].result is not None
+    
     def test_experience_parsing_edge_cases(self, agent: UnifiedRecruitmentAgent):
         """Test: Should handle various experience formats."""
         assert agent._parse_duration("5 years") == 5.0
@@ -378,6 +727,9 @@ class TestAgentErrorHandling:
             mock_vector_instance = Mock()
             mock_vector_instance.initialize = AsyncMock()
             mock_vector_instance.create_embedding = AsyncMock(return_value=[0.1] * 1536)
+            mock_vector_instance.create_embeddings = AsyncMock(
+                side_effect=lambda texts: [[0.1] * 1536 for _ in texts]
+            )
             mock_vector.return_value = mock_vector_instance
             
             mock_skill_instance = Mock()
@@ -387,6 +739,10 @@ class TestAgentErrorHandling:
             mock_redis_instance = Mock()
             mock_redis_instance.initialize = AsyncMock()
             mock_redis_instance.set_workflow_state = AsyncMock()
+            mock_redis_instance.flush_workflow_state = AsyncMock()
+            mock_redis_instance.save_stage_checkpoint = AsyncMock()
+            mock_redis_instance.get_stage_checkpoints = AsyncMock(return_value={})
+            mock_redis_instance.clear_stage_checkpoints = AsyncMock()
             mock_redis.return_value = mock_redis_instance
             
             agent = UnifiedRecruitmentAgent(mock_config, mock_openai_client)
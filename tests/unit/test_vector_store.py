@@ -63,6 +63,50 @@ class TestVectorStoreService:
         assert len(embedding) == 1536  # OpenAI text-embedding-3-small dimension
         assert all(isinstance(x, float) for x in embedding)
     
+    @pytest.mark.asyncio
+    async def test_create_embeddings_batches_and_caches(self, vector_store: VectorStoreService):
+        """Test: Should embed many texts in chunked requests and reuse cached ones."""
+        # Arrange
+        vector_store.embedding_batch_size = 2
+        create = vector_store.openai_client.embeddings.create
+        create.reset_mock()
+        skills = ["python", "fastapi", "python", "docker"]
+        
+        # Act
+        embeddings = await vector_store.create_embeddings(skills)
+        
+        # Assert - duplicates embedded once, 3 unique skills in 2 chunks
+        assert len(embeddings) == 4
+        assert embeddings[0] == embeddings[2]
+        assert create.await_count == 2
+        sent = [call.kwargs["input"] for call in create.await_args_list]
+        assert sent == [["python", "fastapi"], ["docker"]]
+        
+        # Act - repeated skills come from the cache
+        create.reset_mock()
+        cached = await vector_store.create_embeddings(["docker", "python"])
+        
+        # Assert
+        create.assert_not_awaited()
+        assert np.allclose(cached, [embeddings[3], embeddings[0]])
+    
+    @pytest.mark.asyncio
+    async def test_create_embeddings_caps_chunk_tokens(self, vector_store: VectorStoreService):
+        """Test: Chunks should also be split when their estimated tokens exceed the cap."""
+        # Arrange - each resume is estimated at 102 tokens
+        vector_store.embedding_batch_tokens = 250
+        create = vector_store.openai_client.embeddings.create
+        create.reset_mock()
+        resumes = [f"resume {i} " + "x" * 395 for i in range(5)]
+        
+        # Act
+        embeddings = await vector_store.create_embeddings(resumes)
+        
+        # Assert
+        assert len(embeddings) == 5
+        sent = [call.kwargs["input"] for call in create.await_args_list]
+        assert sent == [resumes[0:2], resumes[2:4], resumes[4:5]]
+    
     @pytest.mark.asyncio
     async def test_store_resume(self, vector_store: VectorStoreService):
         """Test: Should store resume with embedding."""
@@ -88,6 +132,41 @@ class TestVectorStoreService:
         assert embedding_id is not None
         assert isinstance(embedding_id, str)
     
+    @pytest.mark.asyncio
+    async def test_create_embedding_reads_through_cache(self, vector_store: VectorStoreService):
+        """Test: Should serve a repeated text from the embedding cache."""
+        # Arrange
+        create = vector_store.openai_client.embeddings.create
+        create.reset_mock()
+        
+        # Act
+        first = await vector_store.create_embedding("Cached resume text")
+        second = await vector_store.create_embedding("Cached  resume\ntext")
+        
+        # Assert - whitespace-only differences share an entry
+        create.assert_awaited_once()
+        assert np.allclose(first, second)
+    
+    @pytest.mark.asyncio
+    async def test_shared_embedding_cache_is_used(self, mock_config, mock_openai_client):
+        """Test: Should consult an injected cache before calling the API."""
+        # Arrange
+        embedding_cache = Mock()
+        embedding_cache.get_many = AsyncMock(return_value=[[0.5] * 1536])
+        embedding_cache.set_many = AsyncMock()
+        service = VectorStoreService(
+            mock_config, mock_openai_client, embedding_cache=embedding_cache
+        )
+        mock_openai_client.embeddings.create.reset_mock()
+        
+        # Act
+        embedding = await service.create_embedding("Cached resume text")
+        
+        # Assert
+        assert embedding == [0.5] * 1536
+        mock_openai_client.embeddings.create.assert_not_awaited()
+        embedding_cache.get_many.assert_awaited_once_with(["Cached resume text"])
+    
     @pytest.mark.asyncio
     async def test_search_similar_resumes(self, vector_store: VectorStoreService):
         """Test: Should find similar resumes based on job description."""
@@ -0,0 +1,77 @@
+"""Unit tests for the reliable Redis work queue."""
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from services.work_queue import ReliableQueue
+
+
+class TestReliableQueue:
+    """Test claim, failure and redelivery handling."""
+    
+    @pytest.fixture
+    def scripts(self):
+        """Registered Lua scripts in registration order: claim, fail, requeue."""
+        return [AsyncMock(), AsyncMock(), AsyncMock()]
+    
+    @pytest.fixture
+    def queue(self, scripts):
+        """Queue over a mock Redis client."""
+        client = Mock()
+        client.register_script = Mock(side_effect=scripts)
+        client.zadd = AsyncMock()
+        return ReliableQueue(client, "jobs", visibility_timeout=60, max_attempts=2)
+    
+    @pytest.mark.asyncio
+    async def test_claim_parses_leased_items(self, queue, scripts):
+        """Test: Claims should return members with their delivery count and deadline."""
+        # Arrange
+        scripts[0].return_value = ["a", 1, "b", 3]
+        
+        # Act
+        items = await queue.claim(2)
+        
+        # Assert
+        assert [(item.member, item.attempts) for item in items] == [("a", 1), ("b", 3)]
+        assert items[0].deadline == items[1].deadline
+        kwargs = scripts[0].await_args.kwargs
+        assert kwargs["keys"] == ["jobs", "jobs:processing", "jobs:attempts", "jobs:scores"]
+        assert kwargs["args"][0] == 2
+    
+    @pytest.mark.asyncio
+    async def test_fail_outcomes(self, queue, scripts):
+        """Test: Failures should report redelivery, dead-lettering or a lost lease."""
+        # Arrange
+        scripts[1].side_effect = [1, 0, -1]
+        
+        # Act & Assert
+        assert await queue.fail("a", "timeout") is True
+        assert await queue.fail("a", "timeout") is False
+        assert await queue.fail("a", "timeout") is None
+        args = scripts[1].await_args.kwargs["args"]
+        assert args[0] == "a" and args[1] == 2 and args[3] == "timeout"
+    
+    @pytest.mark.asyncio
+    async def test_requeue_expired_counts(self, queue, scripts):
+        """Test: Expired leases should be counted as requeued or dead-lettered."""
+        # Arrange
+        scripts[2].return_value = [3, 1]
+        
+        # Act
+        requeued, dead = await queue.requeue_expired()
+        
+        # Assert
+        assert (requeued, dead) == (3, 1)
+        assert scripts[2].await_args.kwargs["args"][1] == 2
+    
+    @pytest.mark.asyncio
+    async def test_enqueue_and_extend(self, queue):
+        """Test: Priority should be negated and extensions should only touch leased members."""
+        # Act
+        await queue.enqueue("a", priority=5)
+        await queue.extend("a", 30)
+        
+        # Assert
+        assert queue.client.zadd.await_args_list[0].args == ("jobs", {"a": -5})
+        extend_call = queue.client.zadd.await_args_list[1]
+        assert extend_call.args[0] == "jobs:processing"
+        assert extend_call.kwargs == {"xx": True}
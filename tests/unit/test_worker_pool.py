@@ -0,0 +1,106 @@
+"""Unit tests for the multi-process worker pool supervisor."""
+import queue
+import pytest
+from unittest.mock import Mock
+
+from workers.pool import (
+    ERROR_MESSAGE,
+    RESULT_MESSAGE,
+    STATS_MESSAGE,
+    PoolStats,
+    WorkerPool,
+    worker_config
+)
+
+
+def worker_stats(claimed, completed, failed=0, dead_lettered=0):
+    """Stats payload as reported by a worker process."""
+    return {
+        "claimed": claimed,
+        "completed": completed,
+        "failed": failed,
+        "dead_lettered": dead_lettered,
+        "llm": {}
+    }
+
+
+class TestWorkerPool:
+    """Test configuration splitting and result aggregation."""
+    
+    def test_worker_config_splits_shared_quotas(self, mock_config):
+        """Test: Provider quotas should be divided between processes."""
+        # Arrange
+        config = {**mock_config, "llm_requests_per_minute": 500, "llm_tokens_per_minute": 0}
+        
+        # Act
+        split = worker_config(config, 4)
+        
+        # Assert
+        assert split["llm_requests_per_minute"] == 125
+        assert split["llm_tokens_per_minute"] == 0
+        assert config["llm_requests_per_minute"] == 500
+    
+    def test_process_count_defaults(self, mock_config):
+        """Test: An unset process count should fall back to the CPU count."""
+        pool = WorkerPool({**mock_config, "worker_processes": 0})
+        assert pool.processes >= 1
+        assert WorkerPool(mock_config, processes=3).processes == 3
+    
+    def test_aggregates_worker_messages(self, mock_config):
+        """Test: Results and per-worker stats should be merged; errors marked as crashes."""
+        # Arrange
+        pool = WorkerPool(mock_config, processes=3)
+        stats = PoolStats(processes=3)
+        
+        # Act
+        pool._handle((RESULT_MESSAGE, 0, {"resume_id": "10"}), stats)
+        pool._handle((STATS_MESSAGE, 0, worker_stats(4, 3, failed=1)), stats)
+        pool._handle((STATS_MESSAGE, 1, worker_stats(2, 1, failed=1, dead_lettered=1)), stats)
+        pool._handle((ERROR_MESSAGE, 2, "Redis unavailable"), stats)
+        
+        # Assert
+        assert (stats.claimed, stats.completed, stats.failed, stats.dead_lettered) == (6, 4, 2, 1)
+        assert stats.results == [{"resume_id": "10"}]
+        assert stats.crashed == [2]
+        assert pool._finished == {0, 1, 2}
+    
+    def test_silently_exited_workers_are_crashes(self, mock_config):
+        """Test: Workers that exit without reporting should be recorded as crashed."""
+        # Arrange
+        pool = WorkerPool(mock_config, processes=2)
+        pool._workers = {0: Mock(exitcode=0), 1: Mock(exitcode=-9)}
+        pool._finished = {0}
+        stats = PoolStats(processes=2)
+        
+        # Act
+        pool._collect_exited(stats)
+        
+        # Assert
+        assert stats.crashed == [1]
+        assert pool._finished == {0, 1}
+    
+    def test_shutdown_deadline_holds_while_results_stream(self, mock_config):
+        """Test: A stopped worker that keeps sending results should still be terminated."""
+        # Arrange
+        pool = WorkerPool(mock_config, processes=1, shutdown_timeout=0)
+        process = Mock(exitcode=None)
+        process.is_alive.return_value = True
+        process.terminate.side_effect = lambda: setattr(process, "exitcode", -15)
+        pool.start = Mock(side_effect=lambda drain: pool._workers.update({0: process}))
+        
+        def get(timeout):
+            if pool._messages.get.call_count > 100:
+                raise RuntimeError("Shutdown deadline never checked")
+            return (RESULT_MESSAGE, 0, {"resume_id": "10"})
+        pool._messages = Mock()
+        pool._messages.get.side_effect = get
+        pool._messages.get_nowait.side_effect = queue.Empty
+        pool.stop()
+        
+        # Act
+        stats = pool.run()
+        
+        # Assert
+        process.terminate.assert_called_once()
+        assert stats.crashed == [0]
+        assert len(stats.results) >= 1